@@ -0,0 +1,84 @@
+"""
+Micro-batching benchmark: per-session predict() vs the cross-session BatchScheduler.
+
+Simulates NUM_SESSIONS concurrent sessions each requesting WINDOWS_PER_SESSION
+predictions and reports inferences/sec plus the batch-size and queue-wait histograms.
+Batched mode runs twice: sessions in lockstep (full batches) and with random pauses
+between requests (mixed batch sizes, as under real load).
+Run from the project root: python benchmarks/bench_batching.py
+"""
+import asyncio
+import os
+import random
+import sys
+import time
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from server.modules.batch_scheduler import BatchScheduler
+from server.modules.model_loader import ModelRegistry
+from shared import metrics
+from shared.config import BUFFER_SIZE
+
+NUM_SESSIONS = 32
+WINDOWS_PER_SESSION = 100
+FEATURES = 162
+MIXED_PAUSE_MS = 5.0  # Mixed load: each session pauses up to this long between requests
+
+
+async def run_direct(model, windows) -> float:
+    async def session():
+        for window in windows:
+            model.predict(window)
+            await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(session() for _ in range(NUM_SESSIONS)))
+    return time.perf_counter() - start
+
+
+async def run_batched(model, windows, pause_ms: float = 0.0) -> float:
+    scheduler = BatchScheduler(model)
+
+    async def session():
+        for window in windows:
+            await scheduler.predict(window)
+            if pause_ms:
+                await asyncio.sleep(random.uniform(0, pause_ms) / 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(session() for _ in range(NUM_SESSIONS)))
+    return time.perf_counter() - start
+
+
+def print_histogram(name: str) -> None:
+    snap = metrics.histogram(name).snapshot()
+    print(f"  {name}: count={snap['count']} mean={snap['mean']:.2f} "
+          f"p50={snap['p50']:.2f} p95={snap['p95']:.2f} max={snap['max']:.2f}")
+
+
+def main():
+    model = ModelRegistry.get()
+    if not model.pool:
+        print("Model not available; train and export it first.")
+        return
+    print(f"Dynamic batch dimension: {model.supports_batching}")
+
+    rng = np.random.default_rng(0)
+    windows = rng.standard_normal((WINDOWS_PER_SESSION, BUFFER_SIZE, FEATURES)).astype(np.float32)
+    total = NUM_SESSIONS * WINDOWS_PER_SESSION
+
+    direct = asyncio.run(run_direct(model, windows))
+    print(f"[direct]  {total / direct:.0f} inferences/sec")
+
+    for name, pause_ms in (("batched", 0.0), ("mixed", MIXED_PAUSE_MS)):
+        metrics.reset()
+        batched = asyncio.run(run_batched(model, windows, pause_ms))
+        print(f"[{name}] {total / batched:.0f} inferences/sec")
+        print_histogram("scheduler.batch_size")
+        print_histogram("scheduler.queue_wait_ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Client batching benchmark on loopback: one message per frame vs coalesced batches.
+
+A WebSocketClient streams JSON frames to an in-process server that expands batches
+with the production iter_payloads / parse_message path and records, per frame, the
+time from creation to decoding on the server. Frames are produced at camera rate,
+and in bursts (what a stalled capture loop or a congested link looks like: several
+frames pile up in the send queue before the sender runs). Reports
+messages/sec, bytes/sec, delivered frames/sec and added latency for each mode.
+Run from the project root: python benchmarks/bench_client_batching.py
+"""
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+import numpy as np
+import websockets
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from client.ws_client import WebSocketClient
+from server.ws_server import iter_payloads
+from shared import metrics
+from shared.schemas import PROTOCOL_VERSION, parse_message
+
+HOST = "127.0.0.1"
+PORT = 8798
+NUM_FRAMES = 600
+# name: (frames per second, frames enqueued back to back)
+SCENARIOS = {"30 fps": (30, 1), "240 fps, bursts of 8": (240, 8)}
+MODES = {
+    "per-frame": dict(batching=False),
+    "batch": dict(batching=True, batch_max_delay_ms=0),
+    "batch +5ms": dict(batching=True, batch_max_delay_ms=5),
+}
+
+
+def make_frame() -> str:
+    return json.dumps({
+        "version": PROTOCOL_VERSION,
+        "timestamp": time.time(),
+        "client_id": "bench",
+        "hands": [random.uniform(0.0, 1.0) for _ in range(63)],
+        "pose": [random.uniform(0.0, 1.0) for _ in range(99)],
+    })
+
+
+async def run(fps, burst, options) -> str:
+    metrics.reset()
+    latencies_ms = []
+
+    async def handler(websocket):
+        async for message in iter_payloads(websocket):
+            data = parse_message(message)
+            latencies_ms.append((time.time() - data["timestamp"]) * 1000)
+            await asyncio.sleep(0)  # Let the loop interleave client and server work
+
+    async with websockets.serve(handler, HOST, PORT):
+        # A queue large enough for whole bursts, so every mode sends every frame
+        client = WebSocketClient(HOST, PORT, client_id="bench", send_queue_size=32, **options)
+        connection = asyncio.create_task(client.connect_and_listen())
+        while client.websocket is None:
+            await asyncio.sleep(0.01)
+
+        start = time.perf_counter()
+        for i in range(0, NUM_FRAMES, burst):
+            for _ in range(burst):
+                await client.send_data(make_frame())
+            await asyncio.sleep(max(0.0, start + (i + burst) / fps - time.perf_counter()))
+        await client.message_queue.join()
+        while len(latencies_ms) < metrics.counter("client.frames_sent").value:
+            await asyncio.sleep(0.01)
+        elapsed = time.perf_counter() - start
+        await client.websocket.close()
+        connection.cancel()
+
+    messages = metrics.counter("client.messages_sent").value
+    sent_bytes = metrics.counter("client.bytes_sent").value
+    return (f"{messages / elapsed:>8.0f} msg/s {sent_bytes / elapsed / 1024:>8.0f} KB/s "
+            f"{len(latencies_ms) / elapsed:>8.0f} frames/s ({NUM_FRAMES - len(latencies_ms):>3} dropped)  "
+            f"latency p50={np.percentile(latencies_ms, 50):.2f} ms p99={np.percentile(latencies_ms, 99):.2f} ms")
+
+
+def main():
+    for scenario, (fps, burst) in SCENARIOS.items():
+        print(f"--- {scenario} ---")
+        for mode, options in MODES.items():
+            print(f"[{mode:<10}] {asyncio.run(run(fps, burst, options))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Delta codec benchmark (wire protocol v3) against JSON (v1) and float32 frames (v2).
+
+Replays a synthetic session (hand held still with landmark jitter, then moving to
+a new pose, pose landmarks jittering throughout) at several quantization steps and
+reports bytes/frame, compression ratio, keyframe share, max / RMS reconstruction
+error and encode + decode time per frame.
+Run from the project root: python benchmarks/bench_delta_codec.py
+"""
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from shared.delta_codec import DeltaEncoder, DeltaDecoder
+from shared.schemas import PROTOCOL_VERSION, pack_landmarks
+from shared.config import DELTA_KEYFRAME_INTERVAL
+
+NUM_SEGMENTS = 40
+FRAMES_PER_SEGMENT = 30
+JITTER = 0.002
+STEPS = (0.0005, 0.001, 0.002, 0.004)
+
+
+def replay(rng):
+    """Alternating held-still and moving segments, as (hands, pose) float32 arrays."""
+    hands = rng.uniform(0.3, 0.7, size=63)
+    pose = rng.uniform(0.3, 0.7, size=99)
+    frames = []
+    for segment in range(NUM_SEGMENTS):
+        target = rng.uniform(0.3, 0.7, size=63) if segment % 2 else hands
+        start = hands
+        for t in np.linspace(0.0, 1.0, FRAMES_PER_SEGMENT):
+            hands = (1 - t) * start + t * target
+            frames.append(((hands + rng.normal(scale=JITTER, size=63)).astype(np.float32),
+                           (pose + rng.normal(scale=JITTER, size=99)).astype(np.float32)))
+    return frames
+
+
+def main():
+    frames = replay(np.random.default_rng(0))
+    json_bytes = np.mean([len(json.dumps({
+        "version": PROTOCOL_VERSION, "timestamp": time.time(), "client_id": "client",
+        "hands": h.tolist(), "pose": p.tolist(),
+    })) for h, p in frames])
+    float32_bytes = np.mean([len(pack_landmarks(h, p)) for h, p in frames])
+    print(f"{len(frames)} frames; v1 json {json_bytes:.0f} B/frame, v2 float32 {float32_bytes:.0f} B/frame\n")
+
+    print(f"{'step':>8} {'B/frame':>8} {'vs v2':>6} {'vs v1':>6} {'keyframes':>10} "
+          f"{'max err':>9} {'rms err':>9} {'us/frame':>9}")
+    for step in STEPS:
+        encoder, decoder = DeltaEncoder(step=step, keyframe_interval=DELTA_KEYFRAME_INTERVAL), DeltaDecoder()
+        squared, count = 0.0, 0
+        start = time.perf_counter()
+        for hands, pose in frames:
+            data = decoder.decode(encoder.encode(hands, pose))
+            for key, original in (("hands", hands), ("pose", pose)):
+                squared += float(np.square(data[key] - original).sum())
+                count += original.size
+        elapsed_us = (time.perf_counter() - start) * 1e6 / len(frames)
+        stats = encoder.stats()
+        size = stats["bytes_per_frame"]
+        print(f"{step:>8} {size:>8.0f} {float32_bytes / size:>5.1f}x {json_bytes / size:>5.1f}x "
+              f"{stats['keyframes'] / stats['frames']:>10.1%} {stats['max_abs_error']:>9.1e} "
+              f"{np.sqrt(squared / count):>9.1e} {elapsed_us:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Event-loop responsiveness benchmark: inline processing vs the thread executor.
+
+Starts an in-process server, floods it from NUM_CLIENTS loopback clients and
+reports frames/sec plus the event-loop lag histogram for each mode.
+Run from the project root: python benchmarks/bench_event_loop.py
+"""
+import asyncio
+import functools
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import websockets
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from server.ws_server import handle_client
+from server.modules.executor import LoopLagMonitor
+from server.modules.model_loader import ModelRegistry
+from shared import metrics
+from shared.config import EXECUTOR_MAX_WORKERS
+from shared.schemas import PROTOCOL_VERSION, MESSAGE_TYPE_STATS
+
+HOST = "127.0.0.1"
+PORT = 8799
+NUM_CLIENTS = 16
+FRAMES_PER_CLIENT = 300
+
+
+def make_frame() -> str:
+    return json.dumps({
+        "version": PROTOCOL_VERSION,
+        "timestamp": time.time(),
+        "client_id": "bench",
+        "hands": [random.uniform(0.0, 1.0) for _ in range(63)],
+        "pose": [random.uniform(0.0, 1.0) for _ in range(99)],
+    })
+
+
+async def run_client(frames) -> None:
+    async with websockets.connect(f"ws://{HOST}:{PORT}") as websocket:
+        for frame in frames:
+            await websocket.send(frame)
+        # Frames are handled in order, so the stats reply marks the end of processing
+        await websocket.send(json.dumps({"version": PROTOCOL_VERSION, "type": MESSAGE_TYPE_STATS}))
+        while True:
+            reply = json.loads(await websocket.recv())
+            if reply.get("type") == MESSAGE_TYPE_STATS:
+                return
+
+
+async def run_mode(label: str, executor) -> None:
+    metrics.reset()
+    frames = [make_frame() for _ in range(FRAMES_PER_CLIENT)]
+    monitor = asyncio.create_task(LoopLagMonitor(interval_ms=10).run())
+    async with websockets.serve(functools.partial(handle_client, executor=executor), HOST, PORT):
+        start = time.perf_counter()
+        await asyncio.gather(*(run_client(frames) for _ in range(NUM_CLIENTS)))
+        elapsed = time.perf_counter() - start
+    monitor.cancel()
+
+    lag = metrics.histogram("server.event_loop_lag_ms").snapshot()
+    print(f"[{label}] {NUM_CLIENTS * FRAMES_PER_CLIENT / elapsed:.0f} frames/sec, "
+          f"loop lag p50={lag['p50']:.2f} ms p99={lag['p99']:.2f} ms max={lag['max']:.2f} ms")
+
+
+def main():
+    ModelRegistry.get()
+    asyncio.run(run_mode("inline", None))
+    with ThreadPoolExecutor(max_workers=EXECUTOR_MAX_WORKERS) as executor:
+        asyncio.run(run_mode("thread", executor))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Per-frame feature benchmark: legacy list-based smoothing/normalization vs FeatureKernel.
+
+The legacy path is the pre-kernel implementation (np.mean over a deque of lists,
+.tolist() round-trips, deque window rebuilt with np.array at inference time).
+Also reports full GestureProcessor.process_landmarks time per frame.
+Run from the project root: python benchmarks/bench_features.py
+"""
+import os
+import sys
+import time
+from collections import deque
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from server.modules.features import FeatureKernel
+from server.modules.ring_buffer import FrameRingBuffer
+from shared.config import BUFFER_SIZE, SMOOTHING_WINDOW, NUM_FEATURES
+
+NUM_FRAMES = 20000
+
+
+class LegacyFeatures:
+    def __init__(self):
+        self.history = deque(maxlen=SMOOTHING_WINDOW)
+        self.landmark_buffer = deque(maxlen=BUFFER_SIZE)
+
+    def process(self, hands_list, pose_list):
+        self.history.append(hands_list)
+        smoothed = np.mean(self.history, axis=0).tolist()
+
+        hands = np.array(smoothed).reshape(-1, 3)
+        rel_hands = hands - hands[0]
+        max_dist = np.max(np.linalg.norm(rel_hands, axis=1))
+        if max_dist > 0:
+            rel_hands = rel_hands / max_dist
+
+        pose = np.array(pose_list).reshape(-1, 3)
+        midpoint = (pose[11] + pose[12]) / 2
+        rel_pose = pose - midpoint
+        shoulder_dist = np.linalg.norm(pose[11] - pose[12])
+        if shoulder_dist > 0:
+            rel_pose = rel_pose / shoulder_dist
+
+        self.landmark_buffer.append(np.concatenate([rel_hands.flatten(), rel_pose.flatten()]).tolist())
+
+
+class KernelFeatures:
+    def __init__(self):
+        self.kernel = FeatureKernel(SMOOTHING_WINDOW)
+        self.landmark_buffer = FrameRingBuffer(BUFFER_SIZE, NUM_FEATURES)
+
+    def process(self, hands, pose):
+        smoothed = self.kernel.smooth(hands)
+        self.landmark_buffer.append(self.kernel.normalize(smoothed, pose))
+
+
+def time_per_frame(process, frames) -> float:
+    start = time.perf_counter()
+    for hands, pose in frames:
+        process(hands, pose)
+    return (time.perf_counter() - start) * 1e6 / len(frames)
+
+
+def main():
+    rng = np.random.default_rng(0)
+    frames = [(list(rng.random(63)), list(rng.random(99))) for _ in range(NUM_FRAMES)]
+    array_frames = [(np.asarray(h), np.asarray(p)) for h, p in frames]
+
+    legacy = time_per_frame(LegacyFeatures().process, frames)
+    kernel = time_per_frame(KernelFeatures().process, frames)
+    kernel_arrays = time_per_frame(KernelFeatures().process, array_frames)
+    print(f"[legacy lists]           {legacy:.2f} us/frame")
+    print(f"[kernel, list input]     {kernel:.2f} us/frame (x{legacy / kernel:.1f})")
+    print(f"[kernel, ndarray input]  {kernel_arrays:.2f} us/frame (x{legacy / kernel_arrays:.1f})")
+
+    try:
+        from server.modules.gestures import GestureProcessor
+    except ImportError as error:
+        print(f"Skipping process_landmarks timing: {error}")
+        return
+    processor = GestureProcessor()
+    data = [{'hands': h, 'pose': p} for h, p in frames]
+    start = time.perf_counter()
+    for frame in data:
+        processor.last_action_time = 0
+        processor.process_landmarks(frame)
+    print(f"[process_landmarks]      {(time.perf_counter() - start) * 1e6 / len(data):.2f} us/frame")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Hand ROI / downscaling benchmark on a recorded video.
+
+Runs the hand graph of LandmarkExtractor over the same frames in several modes:
+full frame at camera resolution (the reference), downscaled to PROCESSING_WIDTH,
+cropped around the previous hands (HAND_ROI), and both. Reports per mode the
+per-frame hand extraction time (flip and RGB conversion excluded), how many of the
+reference detections it reproduces, and the median / mean / p99 landmark distance from
+the reference in pixels (a reference hand the mode missed counts with its distance to the
+nearest detected hand). Frames are decoded into memory first, so decoding is not timed.
+
+Needs opencv-python and mediapipe (client requirements) and a video file, e.g. one
+recorded with the client camera.
+Run from the project root: python benchmarks/bench_hand_roi.py path/to/video.mp4 [processing_width]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import cv2
+from client.capture.landmark_extractor import LandmarkExtractor
+from shared import metrics
+
+MAX_FRAMES = 600
+DEFAULT_PROCESSING_WIDTH = 320
+
+
+def read_frames(path):
+    capture = cv2.VideoCapture(path)
+    frames = []
+    while len(frames) < MAX_FRAMES:
+        ret, frame = capture.read()
+        if not ret:
+            break
+        frames.append(cv2.flip(frame, 1))
+    capture.release()
+    return frames
+
+
+def hand_points(results, width, height):
+    """(num_hands, 21, 2) pixel coordinates of the detected hands, or None."""
+    if not results.multi_hand_landmarks:
+        return None
+    return np.array([[(lm.x * width, lm.y * height) for lm in hand.landmark]
+                     for hand in results.multi_hand_landmarks])
+
+
+def run(frames, hand_roi, processing_width):
+    """Per-frame hand extraction times (ms) and detected hand points."""
+    metrics.reset()
+    extractor = LandmarkExtractor(hand_roi=hand_roi, processing_width=processing_width)
+    times = []
+    points = []
+    for frame in frames:
+        rgb = extractor.to_rgb(frame)
+        start = time.perf_counter()
+        results = extractor.process_hands(rgb)
+        times.append((time.perf_counter() - start) * 1000)
+        points.append(hand_points(results, frame.shape[1], frame.shape[0]))
+    tracked = metrics.counter("client.hand_roi_tracked").value
+    return np.array(times), points, tracked
+
+
+def landmark_errors(reference, points):
+    """Per-landmark pixel distances of each reference hand from the nearest detected hand."""
+    errors = []
+    for expected in reference:
+        distances = np.linalg.norm(points - expected, axis=2)  # (num_hands, 21)
+        errors.extend(distances[np.argmin(distances.mean(axis=1))])
+    return errors
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        return
+    frames = read_frames(sys.argv[1])
+    if not frames:
+        print(f"Could not read frames from {sys.argv[1]}")
+        return
+    processing_width = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_PROCESSING_WIDTH
+    height, width = frames[0].shape[:2]
+    print(f"{len(frames)} frames at {width}x{height}, processing width {processing_width}")
+
+    modes = [
+        ("full frame", False, None),
+        (f"downscale {processing_width}", False, processing_width),
+        ("hand ROI", True, None),
+        (f"ROI + {processing_width}", True, processing_width),
+    ]
+    reference = None
+    print(f"\n{'mode':>16} | {'mean ms':>8} | {'p50 ms':>7} | {'p99 ms':>7} | {'in ROI':>6} | "
+          f"{'detected':>8} | {'p50 px':>7} | {'err px':>7} | {'p99 px':>7}")
+    for name, hand_roi, mode_width in modes:
+        times, points, tracked = run(frames, hand_roi, mode_width)
+        if reference is None:
+            reference = points
+        detected = [i for i, p in enumerate(reference) if p is not None]
+        matched = [i for i in detected if points[i] is not None]
+        errors = [e for i in matched for e in landmark_errors(reference[i], points[i])]
+        recall = f"{len(matched) / len(detected):.1%}" if detected else "n/a"
+        median_error = f"{np.median(errors):.2f}" if errors else "n/a"
+        mean_error = f"{np.mean(errors):.2f}" if errors else "n/a"
+        p99_error = f"{np.percentile(errors, 99):.2f}" if errors else "n/a"
+        print(f"{name:>16} | {times.mean():>8.2f} | {np.percentile(times, 50):>7.2f} | "
+              f"{np.percentile(times, 99):>7.2f} | {tracked / len(frames):>6.0%} | {recall:>8} | "
+              f"{median_error:>7} | {mean_error:>7} | {p99_error:>7}")
+
+    print("\nin ROI: frames whose hands were found in the crop; detected: reference detections reproduced; "
+          "err: landmark distance from the full-frame result")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+"""
+Inference backend benchmark: TFLite interpreter vs the pure-NumPy GRU.
+
+Reports, per backend, cold startup (imports + model load + first prediction) and
+RSS measured in a fresh subprocess, then per-window latency at batch sizes 1 and
+BATCH_MAX_SIZE and output parity between the two backends.
+Note that the TFLite export uses dynamic-range quantized weights, so parity is
+close but not bit-exact.
+
+Needs gesture_model.tflite and gesture_model.npz (written by ml_pipeline/scripts/train.py).
+Run from the project root: python benchmarks/bench_numpy_backend.py
+"""
+import json
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+
+NUM_LATENCY_RUNS = 200
+NUM_PARITY_WINDOWS = 200
+
+
+def current_rss_kb() -> float:
+    with open('/proc/self/statm') as f:
+        pages = int(f.read().split()[1])
+    return pages * os.sysconf('SC_PAGE_SIZE') / 1024
+
+
+def measure_startup(backend: str) -> None:
+    """Child process: import, load and predict once, then report timings as JSON."""
+    start = time.perf_counter()
+    import numpy as np
+    from server.modules.model_loader import GestureModel
+    from shared.config import BUFFER_SIZE, NUM_FEATURES
+    import_ms = (time.perf_counter() - start) * 1000
+
+    model = GestureModel(backend=backend)
+    model.predict(np.zeros((BUFFER_SIZE, NUM_FEATURES), dtype=np.float32))
+    total_ms = (time.perf_counter() - start) * 1000
+
+    print(json.dumps({
+        "loaded": model.is_loaded,
+        "import_ms": import_ms,
+        "startup_ms": total_ms,
+        "rss_mb": current_rss_kb() / 1024,
+    }))
+
+
+def report_startup(backend: str) -> bool:
+    result = subprocess.run(
+        [sys.executable, __file__, "--startup", backend],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    lines = result.stdout.strip().splitlines()
+    try:
+        stats = json.loads(lines[-1])
+    except (IndexError, ValueError):
+        print(f"[{backend}] startup measurement failed:\n{result.stderr.strip()[-500:]}")
+        return False
+    if not stats["loaded"]:
+        print(f"[{backend}] model not available")
+        return False
+    print(f"[{backend}] imports {stats['import_ms']:.0f} ms, "
+          f"startup to first prediction {stats['startup_ms']:.0f} ms, RSS {stats['rss_mb']:.1f} MB")
+    return True
+
+
+def report_latency(model, windows) -> None:
+    from shared.config import BATCH_MAX_SIZE
+
+    for batch_size in (1, BATCH_MAX_SIZE):
+        batch = windows[:batch_size]
+        model.predict_probabilities(batch)  # warm up / allocate this shape
+        start = time.perf_counter()
+        for _ in range(NUM_LATENCY_RUNS):
+            model.predict_probabilities(batch)
+        elapsed_ms = (time.perf_counter() - start) * 1000 / NUM_LATENCY_RUNS
+        print(f"[{model.backend}] batch {batch_size:>2}: {elapsed_ms:.3f} ms/call, "
+              f"{elapsed_ms / batch_size:.3f} ms/window")
+
+
+def report_parity(reference, candidate, windows) -> None:
+    import numpy as np
+
+    expected = np.concatenate([reference.predict_probabilities(w[np.newaxis]) for w in windows])
+    actual = candidate.predict_probabilities(windows)
+    max_diff = float(np.max(np.abs(expected - actual)))
+    agree = int(np.sum(np.argmax(expected, axis=1) == np.argmax(actual, axis=1)))
+    print(f"\nParity over {len(windows)} windows: max |p_numpy - p_tflite| = {max_diff:.2e}, "
+          f"argmax agreement {agree}/{len(windows)}")
+
+
+def load_windows():
+    import numpy as np
+    from shared.config import BUFFER_SIZE, NUM_FEATURES
+
+    data_path = os.path.join(ROOT, 'ml_pipeline/data/X_train.npy')
+    if os.path.exists(data_path):
+        X = np.load(data_path).astype(np.float32)
+        return X[np.random.default_rng(0).permutation(len(X))[:NUM_PARITY_WINDOWS]]
+    print("X_train.npy not found; using random windows.")
+    return np.random.default_rng(0).normal(size=(NUM_PARITY_WINDOWS, BUFFER_SIZE, NUM_FEATURES)).astype(np.float32)
+
+
+def main():
+    print("--- Cold startup (fresh process) ---")
+    available = [backend for backend in ("tflite", "numpy") if report_startup(backend)]
+    if not available:
+        return
+
+    from server.modules.model_loader import GestureModel
+    windows = load_windows()
+    models = {backend: GestureModel(backend=backend) for backend in available}
+
+    print("\n--- Latency ---")
+    for model in models.values():
+        report_latency(model, windows)
+
+    if len(models) == 2:
+        report_parity(models["tflite"], models["numpy"], windows)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3 and sys.argv[1] == "--startup":
+        measure_startup(sys.argv[2])
+    else:
+        main()
@@ -0,0 +1,77 @@
+"""
+Parse + normalize benchmark: JSON payload -> model features, per frame.
+
+Compares the previous path (json.loads to Python lists, which the feature kernel
+then converts element by element) with the current parse_message (validated
+float32 arrays, copied into the kernel's buffers), and both with a binary v2
+frame for reference. Also times rejection of malformed and oversized messages,
+which must stay cheap.
+Run from the project root: python benchmarks/bench_parse.py
+"""
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from server.modules.features import FeatureKernel
+from shared.schemas import PROTOCOL_VERSION, MAX_MESSAGE_BYTES, pack_landmarks, parse_message
+
+NUM_FRAMES = 20000
+
+
+def legacy_parse(message: str) -> dict:
+    """parse_message before validation: version check only, lists left as they are."""
+    data = json.loads(message)
+    if data.get("version") != PROTOCOL_VERSION:
+        raise ValueError(f"Unsupported protocol version: {data.get('version')}")
+    return data
+
+
+def time_path(parse, messages) -> float:
+    kernel = FeatureKernel()
+    start = time.perf_counter()
+    for message in messages:
+        data = parse(message)
+        kernel.normalize(kernel.smooth(data["hands"]), data["pose"])
+    return (time.perf_counter() - start) * 1e6 / len(messages)
+
+
+def time_rejection(message) -> float:
+    runs = 2000
+    start = time.perf_counter()
+    for _ in range(runs):
+        try:
+            parse_message(message)
+        except ValueError:
+            pass
+    return (time.perf_counter() - start) * 1e6 / runs
+
+
+def main():
+    rng = np.random.default_rng(0)
+    frames = [(rng.random(63), rng.random(99)) for _ in range(NUM_FRAMES)]
+    messages = [json.dumps({
+        "version": PROTOCOL_VERSION, "timestamp": time.time(), "client_id": "client",
+        "hands": hands.tolist(), "pose": pose.tolist(),
+    }) for hands, pose in frames]
+    binary = [pack_landmarks(hands, pose) for hands, pose in frames]
+
+    legacy = time_path(legacy_parse, messages)
+    validated = time_path(parse_message, messages)
+    fast_binary = time_path(parse_message, binary)
+    print(f"[lists, legacy parse]     {legacy:.2f} us/frame")
+    print(f"[validated float32]       {validated:.2f} us/frame (x{legacy / validated:.2f})")
+    print(f"[binary v2 frame]         {fast_binary:.2f} us/frame (x{legacy / fast_binary:.2f})")
+
+    wrong_length = json.dumps({"version": PROTOCOL_VERSION, "hands": list(range(62))})
+    oversized = "x" * (MAX_MESSAGE_BYTES + 1)
+    print(f"[reject wrong length]     {time_rejection(wrong_length):.2f} us")
+    print(f"[reject oversized]        {time_rejection(oversized):.2f} us")
+
+
+if __name__ == "__main__":
+    main()
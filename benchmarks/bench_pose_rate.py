@@ -0,0 +1,197 @@
+"""
+Adaptive pose rate benchmark: pose graph runs saved vs pose / model accuracy on a replay set.
+
+Replays recorded landmark sequences (training_data/**/*.json from client/data_collector.py;
+a synthetic set of hand gestures over a slowly swaying body when none are present)
+through PoseScheduler for several (every N frames, motion threshold) settings and holds
+the last pose on skipped frames, exactly as LandmarkExtractor does. Reports per setting:
+- pose graph runs saved, and the resulting client CPU saving assuming the pose graph
+  is POSE_SHARE of extraction time (the two MediaPipe graphs cost about the same)
+- nose position error (the nose-proximity check) and the error of the
+  shoulder-normalized pose features the model sees
+- if a model is available (INFERENCE_BACKEND), how often the model's prediction on
+  windows built from held poses matches its prediction on the recorded poses
+and, as a yardstick, how much the recorded pose changes between consecutive frames.
+Run from the project root: python benchmarks/bench_pose_rate.py
+"""
+import json
+import math
+import os
+import sys
+
+import numpy as np
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+
+from client.capture.pose_scheduler import PoseScheduler
+from server.modules.features import FeatureKernel, HAND_FEATURES, POSE_FEATURES
+from shared.config import BUFFER_SIZE, INFERENCE_INTERVAL
+
+REPLAY_PATH = os.path.join(ROOT, 'training_data')
+POSE_SHARE = 0.5
+NOSE = 0
+# (every N frames, wrist motion threshold); N=1 is the baseline of running pose on every frame
+SETTINGS = [(1, math.inf), (3, 0.05), (5, 0.05), (10, 0.05), (5, math.inf), (30, 0.05)]
+
+NUM_SYNTHETIC_SEQUENCES = 40
+SYNTHETIC_FRAMES = 90
+
+
+def load_replay():
+    """List of sequences; each a list of (hands or None, pose or None) float arrays."""
+    sequences = []
+    for root, _, files in os.walk(REPLAY_PATH):
+        for name in sorted(files):
+            if not name.endswith('.json'):
+                continue
+            with open(os.path.join(root, name)) as f:
+                data = json.load(f)
+            frames = data.get('sequence', []) if isinstance(data, dict) else data
+            sequence = []
+            for frame in frames:
+                hands, pose = frame.get('hands'), frame.get('pose')
+                sequence.append((
+                    np.asarray(hands, dtype=np.float32) if hands and len(hands) == HAND_FEATURES else None,
+                    np.asarray(pose, dtype=np.float32) if pose and len(pose) == POSE_FEATURES else None,
+                ))
+            if sequence:
+                sequences.append(sequence)
+    return sequences
+
+
+def synthetic_replay(rng):
+    """Hands holding still and swiping in front of a body that sways slowly, with landmark jitter."""
+    body = rng.uniform(0.3, 0.7, size=(33, 3)).astype(np.float32)
+    body[NOSE] = (0.5, 0.35, -0.3)
+    body[11] = (0.62, 0.6, -0.1)
+    body[12] = (0.38, 0.6, -0.1)
+    hand_shape = rng.normal(scale=0.04, size=(21, 3)).astype(np.float32)
+    hand_shape[0] = 0
+
+    sequences = []
+    for _ in range(NUM_SYNTHETIC_SEQUENCES):
+        phase = rng.uniform(0, 2 * np.pi)
+        wrist = np.array([rng.uniform(0.3, 0.7), rng.uniform(0.4, 0.7), 0], dtype=np.float32)
+        velocity = np.zeros(3, dtype=np.float32)
+        sequence = []
+        for i in range(SYNTHETIC_FRAMES):
+            # Gesture phases: a swipe now and then, otherwise the hand is held
+            if i % 30 == 10:
+                velocity = np.array([rng.choice([-1, 1]) * 0.03, rng.uniform(-0.01, 0.01), 0], dtype=np.float32)
+            elif i % 30 == 20:
+                velocity[:] = 0
+            wrist = np.clip(wrist + velocity, 0.05, 0.95)
+            hands = (wrist + hand_shape + rng.normal(scale=0.002, size=(21, 3))).astype(np.float32)
+
+            sway = np.array([0.02 * np.sin(phase + i / 20), 0.005 * np.sin(phase + i / 13), 0], dtype=np.float32)
+            pose = (body + sway + rng.normal(scale=0.002, size=(33, 3))).astype(np.float32)
+            sequence.append((hands.reshape(-1), pose.reshape(-1)))
+        sequences.append(sequence)
+    return sequences
+
+
+def schedule(sequence, every_n, threshold):
+    """Pose as LandmarkExtractor would report it per frame, and how often the graph ran."""
+    scheduler = PoseScheduler(every_n=every_n, motion_threshold=threshold)
+    held = None
+    poses = []
+    for hands, pose in sequence:
+        scheduler.observe_hand(None if hands is None else (float(hands[0]), float(hands[1])))
+        if scheduler.should_run(held is not None):
+            held = pose
+        poses.append(held)
+    return poses, scheduler.runs, scheduler.runs + scheduler.holds
+
+
+def model_windows(sequence, poses):
+    """Model input windows every INFERENCE_INTERVAL frames, as the server builds them."""
+    kernel = FeatureKernel()
+    features = []
+    windows = []
+    for i, ((hands, _), pose) in enumerate(zip(sequence, poses)):
+        smoothed = kernel.smooth(hands) if hands is not None else None
+        features.append(kernel.normalize(smoothed, pose).copy())
+        if len(features) >= BUFFER_SIZE and i % INFERENCE_INTERVAL == 0:
+            windows.append(np.stack(features[-BUFFER_SIZE:]))
+    return windows
+
+
+def load_model():
+    from server.modules.model_loader import GestureModel
+    model = GestureModel()
+    return model if model.is_loaded else None
+
+
+def main():
+    rng = np.random.default_rng(0)
+    replay = load_replay()
+    source = REPLAY_PATH
+    if not replay:
+        replay = synthetic_replay(rng)
+        source = f"synthetic ({NUM_SYNTHETIC_SEQUENCES} x {SYNTHETIC_FRAMES} frames)"
+    print(f"Replay set: {source}, {len(replay)} sequences, {sum(len(s) for s in replay)} frames")
+
+    model = load_model()
+    reference_predictions = None
+    if model is not None:
+        reference_predictions = [
+            [model.predict(window) for window in model_windows(sequence, [pose for _, pose in sequence])]
+            for sequence in replay
+        ]
+    else:
+        print("No model available: skipping the prediction agreement check")
+
+    print(f"\n{'setting':>16} | {'pose runs':>9} | {'CPU saved':>9} | {'nose err':>9} | "
+          f"{'feature err':>11} | {'model agree':>11}")
+    for every_n, threshold in SETTINGS:
+        runs = frames = 0
+        nose_errors = []
+        feature_errors = []
+        agree = windows = 0
+        for index, sequence in enumerate(replay):
+            poses, sequence_runs, sequence_frames = schedule(sequence, every_n, threshold)
+            runs += sequence_runs
+            frames += sequence_frames
+            truth_kernel, held_kernel = FeatureKernel(), FeatureKernel()
+            for (_, truth), held in zip(sequence, poses):
+                if truth is None or held is None:
+                    continue
+                nose_errors.append(math.hypot(held[0] - truth[0], held[1] - truth[1]))
+                expected = truth_kernel.normalize(None, truth)[HAND_FEATURES:]
+                actual = held_kernel.normalize(None, held)[HAND_FEATURES:]
+                feature_errors.append(float(np.abs(actual - expected).mean()))
+            if model is not None:
+                predictions = [model.predict(window) for window in model_windows(sequence, poses)]
+                agree += sum(p[0] == r[0] for p, r in zip(predictions, reference_predictions[index]))
+                windows += len(predictions)
+
+        saved = 1 - runs / frames
+        label = f"N={every_n}, " + ("no motion" if threshold == math.inf else f"move>{threshold}")
+        nose = f"{np.mean(nose_errors):.4f}" if nose_errors else "n/a"
+        feature = f"{np.mean(feature_errors):.4f}" if feature_errors else "n/a"
+        agreement = f"{agree / windows:.1%}" if windows else "n/a"
+        print(f"{label:>16} | {runs / frames:>9.1%} | {saved * POSE_SHARE:>9.1%} | {nose:>9} | "
+              f"{feature:>11} | {agreement:>11}")
+
+    # Yardstick: how much the recorded pose itself changes from one frame to the next (mostly jitter)
+    nose_steps = []
+    feature_steps = []
+    kernel_a, kernel_b = FeatureKernel(), FeatureKernel()
+    for sequence in replay:
+        for (_, previous), (_, current) in zip(sequence, sequence[1:]):
+            if previous is None or current is None:
+                continue
+            nose_steps.append(math.hypot(current[0] - previous[0], current[1] - previous[1]))
+            feature_steps.append(float(np.abs(kernel_a.normalize(None, current)[HAND_FEATURES:] -
+                                              kernel_b.normalize(None, previous)[HAND_FEATURES:]).mean()))
+    if nose_steps:
+        print(f"{'frame-to-frame':>16} | {'':>9} | {'':>9} | {np.mean(nose_steps):>9.4f} | "
+              f"{np.mean(feature_steps):>11.4f} |")
+
+    print("\nnose err: mean image-space distance of the held nose from the recorded one; "
+          "feature err: mean absolute error of the 99 normalized pose features")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+Landmark window microbenchmark: deque of lists + np.array() vs FrameRingBuffer.
+
+For each strategy, appends one frame and prepares the [1, 20, 162] float32 model
+input, reporting time and transient bytes allocated per frame (tracemalloc peak).
+Run from the project root: python benchmarks/bench_ring_buffer.py
+"""
+import os
+import sys
+import time
+import tracemalloc
+from collections import deque
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from server.modules.ring_buffer import FrameRingBuffer
+from shared.config import BUFFER_SIZE, NUM_FEATURES
+
+NUM_FRAMES = 20000
+
+
+def legacy_step(buffer: deque, frame_list) -> np.ndarray:
+    buffer.append(frame_list)
+    return np.array([list(buffer)], dtype=np.float32)
+
+
+def ring_step(buffer: FrameRingBuffer, frame_array) -> np.ndarray:
+    buffer.append(frame_array)
+    return np.ascontiguousarray(buffer.window(), dtype=np.float32)[np.newaxis]
+
+
+def measure(label, step, buffer, frame) -> None:
+    for _ in range(BUFFER_SIZE):
+        step(buffer, frame)
+
+    start = time.perf_counter()
+    for _ in range(NUM_FRAMES):
+        step(buffer, frame)
+    per_frame_us = (time.perf_counter() - start) * 1e6 / NUM_FRAMES
+
+    tracemalloc.start()
+    peaks = []
+    for _ in range(200):
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        step(buffer, frame)
+        peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+    tracemalloc.stop()
+
+    print(f"[{label}] {per_frame_us:.2f} us/frame, {np.median(peaks):.0f} bytes allocated/frame")
+
+
+def main():
+    frame_list = list(np.random.default_rng(0).random(NUM_FEATURES))
+    frame_array = np.asarray(frame_list, dtype=np.float32)
+
+    measure("deque + np.array", legacy_step, deque(maxlen=BUFFER_SIZE), frame_list)
+    measure("FrameRingBuffer", ring_step, FrameRingBuffer(BUFFER_SIZE, NUM_FEATURES), frame_array)
+
+
+if __name__ == "__main__":
+    main()
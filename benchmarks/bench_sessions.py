@@ -0,0 +1,78 @@
+"""
+Session startup benchmark: per-connection model loading vs the shared ModelRegistry.
+
+Reports per-session memory (RSS growth) and connect-to-first-inference time.
+Run from the project root: python benchmarks/bench_sessions.py
+"""
+import os
+import random
+import resource
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from server.modules.gestures import GestureProcessor
+from server.modules.model_loader import GestureModel, ModelRegistry
+from shared.config import BUFFER_SIZE, INFERENCE_INTERVAL
+
+NUM_SESSIONS = 50
+
+
+def current_rss_kb() -> float:
+    """Resident set size of this process in KB."""
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / 1024
+    except (OSError, ValueError):
+        # ru_maxrss is a peak value (KB on Linux, bytes on macOS) but good enough for growth
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss / 1024 if sys.platform == 'darwin' else rss
+
+
+def random_frame():
+    return {
+        'hands': [random.uniform(0.0, 1.0) for _ in range(63)],
+        'pose': [random.uniform(0.0, 1.0) for _ in range(99)],
+    }
+
+
+def run_sessions(label: str, make_model) -> None:
+    frames = [random_frame() for _ in range(BUFFER_SIZE + INFERENCE_INTERVAL)]
+    sessions = []
+    first_inference = []
+
+    rss_before = current_rss_kb()
+    for _ in range(NUM_SESSIONS):
+        processor = GestureProcessor(model=make_model())
+        for frame in frames:
+            processor.last_action_time = 0
+            processor.process_landmarks(frame)
+            if processor.first_inference_ms is not None:
+                break
+        if processor.first_inference_ms is not None:
+            first_inference.append(processor.first_inference_ms)
+        sessions.append(processor)
+    rss_after = current_rss_kb()
+
+    per_session_kb = (rss_after - rss_before) / NUM_SESSIONS
+    print(f"[{label}] {NUM_SESSIONS} sessions")
+    print(f"  RSS growth per session:       {per_session_kb:.1f} KB")
+    print(f"  Session buffers (footprint):  {sessions[-1].memory_footprint() / 1024:.1f} KB")
+    if first_inference:
+        first_inference.sort()
+        print(f"  Connect-to-first-inference:   p50={first_inference[len(first_inference) // 2]:.2f} ms "
+              f"max={first_inference[-1]:.2f} ms")
+    else:
+        print("  Connect-to-first-inference:   n/a (model not loaded)")
+
+
+def main():
+    ModelRegistry.clear()
+    run_sessions("per-session model", lambda: GestureModel())
+    ModelRegistry.get()  # warm the registry like start_server does
+    run_sessions("shared registry", lambda: ModelRegistry.get())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Server cold-start benchmark: blocking vs background model warmup.
+
+For each mode a fresh server process is started and the benchmark reports the time
+from launch to the first accepted connection (a websocket stats round trip) and to
+the model being ready (model.warmup_ms appearing in the stats). It also reports how
+long importing the gesture processor takes and whether that pulls in TensorFlow.
+Run from the project root: python benchmarks/bench_startup.py
+"""
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+
+import websockets
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+
+from shared.schemas import PROTOCOL_VERSION, MESSAGE_TYPE_STATS
+
+HOST = "127.0.0.1"
+PORT = 8797
+TIMEOUT = 120.0
+
+# Child process: override the warmup mode before the server module reads the config
+SERVER_SNIPPET = """
+import asyncio, sys
+import shared.config
+shared.config.MODEL_WARMUP_BACKGROUND = sys.argv[1] == "background"
+from server.ws_server import start_server
+asyncio.run(start_server(sys.argv[2], int(sys.argv[3])))
+"""
+
+IMPORT_SNIPPET = """
+import json, sys, time
+start = time.perf_counter()
+import server.modules.gestures
+print(json.dumps({"import_ms": (time.perf_counter() - start) * 1000,
+                  "tensorflow": "tensorflow" in sys.modules or "tflite_runtime" in sys.modules}))
+"""
+
+
+async def request_stats() -> dict:
+    async with websockets.connect(f"ws://{HOST}:{PORT}") as websocket:
+        await websocket.send(json.dumps({"version": PROTOCOL_VERSION, "type": MESSAGE_TYPE_STATS}))
+        while True:
+            reply = json.loads(await websocket.recv())
+            if reply.get("type") == MESSAGE_TYPE_STATS:
+                return reply["stats"]
+
+
+async def measure(mode: str) -> None:
+    launched = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-c", SERVER_SNIPPET, mode, HOST, str(PORT)],
+        cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    first_connection_ms = None
+    model_ready_ms = None
+    try:
+        while time.perf_counter() - launched < TIMEOUT:
+            try:
+                stats = await request_stats()
+            except OSError:
+                await asyncio.sleep(0.01)
+                continue
+            elapsed_ms = (time.perf_counter() - launched) * 1000
+            if first_connection_ms is None:
+                first_connection_ms = elapsed_ms
+            if "model.warmup_ms" in stats:
+                model_ready_ms = elapsed_ms
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        server.terminate()
+        server.wait()
+
+    def fmt(value):
+        return f"{value:.0f} ms" if value is not None else "timeout"
+
+    print(f"[{mode}] first accepted connection: {fmt(first_connection_ms)}, model ready: {fmt(model_ready_ms)}")
+
+
+def report_import() -> None:
+    result = subprocess.run([sys.executable, "-c", IMPORT_SNIPPET], cwd=ROOT, capture_output=True, text=True)
+    stats = json.loads(result.stdout.strip().splitlines()[-1])
+    print(f"import server.modules.gestures: {stats['import_ms']:.0f} ms "
+          f"(TensorFlow imported: {'yes' if stats['tensorflow'] else 'no'})")
+
+
+def main():
+    report_import()
+    for mode in ("blocking", "background"):
+        asyncio.run(measure(mode))
+
+
+if __name__ == "__main__":
+    main()
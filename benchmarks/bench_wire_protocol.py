@@ -0,0 +1,64 @@
+"""
+Landmark wire protocol benchmark: JSON text (version 1) vs packed binary (version 2).
+
+Reports bytes per frame and encode / decode time per frame for v1 JSON, v2 float32
+and v2 float16, plus the worst float16 rounding error. Encoding starts from
+MediaPipe-shaped results (serialize_landmarks / serialize_landmarks_binary) and
+decoding goes through parse_message, as on the server.
+Run from the project root: python benchmarks/bench_wire_protocol.py
+"""
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from shared.schemas import serialize_landmarks, serialize_landmarks_binary, parse_message
+
+NUM_FRAMES = 5000
+
+
+def fake_results(rng) -> SimpleNamespace:
+    """Object with the attributes serialize_landmarks reads from MediaPipe results."""
+    def landmarks(count):
+        return SimpleNamespace(landmark=[SimpleNamespace(x=x, y=y, z=z) for x, y, z in rng.random((count, 3))])
+    return SimpleNamespace(multi_hand_landmarks=[landmarks(21)], pose_landmarks=landmarks(33))
+
+
+def time_per_frame(fn, items) -> float:
+    start = time.perf_counter()
+    for item in items:
+        fn(item)
+    return (time.perf_counter() - start) * 1e6 / len(items)
+
+
+def main():
+    rng = np.random.default_rng(0)
+    results = [fake_results(rng) for _ in range(NUM_FRAMES)]
+    encoders = {
+        "v1 json": lambda r: serialize_landmarks(r),
+        "v2 float32": lambda r: serialize_landmarks_binary(r),
+        "v2 float16": lambda r: serialize_landmarks_binary(r, half=True),
+    }
+
+    baseline = None
+    print(f"{'protocol':<12} {'bytes/frame':>12} {'encode us':>10} {'decode us':>10}")
+    for name, encode in encoders.items():
+        messages = [encode(r) for r in results]
+        size = sum(len(m) for m in messages) / len(messages)
+        encode_us = time_per_frame(encode, results)
+        decode_us = time_per_frame(parse_message, messages)
+        baseline = baseline or size
+        print(f"{name:<12} {size:>12.0f} {encode_us:>10.2f} {decode_us:>10.2f}   ({baseline / size:.1f}x smaller)")
+
+    reference = parse_message(encoders["v2 float32"](results[0]))
+    half = parse_message(encoders["v2 float16"](results[0]))
+    error = max(np.abs(reference[k] - half[k]).max() for k in ("hands", "pose"))
+    print(f"float16 max abs error: {error:.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Multi-process scaling benchmark: aggregate frames/sec for --workers 1..N.
+
+For each worker count a server is started with `python -m server.ws_server --workers N`
+and CLIENT_PROCESSES client processes (CONNECTIONS_PER_PROCESS websockets each) stream
+FRAMES_PER_CONNECTION frames, then wait for a stats reply marking the end of processing.
+Run from the project root: python benchmarks/bench_workers.py
+"""
+import asyncio
+import json
+import multiprocessing as mp
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+
+import websockets
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+
+from shared.schemas import PROTOCOL_VERSION, MESSAGE_TYPE_STATS
+
+HOST = "127.0.0.1"
+PORT = 8798
+CLIENT_PROCESSES = 4
+CONNECTIONS_PER_PROCESS = 8
+FRAMES_PER_CONNECTION = 300
+
+
+def make_frame() -> str:
+    return json.dumps({
+        "version": PROTOCOL_VERSION,
+        "timestamp": time.time(),
+        "client_id": "bench",
+        "hands": [random.uniform(0.0, 1.0) for _ in range(63)],
+        "pose": [random.uniform(0.0, 1.0) for _ in range(99)],
+    })
+
+
+async def stream_connection(frames) -> None:
+    async with websockets.connect(f"ws://{HOST}:{PORT}") as websocket:
+        for frame in frames:
+            await websocket.send(frame)
+        await websocket.send(json.dumps({"version": PROTOCOL_VERSION, "type": MESSAGE_TYPE_STATS}))
+        while json.loads(await websocket.recv()).get("type") != MESSAGE_TYPE_STATS:
+            pass
+
+
+def client_process(_) -> None:
+    frames = [make_frame() for _ in range(FRAMES_PER_CONNECTION)]
+
+    async def run():
+        await asyncio.gather(*(stream_connection(frames) for _ in range(CONNECTIONS_PER_PROCESS)))
+
+    asyncio.run(run())
+
+
+def wait_for_port(timeout: float = 60.0) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with socket.create_connection((HOST, PORT), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError("Server did not start in time")
+
+
+def bench(num_workers: int) -> float:
+    server = subprocess.Popen(
+        [sys.executable, "-m", "server.ws_server", "--host", HOST, "--port", str(PORT), "--workers", str(num_workers)],
+        cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_for_port()
+        # Give the remaining workers time to load their model and bind
+        time.sleep(2.0)
+        start = time.perf_counter()
+        with mp.Pool(CLIENT_PROCESSES) as pool:
+            pool.map(client_process, range(CLIENT_PROCESSES))
+        elapsed = time.perf_counter() - start
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+    total = CLIENT_PROCESSES * CONNECTIONS_PER_PROCESS * FRAMES_PER_CONNECTION
+    return total / elapsed
+
+
+def main():
+    counts = sorted({1, 2, 4, os.cpu_count() or 1})
+    baseline = None
+    for num_workers in counts:
+        fps = bench(num_workers)
+        baseline = baseline or fps
+        print(f"workers={num_workers:<3} {fps:>9.0f} frames/sec  (x{fps / baseline:.2f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+import threading
+import time
+from typing import Any, NamedTuple, Optional
+from shared import metrics
+
+
+class GrabbedFrame(NamedTuple):
+    frame: Any
+    frame_id: int
+    captured_at: float  # time.perf_counter() right after read() returned
+
+
+class FrameGrabber:
+    """
+    Reads a cv2.VideoCapture-like source on a dedicated thread and keeps only the newest frame.
+
+    cap.read() blocks until the camera delivers the next frame; doing that on the
+    event loop stalls the websocket coroutines. Here the thread blocks instead, and
+    consumers take the latest frame with wait_for_frame(). Frames that were replaced
+    before anyone took them are counted as dropped (client.frames_skipped).
+    """
+    def __init__(self, capture):
+        self.capture = capture
+        self._latest: Optional[GrabbedFrame] = None
+        self._taken_id = -1
+        self._condition = threading.Condition()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self.frames_captured = 0
+
+        self._captured = metrics.counter("client.frames_captured")
+        self._skipped = metrics.counter("client.frames_skipped")
+        self._read_ms = metrics.histogram("client.capture_read_ms")
+
+    def start(self) -> "FrameGrabber":
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="frame-grabber", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def _run(self) -> None:
+        frame_id = 0
+        while self._running:
+            start = time.perf_counter()
+            ret, frame = self.capture.read()
+            captured_at = time.perf_counter()
+            if not ret:
+                break
+            self._read_ms.observe((captured_at - start) * 1000)
+            self._captured.inc()
+            with self._condition:
+                if self._latest is not None and self._latest.frame_id != self._taken_id:
+                    self._skipped.inc()
+                self._latest = GrabbedFrame(frame, frame_id, captured_at)
+                self.frames_captured += 1
+                self._condition.notify_all()
+            frame_id += 1
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+
+    def wait_for_frame(self, timeout: Optional[float] = None) -> Optional[GrabbedFrame]:
+        """
+        Newest frame not yet taken, waiting for the camera if needed.
+        Returns None on timeout or once the source has stopped.
+        """
+        with self._condition:
+            ready = self._condition.wait_for(
+                lambda: not self._running or (self._latest is not None and self._latest.frame_id != self._taken_id),
+                timeout,
+            )
+            if not ready or self._latest is None or self._latest.frame_id == self._taken_id:
+                return None
+            self._taken_id = self._latest.frame_id
+            return self._latest
@@ -0,0 +1,64 @@
+import time
+from typing import Optional
+from shared import metrics
+
+# Frame period buckets, fine around the 30 / 15 FPS periods (33.3 / 66.7 ms)
+FRAME_PERIOD_BUCKETS_MS = (5, 10, 20, 25, 30, 33.4, 37, 40, 50, 60, 66.7, 75, 100, 150, 250, 500, 1000)
+
+class FramePacer:
+    """
+    Paces frame processing to absolute deadlines at `fps` and measures the frame period.
+
+    wait() sleeps until the next deadline (deadline n is start + n / fps, so neither
+    processing time nor sleep overshoot accumulates). When processing ran past one
+    or more deadlines, those slots are skipped instead of being made up with a burst
+    of back-to-back frames, and counted in client.pacer_missed_deadlines. With
+    fps=None wait() returns immediately and only the measurements are kept.
+
+    tick() records each processed frame: the period since the previous one
+    (client.frame_period_ms) and its deviation from the nominal period
+    (client.frame_jitter_ms). wait() runs on the extraction thread while tick() is
+    called from the event loop.
+    """
+    def __init__(self, fps: Optional[float], nominal_fps: Optional[float] = None):
+        self.period = 1.0 / fps if fps else None
+        nominal = nominal_fps or fps
+        self.nominal_period_ms = 1000.0 / nominal if nominal else None
+        self._deadline: Optional[float] = None
+        self._last_tick: Optional[float] = None
+        self.missed_deadlines = 0
+
+        self._period_ms = metrics.histogram("client.frame_period_ms", FRAME_PERIOD_BUCKETS_MS)
+        self._jitter_ms = metrics.histogram("client.frame_jitter_ms")
+        self._missed = metrics.counter("client.pacer_missed_deadlines")
+
+    def wait(self) -> int:
+        """Sleep until the next frame deadline; returns how many deadlines were missed."""
+        if self.period is None:
+            return 0
+        now = time.perf_counter()
+        if self._deadline is None:
+            self._deadline = now
+        missed = 0
+        if now < self._deadline:
+            time.sleep(self._deadline - now)
+        else:
+            # Behind: resume on the current slot instead of catching up on the missed ones
+            missed = int((now - self._deadline) // self.period)
+            if missed:
+                self._deadline += missed * self.period
+                self.missed_deadlines += missed
+                self._missed.inc(missed)
+        self._deadline += self.period
+        return missed
+
+    def tick(self) -> None:
+        """Record that a frame was processed now."""
+        now = time.perf_counter()
+        last, self._last_tick = self._last_tick, now
+        if last is None:
+            return
+        period_ms = (now - last) * 1000
+        self._period_ms.observe(period_ms)
+        if self.nominal_period_ms is not None:
+            self._jitter_ms.observe(abs(period_ms - self.nominal_period_ms))
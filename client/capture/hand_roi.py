@@ -0,0 +1,85 @@
+from typing import Optional, Tuple
+from shared import metrics
+from shared.config import HAND_ROI_MARGIN, HAND_ROI_MIN_SIZE, HAND_ROI_FULL_FRAME_INTERVAL
+
+Region = Tuple[int, int, int, int]  # x0, y0, x1, y1 in pixels
+BoundingBox = Tuple[float, float, float, float]  # x0, y0, x1, y1 normalized to the full frame
+
+
+def landmarks_bbox(multi_hand_landmarks) -> Optional[BoundingBox]:
+    """Normalized bounding box of all detected hand landmarks; None without hands."""
+    if not multi_hand_landmarks:
+        return None
+    xs = [lm.x for hand in multi_hand_landmarks for lm in hand.landmark]
+    ys = [lm.y for hand in multi_hand_landmarks for lm in hand.landmark]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+class HandRoiTracker:
+    """
+    Chooses the part of the frame the hand graph has to look at.
+
+    Once hands are found, the next frame is searched in a square around their
+    bounding box, grown by `margin` of its size on every side and at least `min_size`
+    of the frame's shorter side, so in the common tracking case only a small region
+    is processed. Without a previous box (tracking lost), and every
+    `full_frame_interval` frames so that a second hand entering elsewhere is picked
+    up, region() returns None: search the whole frame.
+
+    num_hands is how many hands the last frame found, so the crop can go to a tracking
+    graph whose max_num_hands matches (it then skips palm detection).
+
+    MediaPipe reports landmarks normalized to the image it was given; to_frame() maps
+    those of a crop back to full-frame coordinates.
+    """
+    def __init__(self, margin: float = HAND_ROI_MARGIN, min_size: float = HAND_ROI_MIN_SIZE,
+                 full_frame_interval: int = HAND_ROI_FULL_FRAME_INTERVAL):
+        self.margin = margin
+        self.min_size = min_size
+        self.full_frame_interval = full_frame_interval
+        self._bbox: Optional[BoundingBox] = None
+        self._since_full_frame = 0
+        self.num_hands = 0
+
+        self._tracked = metrics.counter("client.hand_roi_tracked")
+        self._lost = metrics.counter("client.hand_roi_lost")
+        self._area = metrics.gauge("client.hand_roi_area")
+
+    def region(self, width: int, height: int) -> Optional[Region]:
+        """Crop for the next frame, or None to search the whole frame."""
+        self._since_full_frame += 1
+        if self._bbox is None or self._since_full_frame >= self.full_frame_interval:
+            self._since_full_frame = 0
+            self._area.set(1.0)
+            return None
+
+        x0, y0, x1, y1 = self._bbox
+        side = max((x1 - x0) * width, (y1 - y0) * height) * (1 + 2 * self.margin)
+        side = int(round(max(side, self.min_size * min(width, height))))
+        crop_w, crop_h = min(side, width), min(side, height)
+        # Centre on the hand, shifted back inside the frame at the borders
+        left = int(round((x0 + x1) / 2 * width - crop_w / 2))
+        top = int(round((y0 + y1) / 2 * height - crop_h / 2))
+        left = min(max(left, 0), width - crop_w)
+        top = min(max(top, 0), height - crop_h)
+        self._area.set(crop_w * crop_h / (width * height))
+        return left, top, left + crop_w, top + crop_h
+
+    @staticmethod
+    def to_frame(multi_hand_landmarks, region: Region, width: int, height: int) -> None:
+        """Rewrite landmarks found in `region` to full-frame normalized coordinates, in place."""
+        x0, y0, x1, y1 = region
+        scale_x, scale_y = (x1 - x0) / width, (y1 - y0) / height
+        for hand in multi_hand_landmarks:
+            for lm in hand.landmark:
+                lm.x = x0 / width + lm.x * scale_x
+                lm.y = y0 / height + lm.y * scale_y
+                # MediaPipe scales z like x (by the image width)
+                lm.z = lm.z * scale_x
+
+    def update(self, multi_hand_landmarks, cropped: bool) -> None:
+        """Record the hands found in this frame (full-frame coordinates); None / empty = lost."""
+        if cropped:
+            (self._tracked if multi_hand_landmarks else self._lost).inc()
+        self._bbox = landmarks_bbox(multi_hand_landmarks)
+        self.num_hands = len(multi_hand_landmarks) if multi_hand_landmarks else 0
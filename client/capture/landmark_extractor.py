@@ -1,8 +1,12 @@
 #type: ignore
 import mediapipe as mp
 import cv2
+import numpy as np
 from dataclasses import dataclass
 from typing import Optional
+from shared.config import ADAPTIVE_POSE, HAND_ROI, PROCESSING_WIDTH
+from .hand_roi import HandRoiTracker
+from .pose_scheduler import PoseScheduler, hand_position
 
 @dataclass
 class LandmarkResults:
@@ -14,7 +18,7 @@ class LandmarkExtractor:
     MIN_DETECTION_CONFIDENCE = 0.5
     MIN_TRACKING_CONFIDENCE = 0.5
     
-    def __init__(self):
+    def __init__(self, hand_roi: bool = HAND_ROI, processing_width: Optional[int] = PROCESSING_WIDTH):
         self.mp_hands = mp.solutions.hands
         self.mp_pose = mp.solutions.pose
         
@@ -31,14 +35,83 @@ class LandmarkExtractor:
             min_tracking_confidence=self.MIN_TRACKING_CONFIDENCE
         )
 
+        # Hand graph on a crop around the previous hands; both graphs on downscaled images.
+        # Crops go to their own tracking graphs, one per number of hands followed: a graph
+        # tracking max_num_hands hands skips palm detection, which is where the time goes.
+        # self.hands keeps searching whole frames
+        self.hand_roi = HandRoiTracker() if hand_roi else None
+        self.crop_hands = {
+            num_hands: self.mp_hands.Hands(
+                static_image_mode=False,
+                max_num_hands=num_hands,
+                min_detection_confidence=self.MIN_DETECTION_CONFIDENCE,
+                min_tracking_confidence=self.MIN_TRACKING_CONFIDENCE
+            )
+            for num_hands in (1, 2)
+        } if hand_roi else None
+        self.processing_width = processing_width
+
+        # Adaptive pose rate: hold the last pose on frames where the scheduler skips the graph
+        self.pose_scheduler = PoseScheduler() if ADAPTIVE_POSE else None
+        self._pose_results = None
+
     def process_frame(self, frame) -> LandmarkResults:
         """Extract hand and pose landmarks from a video frame."""
-        # IMPORTANT: MediaPipe expects RGB, OpenCV uses BGR
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        
-        hand_results = self.hands.process(rgb_frame)
-        pose_results = self.pose.process(rgb_frame)
-        
+        rgb_frame = self.to_rgb(frame)
+        return self.combine(self.process_hands(rgb_frame), self.process_pose(rgb_frame))
+
+    # The steps of process_frame, so a pipeline can run the two graphs concurrently.
+    # Each graph tracks across frames: feed it frames in order from a single thread.
+
+    def to_rgb(self, frame):
+        """IMPORTANT: MediaPipe expects RGB, OpenCV uses BGR."""
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+    def downscale(self, image):
+        """Image resized to at most processing_width pixels wide, as a contiguous array for MediaPipe."""
+        height, width = image.shape[:2]
+        if self.processing_width and width > self.processing_width:
+            size = (self.processing_width, max(1, round(height * self.processing_width / width)))
+            return cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+        return np.ascontiguousarray(image)
+
+    def process_hands(self, rgb_frame):
+        if self.hand_roi:
+            results = self._process_hands_roi(rgb_frame)
+        else:
+            results = self.hands.process(self.downscale(rgb_frame))
+        if self.pose_scheduler:
+            self.pose_scheduler.observe_hand(hand_position(results.multi_hand_landmarks))
+        return results
+
+    def process_pose(self, rgb_frame):
+        if self.pose_scheduler:
+            have_pose = self._pose_results is not None and self._pose_results.pose_landmarks is not None
+            if not self.pose_scheduler.should_run(have_pose):
+                return self._pose_results
+        self._pose_results = self.pose.process(self.downscale(rgb_frame))
+        return self._pose_results
+
+    def _process_hands_roi(self, rgb_frame):
+        """Hands from a crop around the previous ones; the whole frame when tracking is lost."""
+        height, width = rgb_frame.shape[:2]
+        region = self.hand_roi.region(width, height)
+        if region is not None:
+            x0, y0, x1, y1 = region
+            crop_hands = self.crop_hands[self.hand_roi.num_hands]
+            results = crop_hands.process(self.downscale(rgb_frame[y0:y1, x0:x1]))
+            if results.multi_hand_landmarks:
+                self.hand_roi.to_frame(results.multi_hand_landmarks, region, width, height)
+                self.hand_roi.update(results.multi_hand_landmarks, cropped=True)
+                return results
+            self.hand_roi.update(None, cropped=True)
+        # Re-detect on the same frame rather than missing it
+        results = self.hands.process(self.downscale(rgb_frame))
+        self.hand_roi.update(results.multi_hand_landmarks, cropped=False)
+        return results
+
+    @staticmethod
+    def combine(hand_results, pose_results) -> LandmarkResults:
         return LandmarkResults(
             multi_hand_landmarks=hand_results.multi_hand_landmarks,
             pose_landmarks=pose_results.pose_landmarks
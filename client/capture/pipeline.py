@@ -0,0 +1,162 @@
+import queue
+import threading
+import time
+from typing import Any, Callable, List, NamedTuple, Optional, Union
+from shared import metrics
+from shared.config import PIPELINE_QUEUE_SIZE
+from .frame_grabber import FrameGrabber, GrabbedFrame
+from .frame_pacer import FramePacer
+
+# End-of-stream marker passed down every queue
+_STOP = object()
+
+
+class PipelineResult(NamedTuple):
+    grabbed: GrabbedFrame
+    frame: Any  # Flipped BGR frame, for display
+    results: Any  # LandmarkResults
+    payload: Optional[Union[str, bytes]]
+
+
+class _Stage:
+    """
+    One pipeline worker thread: take an item from `source`, apply `fn`, put the
+    result on every outbox. Reports pipeline.<name>.utilization (share of wall time
+    spent in fn), pipeline.<name>.queue_depth (items waiting in its inbox) and
+    pipeline.<name>_ms (time per item).
+    """
+    def __init__(self, name: str, fn: Callable[[Any], Any], source: Callable[[], Any],
+                 outboxes: List[queue.Queue], inbox: Optional[queue.Queue] = None):
+        self.name = name
+        self.fn = fn
+        self.source = source
+        self.outboxes = outboxes
+        self.inbox = inbox
+        self._thread = threading.Thread(target=self._run, name=f"pipeline-{name}", daemon=True)
+
+        self._utilization = metrics.gauge(f"pipeline.{name}.utilization")
+        self._depth = metrics.gauge(f"pipeline.{name}.queue_depth")
+        self._time_ms = metrics.histogram(f"pipeline.{name}_ms")
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def _run(self) -> None:
+        started = time.perf_counter()
+        busy = 0.0
+        while True:
+            if self.inbox is not None:
+                self._depth.set(self.inbox.qsize())
+            item = self.source()
+            if item is _STOP:
+                break
+            start = time.perf_counter()
+            result = self.fn(item)
+            end = time.perf_counter()
+            busy += end - start
+            self._time_ms.observe((end - start) * 1000)
+            self._utilization.set(busy / (end - started))
+            for outbox in self.outboxes:
+                outbox.put(result)
+        for outbox in self.outboxes:
+            outbox.put(_STOP)
+
+
+class LandmarkPipeline:
+    """
+    Staged client pipeline: capture -> prepare -> hands || pose -> join + serialize.
+
+    The grabber thread captures, a prepare stage flips the frame and converts it to
+    RGB, then the hand and pose graphs run concurrently on their own threads
+    (MediaPipe releases the GIL while a graph runs) and a join stage pairs their
+    results by frame id and serializes the payload. Queues between stages hold at
+    most PIPELINE_QUEUE_SIZE frames: when a stage falls behind, the stages before it
+    block and the grabber keeps only the newest frame, so latency stays bounded
+    while throughput is set by the slowest stage instead of the sum of all of them.
+
+    `extractor` provides to_rgb / process_hands / process_pose / combine (see
+    LandmarkExtractor); `flip` mirrors a camera frame and `serialize` turns
+    LandmarkResults into a payload (or None). An optional `pacer` spaces the frames
+    taken from the grabber.
+    """
+    def __init__(self, grabber: FrameGrabber, extractor, flip: Callable[[Any], Any],
+                 serialize: Callable[[Any], Optional[Union[str, bytes]]], queue_size: int = PIPELINE_QUEUE_SIZE,
+                 pacer: Optional[FramePacer] = None):
+        self.grabber = grabber
+        self.pacer = pacer
+        self.extractor = extractor
+        self.flip = flip
+        self.serialize = serialize
+
+        hands_in: queue.Queue = queue.Queue(maxsize=queue_size)
+        pose_in: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._hands_out: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._pose_out: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._results: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._output_depth = metrics.gauge("pipeline.output.queue_depth")
+
+        self.stages = [
+            _Stage("prepare", self._prepare, self._next_frame, [hands_in, pose_in]),
+            _Stage("hands", self._hands, hands_in.get, [self._hands_out], inbox=hands_in),
+            _Stage("pose", self._pose, pose_in.get, [self._pose_out], inbox=pose_in),
+            _Stage("join", self._join, self._next_pair, [self._results], inbox=self._hands_out),
+        ]
+
+    def start(self) -> "LandmarkPipeline":
+        self.grabber.start()
+        for stage in self.stages:
+            stage.start()
+        return self
+
+    def stop(self) -> None:
+        # The end of the capture flows down the stages as a stop marker
+        self.grabber.stop()
+
+    def _next_frame(self):
+        if self.pacer is not None:
+            self.pacer.wait()
+        while True:
+            grabbed = self.grabber.wait_for_frame(timeout=1.0)
+            if grabbed is not None:
+                return grabbed
+            if not self.grabber.running:
+                return _STOP
+
+    def _prepare(self, grabbed: GrabbedFrame):
+        frame = self.flip(grabbed.frame)
+        return grabbed, frame, self.extractor.to_rgb(frame)
+
+    def _hands(self, item):
+        grabbed, frame, rgb = item
+        return grabbed, frame, self.extractor.process_hands(rgb)
+
+    def _pose(self, item):
+        grabbed, _, rgb = item
+        return grabbed.frame_id, self.extractor.process_pose(rgb)
+
+    def _next_pair(self):
+        """Next hand result and the pose result of the same frame."""
+        hands = self._hands_out.get()
+        pose = self._pose_out.get()
+        # Both workers see every prepared frame in order, so ids match; should one
+        # ever be missing, skip ahead to the newer frame instead of mispairing
+        while hands is not _STOP and pose is not _STOP and hands[0].frame_id != pose[0]:
+            if hands[0].frame_id < pose[0]:
+                hands = self._hands_out.get()
+            else:
+                pose = self._pose_out.get()
+        if hands is _STOP or pose is _STOP:
+            return _STOP
+        return hands, pose
+
+    def _join(self, pair) -> PipelineResult:
+        (grabbed, frame, hand_results), (_, pose_results) = pair
+        results = self.extractor.combine(hand_results, pose_results)
+        payload = self.serialize(results) if results.multi_hand_landmarks else None
+        return PipelineResult(grabbed, frame, results, payload)
+
+    def next_result(self) -> Optional[PipelineResult]:
+        """Next processed frame, in capture order; None once the capture has ended."""
+        self._output_depth.set(self._results.qsize())
+        result = self._results.get()
+        return None if result is _STOP else result
@@ -0,0 +1,73 @@
+import math
+from typing import Optional, Tuple
+from shared import metrics
+from shared.config import POSE_EVERY_N_FRAMES, POSE_MOTION_THRESHOLD
+
+HandPosition = Tuple[float, float]
+
+
+def hand_position(multi_hand_landmarks) -> Optional[HandPosition]:
+    """Normalized (x, y) of the first hand's wrist in MediaPipe results; None without hands."""
+    if not multi_hand_landmarks:
+        return None
+    wrist = multi_hand_landmarks[0].landmark[0]
+    return wrist.x, wrist.y
+
+
+class PoseScheduler:
+    """
+    Decides frame by frame whether the pose graph has to run or the last pose can be held.
+
+    The server only uses pose for shoulder normalization and the nose-proximity check,
+    and the body moves far less than the hand, so the pose runs every `every_n` frames
+    and in between whenever the hand (wrist) has moved more than `motion_threshold`
+    (normalized image units) since the last pose, appears, or no pose is held yet.
+    Held frames reuse the last pose, so every payload still carries one.
+
+    observe_hand() is fed by the hand worker and should_run() is asked by the pose
+    worker; in the pipelined client they are different threads, and the pose then
+    reacts to the hand position of the previous frame.
+    """
+    def __init__(self, every_n: int = POSE_EVERY_N_FRAMES, motion_threshold: float = POSE_MOTION_THRESHOLD):
+        self.every_n = max(1, every_n)
+        self.motion_threshold = motion_threshold
+        self._hand: Optional[HandPosition] = None
+        self._hand_at_run: Optional[HandPosition] = None
+        self._held = 0  # Frames since the pose last ran
+        self.runs = 0
+        self.holds = 0
+
+        self._runs = metrics.counter("client.pose_runs")
+        self._holds = metrics.counter("client.pose_held")
+
+    def observe_hand(self, position: Optional[HandPosition]) -> None:
+        """Latest hand position (see hand_position); None when no hand is visible."""
+        self._hand = position
+
+    def _hand_moved(self, hand: Optional[HandPosition]) -> bool:
+        if hand is None:
+            return False
+        if self._hand_at_run is None:
+            return True
+        return math.hypot(hand[0] - self._hand_at_run[0], hand[1] - self._hand_at_run[1]) > self.motion_threshold
+
+    def should_run(self, have_pose: bool) -> bool:
+        """Called once per frame; have_pose: whether a detected pose is held from an earlier frame."""
+        hand = self._hand
+        run = not have_pose or self._held + 1 >= self.every_n or self._hand_moved(hand)
+        if run:
+            self._held = 0
+            self._hand_at_run = hand
+            self.runs += 1
+            self._runs.inc()
+        else:
+            self._held += 1
+            self.holds += 1
+            self._holds.inc()
+        return run
+
+    @property
+    def run_fraction(self) -> Optional[float]:
+        """Share of frames on which the pose graph ran (None before the first frame)."""
+        total = self.runs + self.holds
+        return self.runs / total if total else None
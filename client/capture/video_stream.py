@@ -1,13 +1,22 @@
 import cv2
 import asyncio
-from typing import Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Union
+from .frame_grabber import FrameGrabber
+from .frame_pacer import FramePacer
 from .landmark_extractor import LandmarkExtractor
+from .pipeline import LandmarkPipeline, PipelineResult
+from client.send_queue import RawFrame
 from client.ws_client import WebSocketClient
-from shared.schemas import serialize_landmarks
+from shared import metrics
+from shared.schemas import serialize_landmarks, serialize_landmarks_binary, landmark_arrays, BINARY_PROTOCOL_VERSION
+from shared.config import WIRE_PROTOCOL_VERSION, WIRE_FLOAT16, CLIENT_PIPELINE, FRAME_PACING
 
 class VideoStream:
     TARGET_FPS = 30
     WINDOW_NAME = "GestureDetection Client"
+    REPORT_INTERVAL_S = 10  # Seconds between FPS / latency / drop reports
     
     # HUD Colors (BGR)
     COLOR_GREY = (100, 100, 100)
@@ -18,6 +27,22 @@ class VideoStream:
         self.extractor = LandmarkExtractor()
         self.ws_client = ws_client
         self.cap = cv2.VideoCapture(0)
+        self.cap.set(cv2.CAP_PROP_FPS, self.TARGET_FPS)
+        # Camera reads on their own thread; one worker for MediaPipe (its graphs are not thread-safe)
+        self.grabber = FrameGrabber(self.cap)
+        self.worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="landmarks")
+        # Deadlines at TARGET_FPS when pacing; frame period / jitter histograms either way
+        self.pacer = FramePacer(self.TARGET_FPS if FRAME_PACING else None, nominal_fps=self.TARGET_FPS)
+        # Optional staged pipeline (hand and pose graphs in parallel); the worker then only waits on it
+        self.pipeline = None
+        if CLIENT_PIPELINE:
+            self.pipeline = LandmarkPipeline(self.grabber, self.extractor, flip=lambda frame: cv2.flip(frame, 1),
+                                             serialize=self._serialize, pacer=self.pacer)
+        
+        # Performance reporting
+        self._fps = metrics.gauge("client.fps")
+        self._extract_ms = metrics.histogram("client.extract_ms")
+        self.last_report = time.perf_counter()
         
         # Register callback for HUD
         self.ws_client.on_command_callback = self._on_gesture_received
@@ -40,16 +65,65 @@ class VideoStream:
             self.ws_client.connect_and_listen()
         )
 
+    def _serialize(self, results) -> Optional[Union[str, bytes, RawFrame]]:
+        """Payload for the configured wire protocol (raw landmarks for delta coding)."""
+        if self.ws_client.delta_encoder:
+            # Delta-coded by the sender at dequeue time (see WebSocketClient._encode)
+            hands, pose = landmark_arrays(results)
+            if hands is None and pose is None:
+                return None
+            return RawFrame(hands, pose, time.time())
+        if WIRE_PROTOCOL_VERSION == BINARY_PROTOCOL_VERSION:
+            return serialize_landmarks_binary(results, client_id=self.ws_client.client_id, half=WIRE_FLOAT16)
+        return serialize_landmarks(results, client_id=self.ws_client.client_id)
+
+    def _extract_next(self) -> Optional[PipelineResult]:
+        """
+        Worker thread: take the newest camera frame, extract and serialize its landmarks.
+        Returns None once the camera has stopped.
+        """
+        self.pacer.wait()
+        grabbed = None
+        while grabbed is None:
+            if not self.grabber.running:
+                grabbed = self.grabber.wait_for_frame(timeout=0)
+                if grabbed is None:
+                    return None
+            else:
+                grabbed = self.grabber.wait_for_frame(timeout=1.0)
+
+        start = time.perf_counter()
+        frame = cv2.flip(grabbed.frame, 1)
+        results = self.extractor.process_frame(frame)
+        payload = self._serialize(results) if results.multi_hand_landmarks else None
+        self._extract_ms.observe((time.perf_counter() - start) * 1000)
+        return PipelineResult(grabbed, frame, results, payload)
+
     async def _capture_loop(self) -> None:
-        """Main loop for split-process (capture -> extract -> send)."""
-        import time
+        """
+        Main loop for split-process (capture -> extract -> send).
+        The camera is read on the grabber thread and landmarks are extracted on the
+        worker thread (or the pipeline stages), so this coroutine only waits on them and
+        the websocket send and receive loops keep running meanwhile. The camera paces
+        the loop, or with FRAME_PACING the pacer's deadlines at TARGET_FPS.
+        """
+        loop = asyncio.get_running_loop()
+        if self.pipeline is not None:
+            self.pipeline.start()
+            next_result = self.pipeline.next_result
+        else:
+            self.grabber.start()
+            next_result = self._extract_next
+        started = time.perf_counter()
+        frames = 0
         
         while True:
-            ret, frame = self.cap.read()
-            if not ret: break
-
-            frame = cv2.flip(frame, 1)
-            results = self.extractor.process_frame(frame)
+            item = await loop.run_in_executor(self.worker, next_result)
+            if item is None: break
+            grabbed, frame, results, payload = item
+            frames += 1
+            self._fps.set(frames / (time.perf_counter() - started))
+            self.pacer.tick()
             
             # --- HUD LOGIC ---
             status_color = self.COLOR_GREY
@@ -57,19 +131,9 @@ class VideoStream:
             has_hands = bool(results.multi_hand_landmarks)
             if has_hands:
                 status_color = self.COLOR_BLUE
-                
-                # Serialization
-                data_json = serialize_landmarks(results, client_id=self.ws_client.client_id)
-                if data_json:
-                    await self.ws_client.send_data(data_json)
+                if payload:
+                    await self.ws_client.send_data(payload, captured_at=grabbed.captured_at)
 
-            # Check for incoming commands (Mock logic: usually comes via ws_client callback/queue)
-            # For now, we rely on the main loop or a shared state if we want to display SERVER response.
-            # Assuming ws_client updates a 'last_received_command' attribute or similar.
-            # But the request says client receives commands. 
-            # We need to bridge ws_client message handling to this view.
-            # Let's assume ws_client has a queue or callback.
-            
             # Draw HUD
             self._draw_hud(frame, status_color)
             
@@ -79,11 +143,40 @@ class VideoStream:
             if cv2.waitKey(1) & 0xFF == ord('q'):
                 break
 
-            await asyncio.sleep(1 / self.TARGET_FPS)
+            if time.perf_counter() - self.last_report >= self.REPORT_INTERVAL_S:
+                self._report()
 
+        self.grabber.stop()
+        self.worker.shutdown(wait=False)
         self.cap.release()
         cv2.destroyAllWindows()
         print("[VideoStream] Video capture stopped.")
+        self._report()
+        if self.ws_client.delta_encoder:
+            stats = self.ws_client.delta_encoder.stats()
+            if stats["frames"]:
+                print(f"[VideoStream] Delta coding: {stats['bytes_per_frame']:.0f} B/frame, "
+                      f"{stats['compression_ratio']:.1f}x vs float32 frames, "
+                      f"max error {stats['max_abs_error']:.1e}, {stats['keyframes']}/{stats['frames']} keyframes")
+
+    def _report(self) -> None:
+        """Print achieved FPS, capture-to-send latency, dropped frames, frame period / jitter and the pose graph rate."""
+        self.last_report = time.perf_counter()
+        latency = metrics.histogram("client.capture_to_send_ms").snapshot()
+        latency_text = f"p50={latency['p50']:.1f} ms p99={latency['p99']:.1f} ms" if latency["count"] else "n/a"
+        print(f"[VideoStream] {self._fps.value:.1f} FPS, capture-to-send {latency_text}, "
+              f"dropped: {metrics.counter('client.frames_skipped').value:.0f} camera frames, "
+              f"{metrics.counter('client.frames_dropped').value:.0f} queued frames")
+        period = metrics.histogram("client.frame_period_ms").snapshot()
+        if period["count"]:
+            jitter = metrics.histogram("client.frame_jitter_ms").snapshot()
+            print(f"[VideoStream] Frame period p50={period['p50']:.1f} ms p99={period['p99']:.1f} ms "
+                  f"(target {1000 / self.TARGET_FPS:.1f} ms), jitter p99={jitter['p99']:.1f} ms, "
+                  f"missed deadlines: {self.pacer.missed_deadlines}")
+        scheduler = self.extractor.pose_scheduler
+        if scheduler is not None and scheduler.run_fraction is not None:
+            print(f"[VideoStream] Pose graph ran on {scheduler.run_fraction:.0%} of frames "
+                  f"(held on {scheduler.holds} frames)")
 
     def _on_gesture_received(self, gesture: str):
         """Callback when a gesture command is received via WebSocket."""
@@ -0,0 +1,100 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any, Deque, NamedTuple, Optional, Union
+from shared import metrics
+from shared.config import CLIENT_SEND_POLICY, CLIENT_SEND_QUEUE_SIZE
+
+
+class RawFrame(NamedTuple):
+    """Landmark arrays queued for delta coding (protocol v3); encoded when the sender takes them."""
+    hands: Any  # float32 array or None
+    pose: Any  # float32 array or None
+    timestamp: float  # time.time() of the capture
+
+
+# Serialized JSON text / binary frame, or raw landmarks for the sender's delta encoder
+Payload = Union[str, bytes, RawFrame]
+
+
+class QueuedFrame(NamedTuple):
+    payload: Payload
+    enqueued_at: float  # time.perf_counter() when queued
+    captured_at: Optional[float]  # time.perf_counter() when the camera delivered it, if known
+
+# "latest": keep only the newest frame; "drop_oldest": bounded window, the oldest frame
+# makes room; "drop_newest": bounded FIFO that rejects new frames when full (old behaviour)
+SEND_POLICIES = ("latest", "drop_oldest", "drop_newest")
+
+
+class SendQueue:
+    """
+    Frames waiting for the websocket sender, with a configurable overflow policy.
+
+    Same surface as the asyncio.Queue it replaces (put_nowait / get / get_nowait /
+    task_done / join / qsize), but get() returns a QueuedFrame with the time the
+    frame was queued (and captured), so the sender can report how stale each frame
+    is when it finally goes out.
+    """
+    def __init__(self, maxsize: int = CLIENT_SEND_QUEUE_SIZE, policy: str = CLIENT_SEND_POLICY):
+        if policy not in SEND_POLICIES:
+            raise ValueError(f"Unknown send policy {policy!r}; expected one of {SEND_POLICIES}")
+        self.policy = policy
+        self.maxsize = 1 if policy == "latest" else maxsize
+        self._items: Deque[QueuedFrame] = deque()
+        self._not_empty = asyncio.Event()
+        self._unfinished = 0
+        self._all_done = asyncio.Event()
+        self._all_done.set()
+
+        self._dropped = metrics.counter("client.frames_dropped")
+        self._depth = metrics.gauge("client.send_queue_depth")
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def put_nowait(self, payload: Payload, captured_at: Optional[float] = None) -> bool:
+        """Queue a frame; returns False if a frame (this one or an older one) was dropped."""
+        accepted = True
+        if len(self._items) >= self.maxsize:
+            self._dropped.inc()
+            accepted = False
+            if self.policy == "drop_newest":
+                return accepted
+            self._items.popleft()
+            self._task_done()
+        self._items.append(QueuedFrame(payload, time.perf_counter(), captured_at))
+        self._unfinished += 1
+        self._all_done.clear()
+        self._not_empty.set()
+        self._depth.set(len(self._items))
+        return accepted
+
+    def get_nowait(self) -> QueuedFrame:
+        """Oldest queued frame; raises asyncio.QueueEmpty."""
+        if not self._items:
+            raise asyncio.QueueEmpty
+        item = self._items.popleft()
+        if not self._items:
+            self._not_empty.clear()
+        self._depth.set(len(self._items))
+        return item
+
+    async def get(self) -> QueuedFrame:
+        while not self._items:
+            await self._not_empty.wait()
+        return self.get_nowait()
+
+    def _task_done(self) -> None:
+        self._unfinished -= 1
+        if self._unfinished == 0:
+            self._all_done.set()
+
+    def task_done(self) -> None:
+        """Mark a frame returned by get() as sent."""
+        self._task_done()
+
+    async def join(self) -> None:
+        """Wait until every queued frame has been sent or dropped."""
+        await self._all_done.wait()
+
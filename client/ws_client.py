@@ -1,16 +1,44 @@
 import asyncio
 import websockets
 import json
-from typing import Optional
+import time
+from typing import List, Optional, Union
 from client.actions.action_executor import execute_action
+from client.send_queue import Payload, QueuedFrame, RawFrame, SendQueue
+from shared import metrics
+from shared.config import (
+    WIRE_PROTOCOL_VERSION, CLIENT_BATCHING, CLIENT_BATCH_MAX_FRAMES, CLIENT_BATCH_MAX_DELAY_MS,
+    CLIENT_SEND_POLICY, CLIENT_SEND_QUEUE_SIZE
+)
+from shared.delta_codec import DeltaEncoder, DELTA_PROTOCOL_VERSION
+from shared.schemas import MESSAGE_TYPE_RESYNC, MAX_BATCH_FRAMES, pack_batch
 
 class WebSocketClient:
-    def __init__(self, host: str = "127.0.0.1", port: int = 8765, client_id: str = "client", on_command_callback=None):
+    def __init__(self, host: str = "127.0.0.1", port: int = 8765, client_id: str = "client", on_command_callback=None,
+                 batching: Optional[bool] = None, batch_max_frames: int = CLIENT_BATCH_MAX_FRAMES,
+                 batch_max_delay_ms: float = CLIENT_BATCH_MAX_DELAY_MS, send_policy: str = CLIENT_SEND_POLICY,
+                 send_queue_size: int = CLIENT_SEND_QUEUE_SIZE):
         self.uri = f"ws://{host}:{port}"
         self.client_id = client_id
         self.websocket: Optional[websockets.WebSocketClientProtocol] = None
         self.on_command_callback = on_command_callback
-        self.message_queue = asyncio.Queue(maxsize=30) # Buffer approx 1 sec at 30fps
+        # Overflow policy decides which frames a slow link drops (CLIENT_SEND_POLICY)
+        self.message_queue = SendQueue(send_queue_size, send_policy)
+        # Delta coding (protocol v3): stateful, so it lives with the connection. Frames are
+        # queued raw and encoded as they are sent, so frames the queue drops never break the chain
+        self.delta_encoder = DeltaEncoder(client_id) if WIRE_PROTOCOL_VERSION == DELTA_PROTOCOL_VERSION else None
+        # Coalescing: whatever is queued when the sender wakes up goes out as one batch message
+        self.batching = CLIENT_BATCHING if batching is None else batching
+        self.batch_max_frames = min(batch_max_frames, MAX_BATCH_FRAMES)
+        self.batch_max_delay = batch_max_delay_ms / 1000
+
+        self._messages_sent = metrics.counter("client.messages_sent")
+        self._frames_sent = metrics.counter("client.frames_sent")
+        self._bytes_sent = metrics.counter("client.bytes_sent")
+        self._batch_size = metrics.histogram("client.batch_size", buckets=metrics.SIZE_BUCKETS)
+        # Time each sent frame spent in the queue: end-to-end freshness on the client side
+        self._queue_age = metrics.histogram("client.queue_age_ms")
+        self._capture_to_send = metrics.histogram("client.capture_to_send_ms")
 
     async def connect_and_listen(self) -> None:
         """Establish WebSocket connection and manage send/receive loops."""
@@ -30,26 +58,70 @@ class WebSocketClient:
         except Exception as e:
             print(f"[WebSocket] Connection error: {e}")
 
-    async def send_data(self, data_json: str) -> None:
-        """Queue serialized landmarks for sending (Non-blocking)."""
+    async def send_data(self, data_json: Payload, captured_at: Optional[float] = None) -> None:
+        """
+        Queue landmarks for sending (Non-blocking): JSON text, a binary frame, or a RawFrame
+        for the delta encoder. captured_at is the perf_counter() time the camera frame
+        arrived, for capture-to-send latency.
+        """
         if self.websocket:
+            # A full queue drops a frame according to the send policy
+            self.message_queue.put_nowait(data_json, captured_at)
+
+    def _encode(self, payload: Payload) -> Optional[Union[str, bytes]]:
+        """Wire message for a dequeued payload: raw frames are delta-coded in send order."""
+        if isinstance(payload, RawFrame):
+            return self.delta_encoder.encode(payload.hands, payload.pose, payload.timestamp)
+        return payload
+
+    async def _next_batch(self) -> List[QueuedFrame]:
+        """
+        Wait for one frame, then take up to batch_max_frames - 1 more that are already
+        queued, or that arrive within batch_max_delay of the first one.
+        """
+        frames = [await self.message_queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.batch_max_delay
+        while len(frames) < self.batch_max_frames:
             try:
-                # If queue is full, drop the oldest frame (or just fail to put new one)
-                # Dropping new frame is better for real-time (keep latency low)
-                self.message_queue.put_nowait(data_json)
-            except asyncio.QueueFull:
-                # print("[WebSocket] Drop frame (Queue Full)")
-                pass
-            except Exception:
+                frames.append(self.message_queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
                 pass
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                frames.append(await asyncio.wait_for(self.message_queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return frames
 
     async def _sender_loop(self) -> None:
         """Consume queue and send messages."""
         while self.websocket and self.websocket.open:
             try:
-                data_json = await self.message_queue.get()
-                await self.websocket.send(data_json)
-                self.message_queue.task_done()
+                if self.batching:
+                    frames = await self._next_batch()
+                else:
+                    frames = [await self.message_queue.get()]
+                payloads = [self._encode(queued.payload) for queued in frames]
+                payloads = [payload for payload in payloads if payload is not None]
+                if payloads:
+                    message = payloads[0] if len(payloads) == 1 else pack_batch(payloads)
+                    await self.websocket.send(message)
+                sent_at = time.perf_counter()
+                for queued in frames:
+                    self._queue_age.observe((sent_at - queued.enqueued_at) * 1000)
+                    if queued.captured_at is not None:
+                        self._capture_to_send.observe((sent_at - queued.captured_at) * 1000)
+                    self.message_queue.task_done()
+                if not payloads:
+                    continue
+                self._messages_sent.inc()
+                self._frames_sent.inc(len(payloads))
+                self._bytes_sent.inc(len(message))
+                self._batch_size.observe(len(payloads))
             except websockets.exceptions.ConnectionClosedOK:
                 break
             except Exception as e:
@@ -63,6 +135,11 @@ class WebSocketClient:
                 command_json = await self.websocket.recv()
                 command = json.loads(command_json)
                 
+                if command.get("type") == MESSAGE_TYPE_RESYNC:
+                    if self.delta_encoder:
+                        self.delta_encoder.request_keyframe()
+                    continue
+
                 gesture = command.get("gesture")
                 if gesture:
                     execute_action(gesture)
@@ -0,0 +1,39 @@
+import os
+import sys
+import glob
+from typing import List
+
+import tensorflow as tf
+
+MODELS_PATH = os.path.join(os.path.dirname(__file__), '../models')
+
+class FlexOpsError(RuntimeError):
+    """A TFLite model needs the Flex delegate (i.e. full TensorFlow) to run."""
+
+def find_flex_ops(model_content: bytes) -> List[str]:
+    """Names of the Select TF (Flex) ops used by a TFLite model."""
+    interpreter = tf.lite.Interpreter(model_content=model_content)
+    return sorted({op['op_name'] for op in interpreter._get_ops_details() if op['op_name'].startswith('Flex')})
+
+def assert_builtins_only(model_content: bytes, name: str) -> None:
+    """Fail the export if the model would not run on tflite_runtime alone."""
+    flex_ops = find_flex_ops(model_content)
+    if flex_ops:
+        raise FlexOpsError(f"{name} uses Flex ops {flex_ops}; the server cannot run it without TensorFlow")
+
+def main():
+    """Check every exported model (or the paths given): exit code 1 if any uses Flex ops."""
+    paths = sys.argv[1:] or sorted(glob.glob(os.path.join(MODELS_PATH, '*.tflite')))
+    failed = False
+    for path in paths:
+        with open(path, 'rb') as f:
+            try:
+                assert_builtins_only(f.read(), os.path.basename(path))
+                print(f"OK   {path}")
+            except FlexOpsError as e:
+                print(f"FAIL {e}")
+                failed = True
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+import os
+import sys
+import time
+import numpy as np
+import tensorflow as tf
+import json
+
+# Add project root to path to import shared config
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+from shared.config import BUFFER_SIZE
+from preprocess import TRAINING_DATA_PATH, load_data as load_raw_sequences, normalize_frame
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), '../data')
+MODELS_PATH = os.path.join(os.path.dirname(__file__), '../models')
+
+NUM_PARITY_WINDOWS = 200
+NUM_LATENCY_RUNS = 500
+
+def load_data():
+    X = np.load(os.path.join(DATA_PATH, 'X_train.npy')).astype(np.float32)
+    with open(os.path.join(DATA_PATH, 'label_map.json'), 'r') as f:
+        label_map = json.load(f)
+    return X, label_map
+
+class WindowedRunner:
+    """gesture_model.tflite: one invoke per [1, 20, 162] window."""
+    def __init__(self, path):
+        self.interpreter = tf.lite.Interpreter(model_path=path)
+        self.interpreter.allocate_tensors()
+        self.input_index = self.interpreter.get_input_details()[0]['index']
+        self.output_index = self.interpreter.get_output_details()[0]['index']
+
+    def __call__(self, window):
+        self.interpreter.set_tensor(self.input_index, window[np.newaxis])
+        self.interpreter.invoke()
+        return self.interpreter.get_tensor(self.output_index)[0]
+
+class StepRunner:
+    """gesture_model_step.tflite: one invoke per frame, carrying the hidden state."""
+    def __init__(self, path):
+        interpreter = tf.lite.Interpreter(model_path=path)
+        self.runner = interpreter.get_signature_runner()
+        self.state_size = self.runner.get_input_details()['state']['shape'][-1]
+
+    def initial_state(self):
+        return np.zeros((1, self.state_size), dtype=np.float32)
+
+    def __call__(self, frame, state):
+        outputs = self.runner(frame=frame.reshape(1, 1, -1), state=state)
+        return outputs['probabilities'][0], outputs['next_state']
+
+def check_window_parity(windowed, step, X):
+    """Stepping through a window from a zero state must reproduce the windowed output."""
+    indices = np.random.default_rng(0).choice(len(X), min(NUM_PARITY_WINDOWS, len(X)), replace=False)
+    max_diff = 0.0
+    agree = 0
+    for i in indices:
+        expected = windowed(X[i])
+        state = step.initial_state()
+        for frame in X[i]:
+            probabilities, state = step(frame, state)
+        max_diff = max(max_diff, float(np.max(np.abs(probabilities - expected))))
+        agree += int(np.argmax(probabilities) == np.argmax(expected))
+
+    print("\n--- Window Parity (zero initial state) ---")
+    print(f"Windows checked: {len(indices)}")
+    print(f"Argmax agreement: {agree}/{len(indices)}")
+    print(f"Max |p_stream - p_window|: {max_diff:.2e}")
+
+def check_continuous_agreement(windowed, step):
+    """
+    Deployment behaviour: the server streams every frame with a state that is never
+    reset between windows. Compare it with the windowed model on the last 20 frames.
+    """
+    sequences, _ = load_raw_sequences(TRAINING_DATA_PATH)
+    if not sequences:
+        print("\nNo raw sequences found; skipping continuous agreement check.")
+        return
+
+    compared = 0
+    agree = 0
+    for sequence in sequences:
+        frames = np.array([normalize_frame(frame) for frame in sequence], dtype=np.float32)
+        state = step.initial_state()
+        for t, frame in enumerate(frames):
+            probabilities, state = step(frame, state)
+            if t + 1 >= BUFFER_SIZE:
+                expected = windowed(frames[t + 1 - BUFFER_SIZE:t + 1])
+                agree += int(np.argmax(probabilities) == np.argmax(expected))
+                compared += 1
+
+    print("\n--- Continuous Streaming vs Windowed ---")
+    print(f"Sequences: {len(sequences)}, frames compared: {compared}")
+    print(f"Argmax agreement: {agree / max(compared, 1) * 100:.2f}%")
+
+def compare_latency(windowed, step, X):
+    window = X[0]
+    frame = X[0][-1]
+    state = step.initial_state()
+
+    start = time.perf_counter()
+    for _ in range(NUM_LATENCY_RUNS):
+        windowed(window)
+    window_ms = (time.perf_counter() - start) * 1000 / NUM_LATENCY_RUNS
+
+    start = time.perf_counter()
+    for _ in range(NUM_LATENCY_RUNS):
+        _, state = step(frame, state)
+    step_ms = (time.perf_counter() - start) * 1000 / NUM_LATENCY_RUNS
+
+    print("\n--- Latency ---")
+    print(f"Windowed invoke ({BUFFER_SIZE} frames): {window_ms:.3f} ms")
+    print(f"Streaming step (1 frame):          {step_ms:.3f} ms")
+    print(f"Per-frame evaluation cost ratio:   x{window_ms / step_ms:.1f}")
+
+def main():
+    windowed = WindowedRunner(os.path.join(MODELS_PATH, 'gesture_model.tflite'))
+    step = StepRunner(os.path.join(MODELS_PATH, 'gesture_model_step.tflite'))
+    X, _ = load_data()
+    print(f"Loaded {len(X)} windows.")
+
+    check_window_parity(windowed, step, X)
+    check_continuous_agreement(windowed, step)
+    compare_latency(windowed, step, X)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+import os
+import sys
+import time
+import json
+import numpy as np
+import tensorflow as tf
+from sklearn.model_selection import train_test_split
+
+# Add project root to path to import shared config and the server's model loader
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+from server.modules.model_loader import GestureModel
+from check_tflite_ops import assert_builtins_only
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), '../data')
+MODELS_PATH = os.path.join(os.path.dirname(__file__), '../models')
+
+NUM_CALIBRATION_WINDOWS = 300
+NUM_LATENCY_RUNS = 300
+
+def load_data():
+    X = np.load(os.path.join(DATA_PATH, 'X_train.npy')).astype(np.float32)
+    y = np.load(os.path.join(DATA_PATH, 'y_train.npy'))
+    with open(os.path.join(DATA_PATH, 'label_map.json'), 'r') as f:
+        label_map = json.load(f)
+    return X, y, label_map
+
+def convert_to_int8(model, X_calibration):
+    """
+    Full-integer post-training quantization: int8 weights and activations, int8 model
+    input and output. Activation ranges are calibrated on X_calibration windows.
+    """
+    run_model = tf.function(lambda x: model(x, training=False))
+    concrete_func = run_model.get_concrete_function(
+        tf.TensorSpec([None, X_calibration.shape[1], X_calibration.shape[2]], tf.float32)
+    )
+    converter = tf.lite.TFLiteConverter.from_concrete_functions([concrete_func], model)
+
+    def representative_dataset():
+        for window in X_calibration:
+            yield [window[np.newaxis]]
+
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    converter.representative_dataset = representative_dataset
+    # Fail the conversion instead of silently keeping float ops
+    converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+    converter.inference_input_type = tf.int8
+    converter.inference_output_type = tf.int8
+
+    tflite_model = converter.convert()
+    assert_builtins_only(tflite_model, 'gesture_model_int8.tflite')
+    return tflite_model
+
+def per_class_accuracy(model, X, y, num_classes):
+    predictions = np.argmax(model.predict_probabilities(X), axis=1)
+    accuracy = {}
+    for class_idx in range(num_classes):
+        mask = y == class_idx
+        if mask.any():
+            accuracy[class_idx] = float(np.mean(predictions[mask] == class_idx))
+    return accuracy, float(np.mean(predictions == y))
+
+def window_latency_ms(model, window):
+    model.predict(window)
+    start = time.perf_counter()
+    for _ in range(NUM_LATENCY_RUNS):
+        model.predict(window)
+    return (time.perf_counter() - start) * 1000 / NUM_LATENCY_RUNS
+
+def main():
+    print("Loading data...")
+    try:
+        X, y, label_map = load_data()
+    except FileNotFoundError:
+        print("Data not found. Run preprocess.py first.")
+        return
+
+    # Same split as train.py: calibrate on training windows, report on validation windows
+    X_train, X_val, y_train, y_val = train_test_split(X, y, test_size=0.2, random_state=42)
+    rng = np.random.default_rng(0)
+    calibration = X_train[rng.choice(len(X_train), min(NUM_CALIBRATION_WINDOWS, len(X_train)), replace=False)]
+
+    print(f"Calibrating int8 quantization on {len(calibration)} training windows...")
+    model = tf.keras.models.load_model(os.path.join(MODELS_PATH, 'gesture_model.keras'))
+    float_path = os.path.join(MODELS_PATH, 'gesture_model.tflite')
+    int8_path = os.path.join(MODELS_PATH, 'gesture_model_int8.tflite')
+    with open(int8_path, 'wb') as f:
+        f.write(convert_to_int8(model, calibration))
+    print(f"Quantized model saved to {int8_path}")
+
+    # Evaluate both variants through the server's loader (int8 scale handling included)
+    float_model = GestureModel(float_path, backend="tflite", interpreter_settings={"pool_size": 1})
+    int8_model = GestureModel(int8_path, backend="tflite", interpreter_settings={"pool_size": 1})
+
+    num_classes = len(label_map)
+    float_acc, float_total = per_class_accuracy(float_model, X_val, y_val, num_classes)
+    int8_acc, int8_total = per_class_accuracy(int8_model, X_val, y_val, num_classes)
+
+    report = {
+        "validation_windows": int(len(X_val)),
+        "calibration_windows": int(len(calibration)),
+        "accuracy": {"float": float_total, "int8": int8_total, "delta": int8_total - float_total},
+        "per_class": {
+            label_map.get(str(idx), str(idx)): {
+                "float": float_acc[idx], "int8": int8_acc[idx], "delta": int8_acc[idx] - float_acc[idx]
+            }
+            for idx in float_acc
+        },
+        "size_kb": {"float": os.path.getsize(float_path) / 1024, "int8": os.path.getsize(int8_path) / 1024},
+        "latency_ms": {
+            "float": window_latency_ms(float_model, X_val[0]),
+            "int8": window_latency_ms(int8_model, X_val[0]),
+        },
+    }
+
+    print("\n--- Quantization Report ---")
+    print(f"{'Class':<30} {'float':>7} {'int8':>7} {'delta':>7}")
+    for name, row in report["per_class"].items():
+        print(f"{name:<30} {row['float']:>7.3f} {row['int8']:>7.3f} {row['delta']:>+7.3f}")
+    accuracy = report["accuracy"]
+    print(f"{'Overall':<30} {accuracy['float']:>7.3f} {accuracy['int8']:>7.3f} {accuracy['delta']:>+7.3f}")
+    print(f"Model size: {report['size_kb']['float']:.1f} KB -> {report['size_kb']['int8']:.1f} KB")
+    print(f"Per-window latency: {report['latency_ms']['float']:.3f} ms -> {report['latency_ms']['int8']:.3f} ms")
+
+    report_path = os.path.join(MODELS_PATH, 'quantization_report.json')
+    with open(report_path, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Report saved to {report_path}")
+
+if __name__ == "__main__":
+    main()
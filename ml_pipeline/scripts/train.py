@@ -2,13 +2,14 @@ import os
 import sys
 import numpy as np
 import tensorflow as tf
-from tensorflow.keras.models import Sequential
-from tensorflow.keras.layers import GRU, Dense, Dropout, Input
+from tensorflow.keras.models import Model, Sequential
+from tensorflow.keras.layers import GRU, Activation, Dense, Dropout, Input
 from sklearn.model_selection import train_test_split
 
 # Add project root to path to import shared config
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
 from shared.config import BUFFER_SIZE
+from check_tflite_ops import assert_builtins_only
 
 DATA_PATH = os.path.join(os.path.dirname(__file__), '../data')
 MODELS_PATH = os.path.join(os.path.dirname(__file__), '../models')
@@ -34,6 +35,67 @@ def build_model(input_shape, num_classes):
                   metrics=['accuracy'])
     return model
 
+def build_step_model(model, num_features, num_classes):
+    """
+    Single-step stateful variant of the trained model for streaming inference.
+    Inputs 'frame' [1, 1, Features] and 'state' [1, Units]; outputs 'probabilities'
+    and the next 'next_state'. Weights are copied from the windowed model, so
+    stepping through a window from a zero state reproduces its prediction.
+    """
+    gru_layer = next(layer for layer in model.layers if isinstance(layer, GRU))
+    dense_layers = [layer for layer in model.layers if isinstance(layer, Dense)]
+
+    frame_in = Input(shape=(1, num_features), batch_size=1, name='frame')
+    state_in = Input(shape=(gru_layer.units,), batch_size=1, name='state')
+    step_gru = GRU(gru_layer.units, return_state=True, unroll=True)
+    gru_out, new_state = step_gru(frame_in, initial_state=state_in)
+    step_dense = Dense(dense_layers[0].units, activation='relu')
+    step_out = Dense(num_classes, activation='softmax', name='probabilities')
+    probabilities = step_out(step_dense(gru_out))
+    next_state = Activation('linear', name='next_state')(new_state)
+
+    step_model = Model(inputs=[frame_in, state_in], outputs=[probabilities, next_state])
+    step_gru.set_weights(gru_layer.get_weights())
+    step_dense.set_weights(dense_layers[0].get_weights())
+    step_out.set_weights(dense_layers[1].get_weights())
+    return step_model
+
+def export_numpy_weights(model, path):
+    """
+    Save the trained weights as .npz for the server's numpy backend
+    (server/modules/numpy_backend.py), which serves the model without TensorFlow.
+    """
+    gru_layer = next(layer for layer in model.layers if isinstance(layer, GRU))
+    dense_layers = [layer for layer in model.layers if isinstance(layer, Dense)]
+    # GRU weights: kernel [Features, 3U], recurrent kernel [U, 3U], bias [2, 3U] (reset_after=True)
+    gru_kernel, gru_recurrent_kernel, gru_bias = gru_layer.get_weights()
+    dense_kernel, dense_bias = dense_layers[0].get_weights()
+    output_kernel, output_bias = dense_layers[1].get_weights()
+    np.savez(path,
+             gru_kernel=gru_kernel,
+             gru_recurrent_kernel=gru_recurrent_kernel,
+             gru_bias=gru_bias,
+             dense_kernel=dense_kernel,
+             dense_bias=dense_bias,
+             output_kernel=output_kernel,
+             output_bias=output_bias,
+             time_steps=np.int32(model.input_shape[1]))
+
+def convert_to_tflite(converter, name):
+    """
+    Apply the project's TFLite conversion settings and convert.
+    Builtin ops only: the GRU is unrolled (unroll=True) into fully-connected and
+    elementwise builtins, so the model runs on tflite_runtime without the Flex
+    delegate. Conversion fails if any op still needs TensorFlow.
+    """
+    # Optimization (optional but recommended for mobile/edge)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS]
+
+    tflite_model = converter.convert()
+    assert_builtins_only(tflite_model, name)
+    return tflite_model
+
 def main():
     print("Loading data...")
     try:
@@ -67,19 +129,20 @@ def main():
     
     # Save standard model
     model.save(os.path.join(MODELS_PATH, 'gesture_model.keras'))
+
+    weights_path = os.path.join(MODELS_PATH, 'gesture_model.npz')
+    export_numpy_weights(model, weights_path)
+    print(f"NumPy weights saved to {weights_path}")
     
     print("Converting to TFLite...")
-    converter = tf.lite.TFLiteConverter.from_keras_model(model)
-    
-    # Optimization (optional but recommended for mobile/edge)
-    converter.optimizations = [tf.lite.Optimize.DEFAULT]
-    converter.target_spec.supported_ops = [
-        tf.lite.OpsSet.TFLITE_BUILTINS, # enable TensorFlow Lite ops.
-        tf.lite.OpsSet.SELECT_TF_OPS # enable TensorFlow ops.
-    ]
-    converter._experimental_lower_tensor_list_ops = False
-    
-    tflite_model = converter.convert()
+    # Export with a dynamic batch dimension ([None, BUFFER_SIZE, Features]) so the
+    # server can run several sessions' windows in one invoke (see BatchScheduler).
+    run_model = tf.function(lambda x: model(x, training=False))
+    concrete_func = run_model.get_concrete_function(
+        tf.TensorSpec([None, input_shape[0], input_shape[1]], tf.float32)
+    )
+    converter = tf.lite.TFLiteConverter.from_concrete_functions([concrete_func], model)
+    tflite_model = convert_to_tflite(converter, 'gesture_model.tflite')
     
     tflite_path = os.path.join(MODELS_PATH, 'gesture_model.tflite')
     with open(tflite_path, 'wb') as f:
@@ -87,5 +150,17 @@ def main():
         
     print(f"TFLite model saved to {tflite_path}")
 
+    interpreter = tf.lite.Interpreter(model_content=tflite_model)
+    print(f"Input shape signature: {interpreter.get_input_details()[0]['shape_signature']}")
+
+    print("Converting single-step streaming model to TFLite...")
+    step_model = build_step_model(model, input_shape[1], num_classes)
+    converter = tf.lite.TFLiteConverter.from_keras_model(step_model)
+    step_path = os.path.join(MODELS_PATH, 'gesture_model_step.tflite')
+    with open(step_path, 'wb') as f:
+        f.write(convert_to_tflite(converter, 'gesture_model_step.tflite'))
+
+    print(f"Streaming TFLite model saved to {step_path}")
+
 if __name__ == "__main__":
     main()
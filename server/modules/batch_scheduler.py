@@ -0,0 +1,109 @@
+import asyncio
+import time
+from concurrent.futures import Executor
+import numpy as np
+from typing import List, Optional, Tuple
+from shared import metrics
+from shared.config import BATCH_MAX_SIZE, BATCH_MAX_WAIT_MS
+from server.modules.model_loader import GestureModel, get_session_model
+
+
+class BatchScheduler:
+    """
+    Cross-session micro-batching for model inference.
+
+    Sessions await predict() with their own window; pending windows are collected
+    until BATCH_MAX_SIZE are queued or the oldest has waited BATCH_MAX_WAIT_MS, then
+    run as a single [N, 20, 162] invoke and each caller receives its own result.
+    Must be used from a single event loop; when an executor is given the invoke
+    itself runs there instead of on the loop. If the invoke raises, every caller of
+    that batch receives the exception.
+    Without a model, the shared session model is looked up on every flush, which
+    follows background warmup and hot reloads.
+    """
+    def __init__(self, model: Optional[GestureModel] = None, max_batch_size: int = BATCH_MAX_SIZE,
+                 max_wait_ms: float = BATCH_MAX_WAIT_MS, executor: Optional[Executor] = None):
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.executor = executor
+
+        self._pending: List[Tuple[np.ndarray, asyncio.Future, float]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # Model time per window of the latest batch (excludes queueing), for the prediction cache
+        self.window_ms = 0.0
+
+        self._batch_size = metrics.histogram("scheduler.batch_size", buckets=metrics.SIZE_BUCKETS)
+        self._queue_wait = metrics.histogram("scheduler.queue_wait_ms")
+
+    async def predict(self, landmark_buffer) -> Tuple[Optional[str], float]:
+        """Queue one window and wait for its batched prediction."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        window = np.asarray(landmark_buffer, dtype=np.float32)
+        self._pending.append((window, future, time.perf_counter()))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait_ms / 1000, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """Run every pending window as one batch and resolve the callers."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        flush_time = time.perf_counter()
+        for _, _, queued_at in batch:
+            self._queue_wait.observe((flush_time - queued_at) * 1000)
+        self._batch_size.observe(len(batch))
+
+        windows = np.stack([window for window, _, _ in batch])
+        model = self.model if self.model is not None else get_session_model(streaming=False)
+        if self.executor is None:
+            # Runs inside a call_later callback: an escaping error would leave the batch waiting forever
+            try:
+                timed_results = self._timed_predict(model, windows)
+            except Exception as e:
+                self._fail(batch, e)
+                return
+            self._resolve(batch, timed_results)
+            return
+
+        loop = asyncio.get_running_loop()
+        pending = loop.run_in_executor(self.executor, self._timed_predict, model, windows)
+        pending.add_done_callback(lambda done: self._resolve_from(batch, done))
+
+    @staticmethod
+    def _timed_predict(model: GestureModel, windows: np.ndarray):
+        start = time.perf_counter()
+        results = model.predict_batch(windows)
+        return results, (time.perf_counter() - start) * 1000
+
+    def _resolve_from(self, batch, done: asyncio.Future) -> None:
+        if done.cancelled():
+            self._fail(batch, asyncio.CancelledError())
+        elif done.exception() is not None:
+            self._fail(batch, done.exception())
+        else:
+            self._resolve(batch, done.result())
+
+    @staticmethod
+    def _fail(batch, error: BaseException) -> None:
+        for _, future, _ in batch:
+            if not future.done():
+                future.set_exception(error)
+
+    def _resolve(self, batch, timed_results) -> None:
+        results, invoke_ms = timed_results
+        self.window_ms = invoke_ms / len(batch)
+        for (_, future, _), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
@@ -0,0 +1,49 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from shared import metrics
+from shared.config import INFERENCE_EXECUTOR, EXECUTOR_MAX_WORKERS, LOOP_LAG_INTERVAL_MS
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_executor() -> Optional[ThreadPoolExecutor]:
+    """
+    Return the process-wide pool for CPU-bound frame processing, or None when
+    INFERENCE_EXECUTOR is "inline".
+    NumPy and TFLite's invoke() release the GIL, so threads overlap the heavy parts.
+    """
+    global _executor
+    if INFERENCE_EXECUTOR == "inline":
+        return None
+    if INFERENCE_EXECUTOR != "thread":
+        raise ValueError(f"Unsupported INFERENCE_EXECUTOR: {INFERENCE_EXECUTOR}")
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=EXECUTOR_MAX_WORKERS, thread_name_prefix="inference")
+    return _executor
+
+
+def shutdown_executor() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+        _executor = None
+
+
+class LoopLagMonitor:
+    """
+    Measures how late the event loop wakes up from a fixed sleep.
+    Anything above zero is time the loop spent blocked on other work.
+    """
+    def __init__(self, interval_ms: float = LOOP_LAG_INTERVAL_MS):
+        self.interval_ms = interval_ms
+        self._lag = metrics.histogram("server.event_loop_lag_ms")
+
+    async def run(self) -> None:
+        interval = self.interval_ms / 1000
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(interval)
+            lag = time.perf_counter() - start - interval
+            self._lag.observe(max(0.0, lag) * 1000)
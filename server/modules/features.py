@@ -0,0 +1,104 @@
+import math
+import numpy as np
+from typing import Optional
+from shared.config import SMOOTHING_WINDOW, NUM_FEATURES
+from server.modules.ring_buffer import FrameRingBuffer
+
+HAND_FEATURES = 21 * 3
+POSE_FEATURES = 33 * 3
+
+# Recompute the smoothing running sum from scratch this often to cancel float drift
+RESUM_INTERVAL = 1024
+
+
+class FeatureKernel:
+    """
+    Per-frame feature pipeline: raw hand and pose floats -> smoothed, normalized 162-vector.
+
+    Hand smoothing keeps a running sum over the last SMOOTHING_WINDOW frames, and every
+    intermediate array is preallocated, so a frame costs no list round-trips and no
+    temporary arrays. Returned arrays are owned by the kernel and are only valid
+    until the next frame.
+    """
+    def __init__(self, smoothing_window: int = SMOOTHING_WINDOW):
+        # Smoothing state (float64 so the running sum stays accurate)
+        self.history = FrameRingBuffer(smoothing_window, HAND_FEATURES, dtype=np.float64)
+        self._running_sum = np.zeros(HAND_FEATURES, dtype=np.float64)
+        self._hand_in = np.zeros(HAND_FEATURES, dtype=np.float64)
+        self._smoothed = np.zeros(HAND_FEATURES, dtype=np.float64)
+        self._appends = 0
+
+        # Normalization scratch space
+        self._pose_in = np.zeros(POSE_FEATURES, dtype=np.float64)
+        self._rel_hands = np.zeros((21, 3), dtype=np.float64)
+        self._rel_pose = np.zeros((33, 3), dtype=np.float64)
+        self._squared = np.zeros((21, 3), dtype=np.float64)
+        self._dist_sq = np.zeros(21, dtype=np.float64)
+        self._midpoint = np.zeros(3, dtype=np.float64)
+        self._shoulder_vec = np.zeros(3, dtype=np.float64)
+
+        # Output vector and views of its hand / pose halves
+        self.features = np.zeros(NUM_FEATURES, dtype=np.float32)
+        self._hand_out = self.features[:HAND_FEATURES].reshape(21, 3)
+        self._pose_out = self.features[HAND_FEATURES:].reshape(33, 3)
+
+    def smooth(self, hands) -> np.ndarray:
+        """Add one hand frame (63 floats) to the moving average and return the average."""
+        self._hand_in[:] = hands[:HAND_FEATURES]
+
+        if len(self.history) == self.history.maxlen:
+            self._running_sum -= self.history[0]
+        self.history.append(self._hand_in)
+        self._running_sum += self._hand_in
+
+        self._appends += 1
+        if self._appends % RESUM_INTERVAL == 0:
+            np.sum(self.history.window(), axis=0, out=self._running_sum)
+
+        np.divide(self._running_sum, len(self.history), out=self._smoothed)
+        return self._smoothed
+
+    def normalize_hands(self, hands: np.ndarray, out: np.ndarray) -> None:
+        """Hands: relative to wrist, scaled by max dist to wrist. Writes a (21, 3) result into out."""
+        points = hands.reshape(21, 3)
+        np.subtract(points, points[0], out=self._rel_hands)
+        np.multiply(self._rel_hands, self._rel_hands, out=self._squared)
+        np.sum(self._squared, axis=1, out=self._dist_sq)
+        max_dist = math.sqrt(self._dist_sq.max())
+        if max_dist > 0:
+            np.divide(self._rel_hands, max_dist, out=out, casting='same_kind')
+        else:
+            out[:] = self._rel_hands
+
+    def normalize_pose(self, pose, out: np.ndarray) -> None:
+        """Pose: relative to shoulder midpoint, scaled by shoulder width. Writes a (33, 3) result into out."""
+        self._pose_in[:] = pose[:POSE_FEATURES]
+        points = self._pose_in.reshape(33, 3)
+        # Midpoint of shoulders (11 and 12)
+        np.add(points[11], points[12], out=self._midpoint)
+        self._midpoint *= 0.5
+        np.subtract(points, self._midpoint, out=self._rel_pose)
+
+        np.subtract(points[11], points[12], out=self._shoulder_vec)
+        shoulder_dist = math.sqrt(self._shoulder_vec.dot(self._shoulder_vec))
+        if shoulder_dist > 0:
+            np.divide(self._rel_pose, shoulder_dist, out=out, casting='same_kind')
+        else:
+            out[:] = self._rel_pose
+
+    def normalize(self, hands: Optional[np.ndarray], pose) -> np.ndarray:
+        """
+        Build the 162-feature model input (63 hands + 99 pose) from smoothed hands and
+        raw pose. Missing or short inputs become zeros, as in training.
+        """
+        if hands is None or len(hands) < HAND_FEATURES:
+            self._hand_out.fill(0.0)
+        else:
+            self.normalize_hands(hands, self._hand_out)
+
+        if pose is None or len(pose) < POSE_FEATURES:
+            self._pose_out.fill(0.0)
+        else:
+            self.normalize_pose(pose, self._pose_out)
+
+        return self.features
@@ -1,13 +1,20 @@
-from collections import deque
 import numpy as np
+import asyncio
 import time
-from typing import Tuple, Optional, Dict, List
+from concurrent.futures import Executor
+from typing import Awaitable, Callable, Tuple, Optional, Dict
+from shared import metrics
 from shared.config import (
     PINCH_THRESHOLD_3D, VOLUME_MOVE_THRESHOLD, FIST_DISTANCE_THRESHOLD,
     COOLDOWN, GESTURE_STABILITY_FRAMES, BUFFER_SIZE, SMOOTHING_WINDOW,
-    MODEL_CONFIDENCE_THRESHOLD, INFERENCE_INTERVAL, GESTURE_THRESHOLDS
+    MODEL_CONFIDENCE_THRESHOLD, INFERENCE_INTERVAL, GESTURE_THRESHOLDS, STREAMING_INFERENCE,
+    NUM_FEATURES, PREDICTION_CACHE, STREAMING_STATE_MAX_FRAMES
 )
-from server.modules.model_loader import GestureModel
+from server.modules.model_loader import GestureModel, get_session_model
+from server.modules.shadow import ShadowEvaluator
+from server.modules.prediction_cache import PredictionCache, Prediction
+from server.modules.ring_buffer import FrameRingBuffer
+from server.modules.features import FeatureKernel, HAND_FEATURES
 
 class GestureProcessor:
     """
@@ -15,7 +22,8 @@ class GestureProcessor:
     Now supports normalization, smoothing, and ML-readiness.
     """
     
-    def __init__(self):
+    def __init__(self, model: Optional[GestureModel] = None, streaming: Optional[bool] = None,
+                 shadow: Optional[ShadowEvaluator] = None, prediction_cache: Optional[bool] = None):
         self.last_action_time = 0
         self.last_index_y: Optional[float] = None
         self.current_stable_gesture: Optional[str] = None
@@ -23,9 +31,69 @@ class GestureProcessor:
         self.frame_counter = 0
         
         # ML & Data Processing
-        self.history = deque(maxlen=SMOOTHING_WINDOW)
-        self.landmark_buffer = deque(maxlen=BUFFER_SIZE)
-        self.model = GestureModel()
+        # Fused smoothing + normalization with preallocated state; history holds raw hand frames
+        self.kernel = FeatureKernel(SMOOTHING_WINDOW)
+        self.history = self.kernel.history
+        # Preallocated (BUFFER_SIZE, NUM_FEATURES) float32 window, written in place
+        self.landmark_buffer = FrameRingBuffer(BUFFER_SIZE, NUM_FEATURES)
+        # The model is shared process-wide; sessions only own their buffers.
+        # It is None while a background warmup is still loading it (heuristics only until then).
+        # Sessions on the shared model follow hot reloads (see ModelReloader).
+        self.streaming = STREAMING_INFERENCE if streaming is None else streaming
+        self._follow_shared_model = model is None
+        self.model = model if model is not None else get_session_model(self.streaming)
+
+        # Streaming mode: per-session GRU hidden state and the latest per-frame prediction
+        self.hidden_state = None
+        self._state_steps = 0  # Frames the hidden state has seen since it was last reset
+        self._hand_present = False
+        if self.streaming and self.model is not None:
+            self._reset_hidden_state()
+        self._stream_prediction: Tuple[Optional[str], float] = (None, 0.0)
+        # Optional candidate model fed a sample of this session's windows in the background
+        self.shadow = shadow
+        # Optional memo of recent window predictions (windowed inference only)
+        use_cache = PREDICTION_CACHE if prediction_cache is None else prediction_cache
+        self.prediction_cache = PredictionCache() if use_cache and not self.streaming else None
+
+        # Session metrics
+        self.created_at = time.perf_counter()
+        self.first_inference_ms: Optional[float] = None
+
+    def memory_footprint(self) -> int:
+        """Approximate bytes held by this session's buffers (the shared model is excluded)."""
+        total = self.history.nbytes + self.landmark_buffer.nbytes + self.kernel.features.nbytes
+        if self.hidden_state is not None:
+            total += self.hidden_state.nbytes
+        if self.prediction_cache is not None:
+            total += self.prediction_cache.nbytes
+        return total
+
+    def _record_first_inference(self) -> None:
+        if self.first_inference_ms is None:
+            self.first_inference_ms = (time.perf_counter() - self.created_at) * 1000
+            metrics.histogram("session.connect_to_first_inference_ms").observe(self.first_inference_ms)
+
+    def _ensure_model(self) -> bool:
+        """
+        Pick up the current shared model: once a background warmup has loaded it, and
+        after every hot reload. The window buffer is kept; a streaming hidden state
+        belongs to the old weights and restarts from zero.
+        """
+        if self._follow_shared_model:
+            current = get_session_model(self.streaming)
+            if current is not self.model:
+                self.model = current
+                if self.streaming and current is not None:
+                    self._reset_hidden_state()
+                if self.prediction_cache is not None:
+                    # Predictions of the previous model no longer apply
+                    self.prediction_cache.clear()
+        return self.model is not None and self.model.is_loaded
+
+    def _reset_hidden_state(self) -> None:
+        self.hidden_state = self.model.initial_state()
+        self._state_steps = 0
 
     def _get_coords(self, lm_list: list, index: int) -> Tuple[float, float, float]:
         """Extract x, y, z coordinates of a specific landmark by index."""
@@ -41,60 +109,26 @@ class GestureProcessor:
         """Calculate 3D Euclidean distance between two points."""
         return np.sqrt((p1[0] - p2[0])**2 + (p1[1] - p2[1])**2 + (p1[2] - p2[2])**2)
 
-    def _smooth_landmarks(self, lm_list: List[float]) -> List[float]:
-        """Apply moving average smoothing to landmarks."""
-        self.history.append(lm_list)
-        
-        if not self.history:
-            return lm_list
-            
-        # Compute mean across history for each coordinate
-        # history is [ [x1, y1, z1, ...], [x2, y2, z2, ...], ... ]
-        smoothed = np.mean(self.history, axis=0).tolist()
-        return smoothed
+    def _smooth_landmarks(self, lm_list) -> np.ndarray:
+        """Apply moving average smoothing to landmarks (result valid until the next frame)."""
+        return self.kernel.smooth(lm_list)
+
+    def _normalize_landmarks(self, lm_list) -> np.ndarray:
+        """Normalize a single hand (63 floats): relative to wrist, scaled by max dist to wrist."""
+        normalized = np.zeros((21, 3), dtype=np.float32)
+        self.kernel.normalize_hands(np.asarray(lm_list[:HAND_FEATURES], dtype=np.float64), normalized)
+        return normalized.reshape(-1)
 
-    def _normalize_features(self, hands_list: List[float], pose_list: List[float]) -> List[float]:
+    def _normalize_features(self, hands_list, pose_list) -> np.ndarray:
         """
         Normalize landmarks to match model input (162 features: 63 hands + 99 pose).
         Hands: Relative to wrist, scaled by max dist to wrist.
         Pose: Relative to shoulder midpoint, scaled by shoulder width.
+        The result is the kernel's output vector, valid until the next frame.
         """
-        # 1. Hands (63 features)
-        if not hands_list or len(hands_list) < 21 * 3:
-            hand_vector = np.zeros(21 * 3)
-        else:
-            try:
-                hands = np.array(hands_list).reshape(-1, 3)
-                wrist = hands[0]
-                rel_hands = hands - wrist
-                max_dist = np.max(np.linalg.norm(rel_hands, axis=1))
-                if max_dist > 0:
-                    rel_hands = rel_hands / max_dist
-                hand_vector = rel_hands.flatten()
-            except Exception:
-                hand_vector = np.zeros(21 * 3)
-
-        # 2. Pose (99 features)
-        if not pose_list or len(pose_list) < 33 * 3:
-            pose_vector = np.zeros(33 * 3)
-        else:
-            try:
-                pose = np.array(pose_list).reshape(-1, 3)
-                # Midpoint of shoulders (11 and 12)
-                shoulder_left = pose[11]
-                shoulder_right = pose[12]
-                midpoint = (shoulder_left + shoulder_right) / 2
-                
-                rel_pose = pose - midpoint
-                shoulder_dist = np.linalg.norm(shoulder_left - shoulder_right)
-                if shoulder_dist > 0:
-                    rel_pose = rel_pose / shoulder_dist
-                pose_vector = rel_pose.flatten()
-            except Exception:
-                pose_vector = np.zeros(33 * 3)
-                
-        # Concatenate
-        return np.concatenate([hand_vector, pose_vector]).tolist()
+        if hands_list is not None and len(hands_list) >= HAND_FEATURES:
+            hands_list = np.asarray(hands_list[:HAND_FEATURES], dtype=np.float64)
+        return self.kernel.normalize(hands_list, pose_list)
 
     def _detect_raw_gesture(self, lm_list: list) -> Optional[str]:
         """
@@ -193,19 +227,22 @@ class GestureProcessor:
         
         return True
 
-    def process_landmarks(self, data: Dict) -> Optional[str]:
+    def _pre_inference(self, data: Dict) -> Tuple[Optional[str], bool, float]:
         """
-        Main processing function with filtering, stability, and contextual validation.
+        Buffering and heuristic stages that run before the model.
+
+        Returns:
+            Tuple containing:
+            - Heuristic command (or None)
+            - Whether the ML model should run on the current window
+            - Timestamp of this frame
         """
-        if 'hands' not in data:
-            # If hands are missing, we still want to process for ML buffer (as zeros)
-            # preventing "None" return that blocks buffer filling.
-            raw_lm_list = []
-        else:
-            raw_lm_list = data['hands']
+        # If hands are missing, we still want to process for ML buffer (as zeros)
+        # preventing "None" return that blocks buffer filling.
+        raw_lm_list = data.get('hands')
         
-        # 1. Smoothing
-        if raw_lm_list:
+        # 1. Smoothing (arrays from the kernel, no list round-trips)
+        if raw_lm_list is not None and len(raw_lm_list) >= HAND_FEATURES:
              smoothed_lm_list = self._smooth_landmarks(raw_lm_list)
         else:
              smoothed_lm_list = []
@@ -214,16 +251,31 @@ class GestureProcessor:
         
         # 2. Normalization & Buffering (for ML)
         # Use smoothed hands and raw pose (pose smoothing not implemented yet)
-        pose_list = data.get('pose', [])
-        normalized_features = self._normalize_features(smoothed_lm_list, pose_list)
+        pose_list = data.get('pose')
+        normalized_features = self.kernel.normalize(
+            smoothed_lm_list if len(smoothed_lm_list) else None, pose_list
+        )
         self.landmark_buffer.append(normalized_features)
+
+        model_ready = self._ensure_model()
+        hand_present = len(smoothed_lm_list) > 0
+        if self.streaming and model_ready:
+            # Bound the recurrent context like the training windows: restart after
+            # STREAMING_STATE_MAX_FRAMES steps, and when the hand is lost (a new gesture follows)
+            if self._state_steps >= STREAMING_STATE_MAX_FRAMES or (self._hand_present and not hand_present):
+                self._reset_hidden_state()
+            # One GRU step per frame keeps the hidden state current, whatever the heuristics decide
+            gesture, confidence, self.hidden_state = self.model.step(normalized_features, self.hidden_state)
+            self._state_steps += 1
+            self._stream_prediction = (gesture, confidence)
+        self._hand_present = hand_present
         
         # DEBUG
         # print(f"[DEBUG] Frame processing. Buffer: {len(self.landmark_buffer)}")
 
         # 3. Cooldown Check
         if now - self.last_action_time < COOLDOWN:
-            return None
+            return None, False, now
 
         # 4. Priority: Pinch (Volume Control) - Heuristic
         # We check this first because it's a continuous interaction
@@ -243,8 +295,8 @@ class GestureProcessor:
                volume_command = self._handle_volume(index_tip_y)
                if volume_command:
                    self.last_action_time = now
-                   return volume_command
-               return None
+                   return volume_command, False, now
+               return None, False, now
            else:
                self.last_index_y = None
                
@@ -253,29 +305,117 @@ class GestureProcessor:
 
         # 5. ML Model Prediction
         # Only predict if we have enough history AND it's the right interval
+        # (streaming mode already has a prediction for every frame)
         self.frame_counter += 1
-        if len(self.landmark_buffer) == BUFFER_SIZE and (self.frame_counter % INFERENCE_INTERVAL == 0):
-            ml_gesture, ml_confidence = self.model.predict(list(self.landmark_buffer))
+        needs_inference = model_ready and len(self.landmark_buffer) == BUFFER_SIZE and (
+            self.streaming or self.frame_counter % INFERENCE_INTERVAL == 0
+        )
+        return None, needs_inference, now
+
+    def _post_inference(self, ml_gesture: Optional[str], ml_confidence: float, now: float) -> Optional[str]:
+        """Apply thresholds and class filtering to a model prediction."""
+        self._record_first_inference()
+        if self.shadow is not None:
+            self.shadow.offer(self.landmark_buffer.window(), ml_gesture, ml_confidence)
+        
+        if ml_gesture:
+            # Dynamic Threshold Lookup
+            threshold = GESTURE_THRESHOLDS.get(ml_gesture, MODEL_CONFIDENCE_THRESHOLD)
             
-            if ml_gesture:
-                # Dynamic Threshold Lookup
-                threshold = GESTURE_THRESHOLDS.get(ml_gesture, MODEL_CONFIDENCE_THRESHOLD)
-                
-                # Clean gesture name for lookup if needed (e.g. handle suffixes)
-                clean_name = ml_gesture.replace("_INTENCIONAL", "")
-                threshold = GESTURE_THRESHOLDS.get(clean_name, threshold)
+            # Clean gesture name for lookup if needed (e.g. handle suffixes)
+            clean_name = ml_gesture.replace("_INTENCIONAL", "")
+            threshold = GESTURE_THRESHOLDS.get(clean_name, threshold)
 
-                if ml_confidence > threshold:
-                    # Filter "negative" classes
-                    if "NO_ACTION" in ml_gesture or "falso_positivo" in ml_gesture or "no_accion" in ml_gesture:
-                        return None
-                    
-                    # Use clean name
-                    command = clean_name
-                    
-                    # Return immediately
-                    print(f"[GestureProcessor] ML Action: {command} ({ml_confidence:.2f} > {threshold})")
-                    self.last_action_time = now
-                    return command
+            if ml_confidence > threshold:
+                # Filter "negative" classes
+                if "NO_ACTION" in ml_gesture or "falso_positivo" in ml_gesture or "no_accion" in ml_gesture:
+                    return None
+                
+                # Use clean name
+                command = clean_name
+                
+                # Return immediately
+                print(f"[GestureProcessor] ML Action: {command} ({ml_confidence:.2f} > {threshold})")
+                self.last_action_time = now
+                if self.streaming:
+                    # Start the next gesture from a clean recurrent state
+                    self._reset_hidden_state()
+                return command
         
-        return None
\ No newline at end of file
+        return None
+
+    def _cache_lookup(self, window: np.ndarray) -> Optional[Prediction]:
+        if self.prediction_cache is None:
+            return None
+        return self.prediction_cache.lookup(window)
+
+    def _cache_store(self, prediction: Prediction, inference_ms: Optional[float]) -> None:
+        if self.prediction_cache is not None:
+            self.prediction_cache.store(prediction, inference_ms)
+
+    def process_landmarks(self, data: Dict) -> Optional[str]:
+        """
+        Main processing function with filtering, stability, and contextual validation.
+        `data` is a parsed payload (see shared.schemas.parse_message): "hands" and "pose"
+        are float32 arrays, copied straight into the feature kernel's buffers. Lists of
+        floats are still accepted.
+        """
+        command, needs_inference, now = self._pre_inference(data)
+        if not needs_inference:
+            return command
+
+        if self.streaming:
+            ml_gesture, ml_confidence = self._stream_prediction
+        else:
+            window = self.landmark_buffer.window()
+            cached = self._cache_lookup(window)
+            if cached is not None:
+                ml_gesture, ml_confidence = cached
+            else:
+                start = time.perf_counter()
+                ml_gesture, ml_confidence = self.model.predict(window)
+                self._cache_store((ml_gesture, ml_confidence), (time.perf_counter() - start) * 1000)
+        return self._post_inference(ml_gesture, ml_confidence, now)
+
+    async def process_landmarks_async(
+        self,
+        data: Dict,
+        predict: Callable[[np.ndarray], Awaitable[Tuple[Optional[str], float]]],
+        executor: Optional[Executor] = None,
+        inference_ms: Optional[Callable[[], float]] = None,
+    ) -> Optional[str]:
+        """
+        Same as process_landmarks, but the model call is awaited through `predict`
+        (e.g. BatchScheduler.predict) so it can be batched with other sessions.
+        When an executor is given, smoothing and normalization run there too.
+        `inference_ms` reports the model's own time for the last prediction (e.g.
+        BatchScheduler.window_ms), which the prediction cache credits to its hits;
+        the awaited time would include batching delay.
+        """
+        if executor is not None:
+            loop = asyncio.get_running_loop()
+            command, needs_inference, now = await loop.run_in_executor(executor, self._pre_inference, data)
+        else:
+            command, needs_inference, now = self._pre_inference(data)
+        if not needs_inference:
+            return command
+
+        if self.streaming:
+            ml_gesture, ml_confidence = self._stream_prediction
+        else:
+            # The window is a view; it stays valid because the next frame of this
+            # session is not processed until the prediction comes back
+            window = self.landmark_buffer.window()
+            cached = self._cache_lookup(window)
+            if cached is not None:
+                ml_gesture, ml_confidence = cached
+            else:
+                try:
+                    ml_gesture, ml_confidence = await predict(window)
+                except Exception as e:
+                    # Same fallback as GestureModel.predict: heuristics only for this frame
+                    print(f"[GestureProcessor] Batched inference error: {e}")
+                    ml_gesture, ml_confidence = None, 0.0
+                else:
+                    self._cache_store((ml_gesture, ml_confidence), inference_ms() if inference_ms else None)
+        return self._post_inference(ml_gesture, ml_confidence, now)
@@ -1,58 +1,294 @@
 import os
 import json
-try:
-    # Try importing tflite_runtime first (lightweight)
-    import tflite_runtime.interpreter as tflite
-except ImportError:
-    # Fallback to full TensorFlow
-    import tensorflow.lite as tflite
+import queue
+import threading
+import time
+from contextlib import contextmanager
 import numpy as np
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
+from shared import metrics
+from shared.config import (
+    MODEL_POOL_SIZE, BATCH_MAX_SIZE, STREAMING_INFERENCE, INFERENCE_BACKEND, BUFFER_SIZE, NUM_FEATURES,
+    TFLITE_NUM_THREADS, TFLITE_USE_XNNPACK, QUANTIZED_INFERENCE
+)
+from server.modules.numpy_backend import NumpyGRUNetwork
+
+# Assuming server/modules -> ../../ml_pipeline/models
+# workspace/server/modules/model_loader.py
+# workspace/ml_pipeline/models/gesture_model.tflite
+_BASE_DIR = os.path.dirname(__file__)
+DEFAULT_MODEL_PATH = os.path.abspath(os.path.join(_BASE_DIR, '../../ml_pipeline/models/gesture_model.tflite'))
+DEFAULT_INT8_MODEL_PATH = os.path.abspath(os.path.join(_BASE_DIR, '../../ml_pipeline/models/gesture_model_int8.tflite'))
+DEFAULT_STEP_MODEL_PATH = os.path.abspath(os.path.join(_BASE_DIR, '../../ml_pipeline/models/gesture_model_step.tflite'))
+DEFAULT_WEIGHTS_PATH = os.path.abspath(os.path.join(_BASE_DIR, '../../ml_pipeline/models/gesture_model.npz'))
+DEFAULT_LABEL_MAP_PATH = os.path.abspath(os.path.join(_BASE_DIR, '../../ml_pipeline/data/label_map.json'))
+DEFAULT_TUNING_PATH = os.path.abspath(os.path.join(_BASE_DIR, '../../ml_pipeline/models/interpreter_tuning.json'))
+
+BACKENDS = ("tflite", "numpy")
+
+
+def _import_tflite():
+    """Import the TFLite interpreter module only when the tflite backend is used."""
+    try:
+        # Try importing tflite_runtime first (lightweight)
+        import tflite_runtime.interpreter as tflite
+    except ImportError:
+        # Fallback to full TensorFlow
+        import tensorflow.lite as tflite
+    return tflite
+
+
+def _quantization_params(details: Dict) -> Optional[Tuple[float, int, type]]:
+    """(scale, zero_point, dtype) of an integer-quantized tensor, None for float tensors."""
+    scale, zero_point = details.get('quantization', (0.0, 0))
+    if np.dtype(details['dtype']) == np.float32 or not scale:
+        return None
+    return float(scale), int(zero_point), details['dtype']
+
+
+def quantize(values: np.ndarray, params: Tuple[float, int, type]) -> np.ndarray:
+    """Float -> integer tensor values: round(x / scale) + zero_point, saturated to the dtype."""
+    scale, zero_point, dtype = params
+    limits = np.iinfo(dtype)
+    quantized = np.round(values / scale) + zero_point
+    return np.clip(quantized, limits.min, limits.max).astype(dtype)
+
+
+def dequantize(values: np.ndarray, params: Tuple[float, int, type]) -> np.ndarray:
+    """Integer -> float tensor values: (q - zero_point) * scale."""
+    scale, zero_point, _ = params
+    return (values.astype(np.float32) - zero_point) * scale
+
+
+def load_interpreter_settings(tuning_path: str = DEFAULT_TUNING_PATH) -> Dict:
+    """
+    Interpreter settings from shared.config, overridden by the tuning file written by
+    `python -m server.tune_interpreter` when one exists.
+    """
+    settings = {
+        "num_threads": TFLITE_NUM_THREADS,
+        "use_xnnpack": TFLITE_USE_XNNPACK,
+        "pool_size": MODEL_POOL_SIZE,
+    }
+    if os.path.exists(tuning_path):
+        try:
+            with open(tuning_path, 'r') as f:
+                tuned = json.load(f)
+            settings.update({key: tuned[key] for key in settings if key in tuned})
+            print(f"[GestureModel] Using tuned interpreter settings ({tuned.get('objective', 'unknown')} "
+                  f"objective) from {tuning_path}")
+        except (OSError, ValueError) as e:
+            print(f"[GestureModel] Warning: ignoring unreadable tuning file {tuning_path}: {e}")
+    return settings
+
+
+class InterpreterPool:
+    """
+    Fixed set of pre-allocated interpreters built from a single in-memory model.
+    Each interpreter is used by one caller at a time, which makes the pool safe to
+    share between sessions and threads. With batch_size, every interpreter's input is
+    allocated once for that many windows instead of the model's default batch of one.
+    """
+    def __init__(self, model_content: bytes, size: int, num_threads: Optional[int] = None,
+                 use_xnnpack: bool = True, metrics_prefix: str = "model", batch_size: Optional[int] = None):
+        tflite = _import_tflite()
+        self.size = size
+        self.batch_size = batch_size
+        self.num_threads = num_threads
+        self.use_xnnpack = use_xnnpack
+        self._pool_wait = metrics.histogram(f"{metrics_prefix}.pool_wait_ms")
+
+        options = {"model_content": model_content, "num_threads": num_threads}
+        if not use_xnnpack:
+            # XNNPACK is applied by default; this resolver leaves every op on the builtin kernels
+            op_resolver = getattr(tflite, "OpResolverType", None) or tflite.experimental.OpResolverType
+            options["experimental_op_resolver_type"] = op_resolver.BUILTIN_WITHOUT_DEFAULT_DELEGATES
+
+        self._idle: "queue.Queue" = queue.Queue()
+        for _ in range(size):
+            interpreter = tflite.Interpreter(**options)
+            if batch_size is not None:
+                input_details = interpreter.get_input_details()[0]
+                interpreter.resize_tensor_input(input_details['index'], [batch_size] + list(input_details['shape'][1:]))
+            interpreter.allocate_tensors()
+            self._idle.put(interpreter)
+
+    @contextmanager
+    def acquire(self):
+        """Borrow an interpreter, blocking until one is idle."""
+        wait_start = time.perf_counter()
+        interpreter = self._idle.get()
+        self._pool_wait.observe((time.perf_counter() - wait_start) * 1000)
+        try:
+            yield interpreter
+        finally:
+            self._idle.put(interpreter)
+
 
 class GestureModel:
     """
-    ML-based gesture recognition model using TFLite.
+    ML-based gesture recognition model.
+    backend="tflite" reads the .tflite file once and serves it from a pool of
+    interpreters; backend="numpy" runs the same network from the .npz weights
+    exported by train.py without importing TensorFlow. Use ModelRegistry.get()
+    to share one instance across all sessions.
     """
-    def __init__(self):
-        # Paths
-        base_dir = os.path.dirname(__file__)
-        # Assuming server/modules -> ../../ml_pipeline/models
-        # Adjust path to match where models are actually located relative to this file
-        # workspace/server/modules/model_loader.py
-        # workspace/ml_pipeline/models/gesture_model.tflite
-        self.model_path = os.path.abspath(os.path.join(base_dir, '../../ml_pipeline/models/gesture_model.tflite'))
-        self.label_map_path = os.path.abspath(os.path.join(base_dir, '../../ml_pipeline/data/label_map.json'))
-        
-        self.interpreter = None
+    def __init__(self, model_path: Optional[str] = None, label_map_path: Optional[str] = None,
+                 pool_size: Optional[int] = None, backend: str = INFERENCE_BACKEND,
+                 interpreter_settings: Optional[Dict] = None, metrics_prefix: str = "model"):
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown inference backend: {backend!r} (expected one of {BACKENDS})")
+        self.backend = backend
+        # Metric names start with this, so e.g. a shadow model does not mix into model.*
+        self.metrics_prefix = metrics_prefix
+        if backend == "numpy":
+            default_path = DEFAULT_WEIGHTS_PATH
+        else:
+            default_path = DEFAULT_INT8_MODEL_PATH if QUANTIZED_INFERENCE else DEFAULT_MODEL_PATH
+        self.model_path = os.path.abspath(model_path or default_path)
+        self.label_map_path = os.path.abspath(label_map_path or DEFAULT_LABEL_MAP_PATH)
+        # num_threads / use_xnnpack / pool_size (tflite backend only)
+        self.interpreter_settings = dict(interpreter_settings or {})
+        if backend == "tflite" and interpreter_settings is None:
+            self.interpreter_settings = load_interpreter_settings()
+        if pool_size is None:
+            pool_size = self.interpreter_settings.get("pool_size", MODEL_POOL_SIZE)
+        self.pool_size = pool_size
+
+        self.pool: Optional[InterpreterPool] = None
+        self.network: Optional[NumpyGRUNetwork] = None
+        self.supports_batching = False
+        # One pool per batch size other than the default, so an interpreter's tensors
+        # are allocated once and never resized between calls of different sizes
+        self._model_content: Optional[bytes] = None
+        self._batch_pools: Dict[int, InterpreterPool] = {}
+        self._batch_pools_lock = threading.Lock()
         self.input_details = None
         self.output_details = None
+        # (scale, zero_point, dtype) of integer-quantized models' input / output tensors
+        self.input_quantization: Optional[Tuple[float, int, type]] = None
+        self.output_quantization: Optional[Tuple[float, int, type]] = None
         self.label_map = {}
-        
+
         try:
-            self._load_model()
+            load_start = time.perf_counter()
+            if backend == "numpy":
+                self._load_weights()
+            else:
+                self._load_model()
             self._load_labels()
-            print(f"[GestureModel] Successfully loaded model from {self.model_path}")
+            load_ms = (time.perf_counter() - load_start) * 1000
+            metrics.gauge(f"{self.metrics_prefix}.load_ms").set(load_ms)
+            served_by = "numpy backend" if backend == "numpy" else (
+                f"{self.pool_size} interpreters, num_threads={self.pool.num_threads}, "
+                f"xnnpack={'on' if self.pool.use_xnnpack else 'off'}"
+            )
+            print(f"[GestureModel] Successfully loaded model from {self.model_path} "
+                  f"({served_by}, {load_ms:.1f} ms)")
+        except ImportError as e:
+            print(f"[GestureModel] TFLite runtime not available ({e}); ML inference disabled, "
+                  f"heuristics only. Install tflite-runtime or set INFERENCE_BACKEND = \"numpy\".")
         except Exception as e:
             print(f"[GestureModel] Error loading model: {e}")
-            # Fallback or just re-raise depending on strictness. 
+            # Fallback or just re-raise depending on strictness.
             # For now, print error so server creates it but maybe fails on predict.
 
+    @property
+    def is_loaded(self) -> bool:
+        return self.pool is not None or self.network is not None
+
+    def _create_pool(self, batch_size: Optional[int] = None) -> InterpreterPool:
+        if self._model_content is None:
+            with open(self.model_path, 'rb') as f:
+                self._model_content = f.read()
+        return InterpreterPool(
+            self._model_content, self.pool_size,
+            num_threads=self.interpreter_settings.get("num_threads", TFLITE_NUM_THREADS),
+            use_xnnpack=self.interpreter_settings.get("use_xnnpack", TFLITE_USE_XNNPACK),
+            metrics_prefix=self.metrics_prefix,
+            batch_size=batch_size,
+        )
+
+    def _pool_for(self, batch_size: int) -> InterpreterPool:
+        """Interpreters allocated for `batch_size` windows; other sizes get their own pool on first use."""
+        if batch_size == self.input_details[0]['shape'][0]:
+            return self.pool
+        with self._batch_pools_lock:
+            pool = self._batch_pools.get(batch_size)
+            if pool is None:
+                pool = self._batch_pools[batch_size] = self._create_pool(batch_size)
+        return pool
+
     def _load_model(self):
-        from shared.config import BUFFER_SIZE
-        
-        self.interpreter = tflite.Interpreter(model_path=self.model_path)
-        self.interpreter.allocate_tensors()
-        self.input_details = self.interpreter.get_input_details()
-        self.output_details = self.interpreter.get_output_details()
-        
+        self.pool = self._create_pool()
+        with self.pool.acquire() as interpreter:
+            self.input_details = interpreter.get_input_details()
+            self.output_details = interpreter.get_output_details()
+
+        # Full-integer models take and return int8; predictions convert at the boundary
+        self.input_quantization = _quantization_params(self.input_details[0])
+        self.output_quantization = _quantization_params(self.output_details[0])
+        if self.input_quantization is not None:
+            print(f"[GestureModel] Quantized model: input {np.dtype(self.input_quantization[2]).name} "
+                  f"(scale={self.input_quantization[0]:.6g}, zero_point={self.input_quantization[1]})")
+
         # Validate logic vs model
         input_shape = self.input_details[0]['shape'] # [1, 20, 162]
         model_time_steps = input_shape[1]
-        
+
+        # Models exported with a dynamic batch dimension report -1 in the signature
+        shape_signature = self.input_details[0].get('shape_signature', input_shape)
+        self.supports_batching = len(shape_signature) > 0 and shape_signature[0] == -1
+
         if model_time_steps != BUFFER_SIZE:
              print(f"[GestureModel] CRITICAL WARNING: Model expects {model_time_steps} frames, but config BUFFER_SIZE is {BUFFER_SIZE}.")
              # We could raise an error here, but for now a loud warning allows debugging.
 
+    def _load_weights(self):
+        self.network = NumpyGRUNetwork.load(self.model_path)
+        # Any batch size works without re-allocation
+        self.supports_batching = True
+
+        if self.network.time_steps != BUFFER_SIZE:
+             print(f"[GestureModel] CRITICAL WARNING: Model expects {self.network.time_steps} frames, but config BUFFER_SIZE is {BUFFER_SIZE}.")
+
+    def warm_up(self) -> None:
+        """Run one throwaway prediction so the first session does not pay for lazy allocations."""
+        if self.is_loaded:
+            self.predict(np.zeros((BUFFER_SIZE, NUM_FEATURES), dtype=np.float32))
+
+    @property
+    def time_steps(self) -> Optional[int]:
+        if self.network is not None:
+            return self.network.time_steps
+        if self.input_details is not None:
+            return int(self.input_details[0]['shape'][1])
+        return None
+
+    def validate(self) -> Optional[str]:
+        """
+        Check that the model can serve sessions: loaded, matching BUFFER_SIZE / NUM_FEATURES,
+        and producing one finite probability per label. Returns an error message, or None.
+        """
+        if not self.is_loaded:
+            return "model failed to load"
+        if self.time_steps != BUFFER_SIZE:
+            return f"model expects {self.time_steps} frames, BUFFER_SIZE is {BUFFER_SIZE}"
+        try:
+            probabilities = self.predict_probabilities(np.zeros((1, BUFFER_SIZE, NUM_FEATURES), dtype=np.float32))
+        except Exception as e:
+            return f"test inference failed: {e}"
+        return self._validate_probabilities(probabilities)
+
+    def _validate_probabilities(self, probabilities: np.ndarray) -> Optional[str]:
+        if not self.label_map:
+            return "label map is missing or empty"
+        if probabilities.shape[-1] != len(self.label_map):
+            return f"model has {probabilities.shape[-1]} classes, label map has {len(self.label_map)}"
+        if not np.all(np.isfinite(probabilities)):
+            return "test inference produced non-finite probabilities"
+        return None
+
     def _load_labels(self):
         if os.path.exists(self.label_map_path):
             with open(self.label_map_path, 'r') as f:
@@ -60,19 +296,57 @@ class GestureModel:
         else:
             print(f"[GestureModel] Warning: Label map not found at {self.label_map_path}")
 
-    def predict(self, landmark_buffer: List[List[float]]) -> Tuple[Optional[str], float]:
+    def _label(self, probabilities: np.ndarray) -> Tuple[Optional[str], float]:
+        """Map one row of class probabilities to (gesture name, confidence)."""
+        predicted_idx = np.argmax(probabilities)
+        confidence = float(probabilities[predicted_idx])
+
+        gesture_name = self.label_map.get(str(predicted_idx), f"Unknown_{predicted_idx}")
+
+        # Clean up gesture name if it contains suffix like _INTENCIONAL
+        # Or leave it raw and let logic handle it.
+        # Request says: "mapearlo al nombre del gesto".
+        return gesture_name, confidence
+
+    def _invoke(self, interpreter, input_data: np.ndarray) -> np.ndarray:
+        """Run one invoke on an interpreter allocated for input_data's batch size."""
+        input_index = self.input_details[0]['index']
+        start = time.perf_counter()
+        if self.input_quantization is not None:
+            input_data = quantize(input_data, self.input_quantization)
+        interpreter.set_tensor(input_index, input_data)
+        interpreter.invoke()
+        output_data = interpreter.get_tensor(self.output_details[0]['index'])
+        if self.output_quantization is not None:
+            output_data = dequantize(output_data, self.output_quantization)
+        metrics.histogram(f"{self.metrics_prefix}.inference_ms").observe((time.perf_counter() - start) * 1000)
+        return output_data
+
+    def predict_probabilities(self, windows: np.ndarray) -> np.ndarray:
+        """Class probabilities [N, Classes] for float32 windows [N, 20, 162]."""
+        if self.network is not None:
+            start = time.perf_counter()
+            output_data = self.network.forward(windows)
+            metrics.histogram(f"{self.metrics_prefix}.inference_ms").observe((time.perf_counter() - start) * 1000)
+            return output_data
+
+        with self._pool_for(len(windows)).acquire() as interpreter:
+            return self._invoke(interpreter, windows)
+
+    def predict(self, landmark_buffer) -> Tuple[Optional[str], float]:
         """
         Predict gesture from a buffer of normalized landmarks.
         
         Args:
-            landmark_buffer: List of normalized landmark frames (20 frames, 162 features each).
+            landmark_buffer: Normalized landmark frames (20 frames, 162 features each), either
+                a float32 array (e.g. FrameRingBuffer.window(), used without copying) or lists.
         
         Returns:
             Tuple containing:
             - Detected gesture name (or None)
             - Confidence score (0.0 to 1.0)
         """
-        if not self.interpreter:
+        if not self.is_loaded:
             return None, 0.0
             
         if len(landmark_buffer) != 20:
@@ -81,29 +355,241 @@ class GestureModel:
 
         try:
             # Prepare input data
-            # Model expects [1, 20, 162], float32
-            input_data = np.array([landmark_buffer], dtype=np.float32)
-            
-            # Check shape consistency
-            input_shape = self.input_details[0]['shape']
-            # Expected [1, 20, 162]
-            
-            self.interpreter.set_tensor(self.input_details[0]['index'], input_data)
-            self.interpreter.invoke()
-            
-            output_data = self.interpreter.get_tensor(self.output_details[0]['index'])
-            
-            # Get prediction
-            predicted_idx = np.argmax(output_data[0])
-            confidence = float(output_data[0][predicted_idx])
-            
-            gesture_name = self.label_map.get(str(predicted_idx), f"Unknown_{predicted_idx}")
-            
-            # Clean up gesture name if it contains suffix like _INTENCIONAL
-            # Or leave it raw and let logic handle it. 
-            # Request says: "mapearlo al nombre del gesto".
-            return gesture_name, confidence
+            # Model expects [1, 20, 162], float32; a contiguous float32 window is only re-viewed
+            input_data = np.ascontiguousarray(landmark_buffer, dtype=np.float32)[np.newaxis]
+            output_data = self.predict_probabilities(input_data)
+
+            return self._label(output_data[0])
 
         except Exception as e:
             print(f"[GestureModel] Inference error: {e}")
             return None, 0.0
+
+    def predict_batch(self, windows: np.ndarray) -> List[Tuple[Optional[str], float]]:
+        """
+        Predict gestures for a stack of windows shaped [N, 20, 162].
+        Batches are zero-padded up to the next power of two (capped at BATCH_MAX_SIZE),
+        so only a handful of batch sizes get an interpreter pool of their own.
+        Models without a dynamic batch dimension fall back to one invoke per window.
+        """
+        num_windows = len(windows)
+        if not self.is_loaded or num_windows == 0:
+            return [(None, 0.0)] * num_windows
+
+        if not self.supports_batching:
+            return [self.predict(window) for window in windows]
+
+        try:
+            if self.network is not None:
+                # No interpreter shapes to keep stable, so no padding either
+                output_data = self.predict_probabilities(np.asarray(windows, dtype=np.float32))
+                return [self._label(row) for row in output_data]
+
+            padded_size = 1
+            while padded_size < num_windows:
+                padded_size *= 2
+            padded_size = max(num_windows, min(padded_size, BATCH_MAX_SIZE))
+
+            input_data = np.zeros((padded_size,) + windows.shape[1:], dtype=np.float32)
+            input_data[:num_windows] = windows
+            output_data = self.predict_probabilities(input_data)
+
+            return [self._label(row) for row in output_data[:num_windows]]
+
+        except Exception as e:
+            print(f"[GestureModel] Batch inference error: {e}")
+            return [(None, 0.0)] * num_windows
+
+
+class StreamingGestureModel(GestureModel):
+    """
+    Single-step (stateful) variant of the GRU, exported by train.py as gesture_model_step.tflite.
+    Each step consumes one normalized frame plus the session's hidden state, so every
+    frame can be evaluated for the cost of one GRU step instead of a full window.
+    The numpy backend steps the windowed model's .npz weights directly.
+    """
+    def __init__(self, model_path: Optional[str] = None, label_map_path: Optional[str] = None,
+                 pool_size: Optional[int] = None, backend: str = INFERENCE_BACKEND,
+                 interpreter_settings: Optional[Dict] = None, metrics_prefix: str = "model"):
+        self.state_size = 0
+        self._runners: Dict[int, object] = {}
+        if model_path is None and backend == "tflite":
+            model_path = DEFAULT_STEP_MODEL_PATH
+        super().__init__(model_path, label_map_path, pool_size, backend, interpreter_settings, metrics_prefix)
+
+    def _load_model(self):
+        self.pool = self._create_pool()
+        with self.pool.acquire() as interpreter:
+            input_details = self._runner(interpreter).get_input_details()
+        # [1, Units]
+        self.state_size = int(input_details['state']['shape'][-1])
+
+    def _load_weights(self):
+        self.network = NumpyGRUNetwork.load(self.model_path)
+        self.state_size = self.network.units
+
+    def _runner(self, interpreter):
+        """Signature runner of an interpreter (inputs 'frame'/'state', outputs 'probabilities'/'next_state')."""
+        runner = self._runners.get(id(interpreter))
+        if runner is None:
+            runner = interpreter.get_signature_runner()
+            self._runners[id(interpreter)] = runner
+        return runner
+
+    def initial_state(self) -> np.ndarray:
+        return np.zeros((1, self.state_size), dtype=np.float32)
+
+    def warm_up(self) -> None:
+        if self.is_loaded:
+            self.step(np.zeros(NUM_FEATURES, dtype=np.float32), self.initial_state())
+
+    def step(self, frame, state: np.ndarray) -> Tuple[Optional[str], float, np.ndarray]:
+        """
+        Advance the GRU by one frame.
+
+        Returns:
+            Tuple containing:
+            - Detected gesture name (or None)
+            - Confidence score (0.0 to 1.0)
+            - Hidden state to pass to the next step
+        """
+        if not self.is_loaded:
+            return None, 0.0, state
+
+        try:
+            probabilities, next_state = self.step_probabilities(frame, state)
+            gesture_name, confidence = self._label(probabilities[0])
+            return gesture_name, confidence, next_state
+
+        except Exception as e:
+            print(f"[StreamingGestureModel] Inference error: {e}")
+            return None, 0.0, state
+
+    def step_probabilities(self, frame, state: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Class probabilities [1, Classes] and next state for one frame (raises on errors)."""
+        start = time.perf_counter()
+        if self.network is not None:
+            probabilities, next_state = self.network.step(np.asarray(frame, dtype=np.float32).reshape(1, -1), state)
+        else:
+            frame_input = np.asarray(frame, dtype=np.float32).reshape(1, 1, -1)
+            with self.pool.acquire() as interpreter:
+                outputs = self._runner(interpreter)(frame=frame_input, state=state)
+            probabilities, next_state = outputs['probabilities'], outputs['next_state']
+        metrics.histogram(f"{self.metrics_prefix}.step_ms").observe((time.perf_counter() - start) * 1000)
+        return probabilities, next_state
+
+    def validate(self) -> Optional[str]:
+        if not self.is_loaded:
+            return "model failed to load"
+        try:
+            probabilities, next_state = self.step_probabilities(
+                np.zeros(NUM_FEATURES, dtype=np.float32), self.initial_state()
+            )
+        except Exception as e:
+            return f"test step failed: {e}"
+        if next_state.shape != (1, self.state_size):
+            return f"next state has shape {next_state.shape}, expected (1, {self.state_size})"
+        return self._validate_probabilities(probabilities)
+
+    def predict(self, landmark_buffer) -> Tuple[Optional[str], float]:
+        """Step through a whole window from a zero state (equivalent to the windowed model)."""
+        gesture_name, confidence = None, 0.0
+        state = self.initial_state()
+        for frame in landmark_buffer:
+            gesture_name, confidence, state = self.step(frame, state)
+        return gesture_name, confidence
+
+
+class ModelRegistry:
+    """
+    Process-wide cache of loaded models, keyed by model class, backend and file.
+    Every session asking for the same model receives the same GestureModel, so the
+    file is read and its interpreters are allocated only once per process.
+    """
+    _models: Dict[Tuple[type, str, Optional[str]], GestureModel] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls, model_path: Optional[str] = None, label_map_path: Optional[str] = None,
+            model_class: type = GestureModel, backend: str = INFERENCE_BACKEND) -> GestureModel:
+        key = cls._key(model_path, model_class, backend)
+        with cls._lock:
+            model = cls._models.get(key)
+            if model is None:
+                model = model_class(model_path=key[2], label_map_path=label_map_path, backend=backend)
+                cls._models[key] = model
+        return model
+
+    @classmethod
+    def peek(cls, model_path: Optional[str] = None, model_class: type = GestureModel,
+             backend: str = INFERENCE_BACKEND) -> Optional[GestureModel]:
+        """The model if it is already loaded, without waiting for a load in progress."""
+        return cls._models.get(cls._key(model_path, model_class, backend))
+
+    @classmethod
+    def replace(cls, model: GestureModel, model_path: Optional[str] = None) -> Optional[GestureModel]:
+        """
+        Atomically make `model` the registered model for its class / backend / path.
+        Callers that already hold the previous model keep using it until they look it up
+        again. Returns the previous model (None if there was none).
+        """
+        key = cls._key(model_path, type(model), model.backend)
+        with cls._lock:
+            previous = cls._models.get(key)
+            cls._models[key] = model
+        return previous
+
+    @staticmethod
+    def _key(model_path: Optional[str], model_class: type, backend: str) -> Tuple[type, str, Optional[str]]:
+        return model_class, backend, os.path.abspath(model_path) if model_path else None
+
+    @classmethod
+    def clear(cls) -> None:
+        """Forget all loaded models (the next get() reloads from disk)."""
+        with cls._lock:
+            cls._models.clear()
+
+
+def load_session_model(streaming: bool = STREAMING_INFERENCE,
+                       backend: str = INFERENCE_BACKEND) -> GestureModel:
+    """Shared model for sessions: the single-step variant in streaming mode."""
+    model_class = StreamingGestureModel if streaming else GestureModel
+    return ModelRegistry.get(model_class=model_class, backend=backend)
+
+
+_warmup_thread: Optional[threading.Thread] = None
+
+
+def warm_up_session_model(streaming: bool = STREAMING_INFERENCE,
+                          backend: str = INFERENCE_BACKEND) -> threading.Thread:
+    """
+    Load the shared session model and run one prediction on a background thread.
+    Join the returned thread to wait for it; until it finishes, get_session_model()
+    returns None instead of blocking.
+    """
+    global _warmup_thread
+
+    def warm_up():
+        start = time.perf_counter()
+        load_session_model(streaming, backend).warm_up()
+        warmup_ms = (time.perf_counter() - start) * 1000
+        metrics.gauge("model.warmup_ms").set(warmup_ms)
+        print(f"[GestureModel] Warmup finished in {warmup_ms:.1f} ms")
+
+    _warmup_thread = threading.Thread(target=warm_up, name="model-warmup", daemon=True)
+    _warmup_thread.start()
+    return _warmup_thread
+
+
+def get_session_model(streaming: bool = STREAMING_INFERENCE,
+                      backend: str = INFERENCE_BACKEND) -> Optional[GestureModel]:
+    """
+    Shared session model, or None while a background warmup is still loading it
+    (sessions then run heuristics only and check again on later frames).
+    Lock-free once loaded, so sessions can call it every frame to pick up hot reloads.
+    """
+    model_class = StreamingGestureModel if streaming else GestureModel
+    model = ModelRegistry.peek(model_class=model_class, backend=backend)
+    if model is not None or (_warmup_thread is not None and _warmup_thread.is_alive()):
+        return model
+    return load_session_model(streaming, backend)
@@ -0,0 +1,106 @@
+import asyncio
+import os
+import time
+from typing import Dict, Optional, Tuple
+from shared import metrics
+from shared.config import STREAMING_INFERENCE, INFERENCE_BACKEND, MODEL_WATCH_INTERVAL_S
+from server.modules.model_loader import (
+    GestureModel, StreamingGestureModel, ModelRegistry, get_session_model
+)
+
+
+class ModelReloader:
+    """
+    Zero-downtime replacement of the shared session model.
+
+    A reload builds the new model on a worker thread, validates it (input shape vs
+    BUFFER_SIZE / NUM_FEATURES, labels vs outputs, one test inference) and warms it up;
+    only then is it swapped into the ModelRegistry with a single assignment on the
+    event loop. Sessions pick it up on their next frame and keep their window buffers.
+    A model that fails validation is discarded and the current one stays in service.
+
+    Triggered by the "reload_model" admin message or by watch(), which polls the
+    model and label map files for changes.
+    """
+    def __init__(self, streaming: bool = STREAMING_INFERENCE, backend: str = INFERENCE_BACKEND,
+                 watch_interval_s: float = MODEL_WATCH_INTERVAL_S):
+        self.streaming = streaming
+        self.backend = backend
+        self.watch_interval_s = watch_interval_s
+        self.model_class = StreamingGestureModel if streaming else GestureModel
+        self._lock = asyncio.Lock()
+
+    def current_paths(self) -> Tuple[Optional[str], Optional[str]]:
+        model = get_session_model(self.streaming, self.backend)
+        if model is None:
+            return None, None
+        return model.model_path, model.label_map_path
+
+    def _load(self, model_path: Optional[str], label_map_path: Optional[str]) -> Tuple[GestureModel, Optional[str]]:
+        """Worker thread: load, validate and warm up a candidate model."""
+        candidate = self.model_class(model_path=model_path, label_map_path=label_map_path, backend=self.backend)
+        error = candidate.validate()
+        if error is None:
+            candidate.warm_up()
+        return candidate, error
+
+    async def reload(self, model_path: Optional[str] = None, label_map_path: Optional[str] = None) -> Dict:
+        """
+        Load and swap in a model (default: the current files again).
+        Returns a result dict with "status" ("swapped" or "rejected") and timings.
+        """
+        async with self._lock:
+            current_model_path, current_label_map_path = self.current_paths()
+            model_path = model_path or current_model_path
+            label_map_path = label_map_path or current_label_map_path
+
+            load_start = time.perf_counter()
+            loop = asyncio.get_running_loop()
+            candidate, error = await loop.run_in_executor(None, self._load, model_path, label_map_path)
+            load_ms = (time.perf_counter() - load_start) * 1000
+
+            if error is not None:
+                metrics.counter("model.reload_rejected").inc()
+                print(f"[ModelReloader] Rejected {candidate.model_path}: {error}; keeping the current model")
+                return {"status": "rejected", "model_path": candidate.model_path, "error": error, "load_ms": load_ms}
+
+            swap_start = time.perf_counter()
+            ModelRegistry.replace(candidate)
+            swap_ms = (time.perf_counter() - swap_start) * 1000
+
+            metrics.counter("model.reloads").inc()
+            metrics.histogram("model.reload_load_ms").observe(load_ms)
+            metrics.histogram("model.swap_ms").observe(swap_ms)
+            print(f"[ModelReloader] Swapped in {candidate.model_path} "
+                  f"(load+validate+warmup {load_ms:.1f} ms, swap {swap_ms:.3f} ms)")
+            return {"status": "swapped", "model_path": candidate.model_path, "load_ms": load_ms, "swap_ms": swap_ms}
+
+    @staticmethod
+    def _mtimes(paths) -> Tuple[Optional[float], ...]:
+        return tuple(os.path.getmtime(path) if path and os.path.exists(path) else None for path in paths)
+
+    async def watch(self) -> None:
+        """
+        Reload whenever the model or label map file changes. A change is only acted on
+        once the files have been stable for one poll, so half-written files are skipped.
+        """
+        watched, loaded, pending = None, None, None
+        while True:
+            await asyncio.sleep(self.watch_interval_s)
+            # Follow the files of whatever model is in service (admin reloads may change them)
+            paths = self.current_paths()
+            if paths != watched:
+                watched, loaded, pending = paths, self._mtimes(paths), None
+                continue
+
+            mtimes = self._mtimes(paths)
+            if mtimes == loaded:
+                pending = None
+                continue
+            if mtimes != pending:
+                # Changed since the last poll: wait until it settles
+                pending = mtimes
+                continue
+
+            await self.reload(*paths)
+            loaded, pending = mtimes, None
@@ -0,0 +1,72 @@
+import numpy as np
+from typing import Tuple
+
+
+def _sigmoid(x: np.ndarray) -> np.ndarray:
+    # tanh form: 1 / (1 + exp(-x)) overflows in exp for large negative pre-activations
+    return 0.5 * (1.0 + np.tanh(0.5 * x))
+
+
+class NumpyGRUNetwork:
+    """
+    Forward pass of the train.py architecture in vectorized NumPy:
+    GRU (Keras defaults: tanh / sigmoid, reset_after=True) -> Dense(relu) -> Dense(softmax).
+    Dropout is inactive at inference. Weights come from the .npz written by train.py,
+    so serving needs no TensorFlow. Holds no mutable state and is safe to share
+    between threads.
+    """
+    def __init__(self, weights):
+        self.kernel = np.asarray(weights['gru_kernel'], dtype=np.float32)  # [Features, 3 * Units]
+        self.recurrent_kernel = np.asarray(weights['gru_recurrent_kernel'], dtype=np.float32)  # [Units, 3 * Units]
+        gru_bias = np.asarray(weights['gru_bias'], dtype=np.float32)  # [2, 3 * Units]: input, recurrent
+        self.input_bias = gru_bias[0]
+        self.recurrent_bias = gru_bias[1]
+        self.dense_kernel = np.asarray(weights['dense_kernel'], dtype=np.float32)
+        self.dense_bias = np.asarray(weights['dense_bias'], dtype=np.float32)
+        self.output_kernel = np.asarray(weights['output_kernel'], dtype=np.float32)
+        self.output_bias = np.asarray(weights['output_bias'], dtype=np.float32)
+        self.time_steps = int(weights['time_steps'])
+
+        self.num_features = self.kernel.shape[0]
+        self.units = self.recurrent_kernel.shape[0]
+        self.num_classes = self.output_kernel.shape[1]
+
+    @classmethod
+    def load(cls, path: str) -> "NumpyGRUNetwork":
+        with np.load(path) as weights:
+            return cls(weights)
+
+    def _gru_cell(self, x_proj: np.ndarray, state: np.ndarray) -> np.ndarray:
+        """One GRU step from precomputed input projections [N, 3 * Units]."""
+        units = self.units
+        h_proj = state @ self.recurrent_kernel + self.recurrent_bias
+        z = _sigmoid(x_proj[:, :units] + h_proj[:, :units])
+        r = _sigmoid(x_proj[:, units:2 * units] + h_proj[:, units:2 * units])
+        candidate = np.tanh(x_proj[:, 2 * units:] + r * h_proj[:, 2 * units:])
+        return z * state + (1.0 - z) * candidate
+
+    def _head(self, state: np.ndarray) -> np.ndarray:
+        hidden = np.maximum(state @ self.dense_kernel + self.dense_bias, 0.0)
+        logits = hidden @ self.output_kernel + self.output_bias
+        logits -= logits.max(axis=1, keepdims=True)
+        exp = np.exp(logits)
+        return exp / exp.sum(axis=1, keepdims=True)
+
+    def forward(self, windows: np.ndarray) -> np.ndarray:
+        """Class probabilities [N, Classes] for windows [N, Time, Features]."""
+        windows = np.asarray(windows, dtype=np.float32)
+        batch, time_steps, features = windows.shape
+        # Input projections for every time step in a single matmul
+        x_proj = (windows.reshape(batch * time_steps, features) @ self.kernel + self.input_bias)
+        x_proj = x_proj.reshape(batch, time_steps, -1)
+
+        state = np.zeros((batch, self.units), dtype=np.float32)
+        for t in range(time_steps):
+            state = self._gru_cell(x_proj[:, t], state)
+        return self._head(state)
+
+    def step(self, frames: np.ndarray, state: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Advance [N, Features] frames by one step; returns (probabilities, next state)."""
+        x_proj = np.asarray(frames, dtype=np.float32) @ self.kernel + self.input_bias
+        next_state = self._gru_cell(x_proj, state)
+        return self._head(next_state), next_state
@@ -0,0 +1,107 @@
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+import numpy as np
+from shared import metrics
+from shared.config import (
+    BUFFER_SIZE, NUM_FEATURES, PREDICTION_CACHE_SIZE, PREDICTION_CACHE_PROJECTIONS, PREDICTION_CACHE_QUANTUM
+)
+
+Prediction = Tuple[Optional[str], float]
+
+# Weight of the newest miss in the running estimate of one inference's cost
+MISS_COST_SMOOTHING = 0.1
+# Fixed seed: every session and worker hashes windows identically
+PROJECTION_SEED = 7
+
+_projections = {}
+_projections_lock = threading.Lock()
+
+
+def _random_projection(num_projections: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Shared [num_projections, BUFFER_SIZE * NUM_FEATURES] unit directions and bucket offsets in [0, 1)."""
+    with _projections_lock:
+        if num_projections not in _projections:
+            rng = np.random.default_rng(PROJECTION_SEED)
+            directions = rng.normal(size=(num_projections, BUFFER_SIZE * NUM_FEATURES))
+            directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+            _projections[num_projections] = (
+                directions.astype(np.float32), rng.uniform(size=num_projections).astype(np.float32)
+            )
+        return _projections[num_projections]
+
+
+class PredictionCache:
+    """
+    Per-session memo of recent predictions, keyed by a locality-sensitive hash of the window.
+
+    The window is projected onto a few fixed random directions and each projection is
+    bucketed with width `quantum`. Snapping the raw 20x162 values to a grid would almost
+    never repeat (jitter on any one value crosses a cell edge), while the projections
+    of a hand held still stay in the same buckets, so those windows reuse the last
+    prediction instead of invoking the model. Bounded LRU; `quantum` trades hit rate
+    against fidelity.
+
+    Used sequentially by one session: lookup() remembers the key that the following
+    store() fills in.
+    """
+    def __init__(self, max_entries: int = PREDICTION_CACHE_SIZE, quantum: float = PREDICTION_CACHE_QUANTUM,
+                 num_projections: int = PREDICTION_CACHE_PROJECTIONS):
+        self.max_entries = max_entries
+        self.quantum = quantum
+        self._directions, self._offsets = _random_projection(num_projections)
+        self._entries: "OrderedDict[bytes, Prediction]" = OrderedDict()
+        self._sketch = np.zeros(num_projections, dtype=np.float32)
+        self._last_key: Optional[bytes] = None
+        self._miss_cost_ms = 0.0
+
+        self._hits = metrics.counter("cache.hits")
+        self._misses = metrics.counter("cache.misses")
+        self._saved_ms = metrics.counter("cache.saved_ms")
+        self._hit_rate = metrics.gauge("cache.hit_rate")
+
+    def _key(self, window: np.ndarray) -> bytes:
+        np.dot(self._directions, np.asarray(window, dtype=np.float32).reshape(-1), out=self._sketch)
+        self._sketch /= self.quantum
+        self._sketch += self._offsets
+        return np.floor(self._sketch).astype(np.int32).tobytes()
+
+    def lookup(self, window: np.ndarray) -> Optional[Prediction]:
+        """Cached prediction for a (BUFFER_SIZE, NUM_FEATURES) window, or None on a miss."""
+        self._last_key = self._key(window)
+        prediction = self._entries.get(self._last_key)
+        if prediction is None:
+            self._misses.inc()
+        else:
+            self._entries.move_to_end(self._last_key)
+            self._hits.inc()
+            self._saved_ms.inc(self._miss_cost_ms)
+        total = self._hits.value + self._misses.value
+        self._hit_rate.set(self._hits.value / total)
+        return prediction
+
+    def store(self, prediction: Prediction, inference_ms: Optional[float]) -> None:
+        """
+        Remember the model's prediction for the window of the last lookup() miss.
+        `inference_ms` is the model time it took (None if unknown: the cost estimate is kept).
+        """
+        if inference_ms is not None:
+            if self._miss_cost_ms:
+                self._miss_cost_ms += MISS_COST_SMOOTHING * (inference_ms - self._miss_cost_ms)
+            else:
+                self._miss_cost_ms = inference_ms
+        if self._last_key is None or prediction[0] is None:
+            # Failed predictions are not worth repeating
+            return
+        self._entries[self._last_key] = prediction
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._last_key = None
+
+    @property
+    def nbytes(self) -> int:
+        """Per-session bytes (the projection is shared by all sessions)."""
+        return self._sketch.nbytes + len(self._entries) * (self._sketch.size * 4 + 64)
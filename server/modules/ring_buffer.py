@@ -0,0 +1,49 @@
+import numpy as np
+
+
+class FrameRingBuffer:
+    """
+    Fixed-size window of feature frames in a preallocated contiguous float32 array.
+
+    Each frame is written twice, at slot i and i + maxlen, so the latest `maxlen`
+    frames always form one contiguous slice: window() is a zero-copy view that can
+    be handed straight to the interpreter. Appending never allocates.
+    Supports len(), indexing and iteration like the deque it replaces.
+    """
+    def __init__(self, maxlen: int, width: int, dtype=np.float32):
+        self.maxlen = maxlen
+        self.width = width
+        self._data = np.zeros((2 * maxlen, width), dtype=dtype)
+        self._next = 0  # Slot of the next write, which is also the oldest frame once full
+        self._size = 0
+
+    def append(self, frame) -> None:
+        """Copy one frame (any sequence of `width` numbers) into the buffer in place."""
+        self._data[self._next] = frame
+        self._data[self._next + self.maxlen] = frame
+        self._next = (self._next + 1) % self.maxlen
+        if self._size < self.maxlen:
+            self._size += 1
+
+    def window(self) -> np.ndarray:
+        """View of the buffered frames, oldest first, shaped (len(self), width)."""
+        if self._size < self.maxlen:
+            return self._data[:self._size]
+        return self._data[self._next:self._next + self.maxlen]
+
+    def clear(self) -> None:
+        self._next = 0
+        self._size = 0
+
+    @property
+    def nbytes(self) -> int:
+        return self._data.nbytes
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index):
+        return self.window()[index]
+
+    def __iter__(self):
+        return iter(self.window())
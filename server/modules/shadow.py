@@ -0,0 +1,112 @@
+import os
+import queue
+import random
+import threading
+from typing import Dict, Optional
+import numpy as np
+from shared import metrics
+from shared.config import (
+    SHADOW_MODEL_PATH, SHADOW_SAMPLE_RATE, SHADOW_QUEUE_SIZE, INFERENCE_BACKEND
+)
+from server.modules.model_loader import GestureModel
+
+CONFIDENCE_DELTA_BUCKETS = (0.01, 0.02, 0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0)
+
+
+class ShadowEvaluator:
+    """
+    Runs a candidate model next to the production one on a sample of live windows.
+
+    offer() is called on the primary path after each prediction: it samples, copies
+    the window and hands it to a background thread with put_nowait, so it never
+    waits. When the queue is full the window is dropped (shadow.dropped) instead of
+    adding latency. The worker compares the candidate's gesture and confidence with
+    the primary result; stats() returns agreement, confidence deltas and, per primary
+    class, what the candidate predicted instead.
+    """
+    def __init__(self, candidate: GestureModel, sample_rate: float = SHADOW_SAMPLE_RATE,
+                 queue_size: int = SHADOW_QUEUE_SIZE):
+        self.candidate = candidate
+        self.sample_rate = sample_rate
+        self._queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+
+        self._lock = threading.Lock()
+        self._compared = 0
+        self._agreements = 0
+        self._confidence_delta_sum = 0.0
+        self._per_class: Dict[str, Dict] = {}
+
+        self._sampled = metrics.counter("shadow.sampled")
+        self._dropped = metrics.counter("shadow.dropped")
+        self._abs_delta = metrics.histogram("shadow.confidence_abs_delta", buckets=CONFIDENCE_DELTA_BUCKETS)
+
+        self._worker = threading.Thread(target=self._run, name="shadow-model", daemon=True)
+        self._worker.start()
+
+    def offer(self, window: np.ndarray, gesture: Optional[str], confidence: float) -> None:
+        """Maybe queue a copy of `window` and the primary prediction. Never blocks."""
+        if random.random() >= self.sample_rate:
+            return
+        self._sampled.inc()
+        try:
+            self._queue.put_nowait((np.array(window, dtype=np.float32), gesture, confidence))
+        except queue.Full:
+            self._dropped.inc()
+
+    def _run(self) -> None:
+        try:
+            # Lowest CPU priority for this thread (Linux applies nice values per thread)
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+        except (AttributeError, OSError):
+            pass
+        while True:
+            window, primary_gesture, primary_confidence = self._queue.get()
+            candidate_gesture, candidate_confidence = self.candidate.predict(window)
+            self._record(primary_gesture, primary_confidence, candidate_gesture, candidate_confidence)
+
+    def _record(self, primary_gesture: Optional[str], primary_confidence: float,
+                candidate_gesture: Optional[str], candidate_confidence: float) -> None:
+        delta = candidate_confidence - primary_confidence
+        self._abs_delta.observe(abs(delta))
+        agree = candidate_gesture == primary_gesture
+
+        with self._lock:
+            self._compared += 1
+            self._agreements += int(agree)
+            self._confidence_delta_sum += delta
+            row = self._per_class.setdefault(str(primary_gesture), {"count": 0, "disagreements": 0, "candidate": {}})
+            row["count"] += 1
+            if not agree:
+                row["disagreements"] += 1
+                row["candidate"][str(candidate_gesture)] = row["candidate"].get(str(candidate_gesture), 0) + 1
+
+    def stats(self) -> Dict:
+        """Aggregated primary-vs-candidate comparison so far."""
+        with self._lock:
+            compared = self._compared
+            return {
+                "candidate": self.candidate.model_path,
+                "sample_rate": self.sample_rate,
+                "sampled": self._sampled.value,
+                "dropped": self._dropped.value,
+                "pending": self._queue.qsize(),
+                "compared": compared,
+                "agreement": self._agreements / compared if compared else None,
+                "mean_confidence_delta": self._confidence_delta_sum / compared if compared else None,
+                "per_class": {
+                    name: dict(row, candidate=dict(row["candidate"]))
+                    for name, row in self._per_class.items()
+                },
+            }
+
+
+def create_shadow_evaluator(model_path: Optional[str] = SHADOW_MODEL_PATH) -> Optional[ShadowEvaluator]:
+    """Shadow evaluator for SHADOW_MODEL_PATH, or None when shadowing is disabled."""
+    if not model_path:
+        return None
+    candidate = GestureModel(model_path, backend=INFERENCE_BACKEND, pool_size=1, metrics_prefix="shadow")
+    if not candidate.is_loaded:
+        print(f"[Shadow] Candidate model {model_path} could not be loaded; shadow evaluation disabled")
+        return None
+    print(f"[Shadow] Evaluating {model_path} on {SHADOW_SAMPLE_RATE:.0%} of inferred windows")
+    return ShadowEvaluator(candidate)
@@ -0,0 +1,137 @@
+import asyncio
+import multiprocessing as mp
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+from typing import Dict, Optional
+
+WORKER_POLL_INTERVAL = 0.5  # Seconds between liveness checks
+RESTART_BACKOFF_MAX = 10.0  # Upper bound for the delay before restarting a crash-looping worker
+STABLE_UPTIME = 30.0  # A worker alive this long resets its backoff
+
+
+def _exit_with_parent(parent_pid: int) -> None:
+    """Stop the worker if the supervisor dies without terminating it (e.g. SIGKILL)."""
+    while os.getppid() == parent_pid:
+        time.sleep(WORKER_POLL_INTERVAL)
+    os._exit(1)
+
+
+def _worker_main(host: str, port: int, sock: Optional[socket.socket], parent_pid: int) -> None:
+    """Entry point of a worker process: its own event loop, model and sessions."""
+    from server.ws_server import start_server
+
+    # The supervisor handles Ctrl+C and terminates workers explicitly
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    threading.Thread(target=_exit_with_parent, args=(parent_pid,), daemon=True).start()
+    asyncio.run(start_server(host, port, reuse_port=sock is None, sock=sock))
+
+
+class WorkerSupervisor:
+    """
+    Pre-forks N server processes sharing one port and restarts any that exit.
+
+    On Linux every worker binds the port itself with SO_REUSEPORT and the kernel
+    spreads connections across them by connection hash, so a websocket session and
+    its client_id stay on one worker for the whole connection. Elsewhere (macOS and
+    the BSDs accept SO_REUSEPORT but do not balance it: one worker would take nearly
+    every connection) the supervisor binds the listening socket once and the workers
+    accept from it.
+    Workers are spawned (not forked) so each loads its own model instance.
+    """
+    def __init__(self, num_workers: int, host: str, port: int):
+        self.num_workers = num_workers
+        self.host = host
+        self.port = port
+
+        self._context = mp.get_context("spawn")
+        self._workers: Dict[int, mp.Process] = {}
+        self._started_at: Dict[int, float] = {}
+        self._backoff: Dict[int, float] = {}
+        self._restart_at: Dict[int, float] = {}  # Slots waiting out their backoff
+        self._restarts = 0
+        self._running = False
+        reuse_port = sys.platform.startswith("linux") and hasattr(socket, "SO_REUSEPORT")
+        self._sock = None if reuse_port else self._bind_shared_socket()
+
+    def _bind_shared_socket(self) -> socket.socket:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((self.host, self.port))
+        sock.listen(socket.SOMAXCONN)
+        sock.set_inheritable(True)
+        return sock
+
+    def _spawn(self, slot: int) -> None:
+        process = self._context.Process(
+            target=_worker_main,
+            args=(self.host, self.port, self._sock, os.getpid()),
+            name=f"gesture-worker-{slot}",
+            daemon=True,
+        )
+        process.start()
+        self._workers[slot] = process
+        self._started_at[slot] = time.monotonic()
+        print(f"[Supervisor] Worker {slot} started (pid {process.pid})")
+
+    def _check_workers(self) -> None:
+        # Never sleeps: a crash-looping worker waits out its backoff while the others are still checked
+        now = time.monotonic()
+        for slot, process in list(self._workers.items()):
+            if slot in self._restart_at:
+                if now >= self._restart_at[slot]:
+                    del self._restart_at[slot]
+                    self._restarts += 1
+                    self._spawn(slot)
+                continue
+
+            if process.is_alive():
+                if now - self._started_at[slot] > STABLE_UPTIME:
+                    self._backoff[slot] = 0.0
+                continue
+
+            delay = self._backoff.get(slot, 0.0)
+            print(f"[Supervisor] Worker {slot} (pid {process.pid}) exited with code {process.exitcode}; "
+                  f"restarting in {delay:.1f}s")
+            self._backoff[slot] = min(RESTART_BACKOFF_MAX, max(0.5, delay * 2))
+            if delay:
+                self._restart_at[slot] = now + delay
+            else:
+                self._restarts += 1
+                self._spawn(slot)
+
+    def _stop(self, *_) -> None:
+        self._running = False
+
+    def run(self) -> None:
+        """Start all workers and supervise them until interrupted."""
+        mode = "SO_REUSEPORT" if self._sock is None else "shared accept socket"
+        print(f"[Supervisor] Starting {self.num_workers} workers on ws://{self.host}:{self.port} ({mode})")
+        signal.signal(signal.SIGTERM, self._stop)
+
+        self._running = True
+        for slot in range(self.num_workers):
+            self._spawn(slot)
+
+        try:
+            while self._running:
+                time.sleep(WORKER_POLL_INTERVAL)
+                if self._running:
+                    self._check_workers()
+        except KeyboardInterrupt:
+            print("\n[Supervisor] Shutdown by user.")
+        finally:
+            self.shutdown()
+
+    def shutdown(self) -> None:
+        for process in self._workers.values():
+            if process.is_alive():
+                process.terminate()
+        for process in self._workers.values():
+            process.join(timeout=5)
+        if self._sock is not None:
+            self._sock.close()
+        print(f"[Supervisor] All workers stopped ({self._restarts} restarts).")
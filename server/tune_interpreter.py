@@ -0,0 +1,145 @@
+"""
+Benchmark TFLite interpreter settings on this machine and save the best combination.
+
+    python -m server.tune_interpreter --objective latency
+    python -m server.tune_interpreter --objective throughput
+
+latency: median time of one window on an otherwise idle pool (what a single session sees).
+throughput: windows/sec with --callers threads sharing the pool (many concurrent sessions).
+The result is written to ml_pipeline/models/interpreter_tuning.json, which GestureModel
+applies on top of the TFLITE_* / MODEL_POOL_SIZE settings in shared/config.py.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+import numpy as np
+
+from server.modules.model_loader import DEFAULT_MODEL_PATH, DEFAULT_TUNING_PATH, GestureModel
+from shared.config import BUFFER_SIZE, NUM_FEATURES, MODEL_POOL_SIZE
+
+LATENCY_RUNS = 300
+THROUGHPUT_SECONDS = 2.0
+
+
+def _powers_of_two_up_to(limit: int) -> List[int]:
+    values = []
+    value = 1
+    while value < limit:
+        values.append(value)
+        value *= 2
+    values.append(limit)
+    return values
+
+
+def candidate_settings(objective: str, cpu_count: int) -> List[Dict]:
+    """Combinations to try: threads per interpreter x XNNPACK (x pool size for throughput)."""
+    candidates = []
+    for use_xnnpack in (True, False):
+        for num_threads in _powers_of_two_up_to(cpu_count):
+            if objective == "latency":
+                candidates.append({"num_threads": num_threads, "use_xnnpack": use_xnnpack,
+                                   "pool_size": MODEL_POOL_SIZE})
+                continue
+            # Don't oversubscribe the CPU by more than 2x in total
+            for pool_size in _powers_of_two_up_to(cpu_count):
+                if pool_size * num_threads <= 2 * cpu_count:
+                    candidates.append({"num_threads": num_threads, "use_xnnpack": use_xnnpack,
+                                       "pool_size": pool_size})
+    return candidates
+
+
+def measure_latency(model: GestureModel, window: np.ndarray) -> float:
+    """Median milliseconds per single-window prediction."""
+    timings = []
+    for _ in range(LATENCY_RUNS):
+        start = time.perf_counter()
+        model.predict(window)
+        timings.append((time.perf_counter() - start) * 1000)
+    return float(np.median(timings))
+
+
+def measure_throughput(model: GestureModel, window: np.ndarray, callers: int) -> float:
+    """Windows per second with `callers` threads predicting concurrently."""
+    deadline = time.perf_counter() + THROUGHPUT_SECONDS
+
+    def caller() -> int:
+        count = 0
+        while time.perf_counter() < deadline:
+            model.predict(window)
+            count += 1
+        return count
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=callers) as executor:
+        total = sum(executor.map(lambda _: caller(), range(callers)))
+    return total / (time.perf_counter() - start)
+
+
+def tune(model_path: str, objective: str, callers: int) -> Dict:
+    cpu_count = os.cpu_count() or 1
+    window = np.random.default_rng(0).normal(size=(BUFFER_SIZE, NUM_FEATURES)).astype(np.float32)
+    results = []
+
+    for settings in candidate_settings(objective, cpu_count):
+        model = GestureModel(model_path, backend="tflite", interpreter_settings=settings)
+        if not model.is_loaded:
+            continue
+        model.warm_up()
+        if objective == "latency":
+            score = measure_latency(model, window)
+            print(f"[Tuner] {settings}: {score:.3f} ms")
+        else:
+            score = measure_throughput(model, window, callers)
+            print(f"[Tuner] {settings}: {score:.0f} windows/s")
+        results.append(dict(settings, score=score))
+
+    if not results:
+        raise RuntimeError(f"Could not load {model_path} with any interpreter setting")
+
+    if objective == "latency":
+        best = min(results, key=lambda result: result["score"])
+    else:
+        best = max(results, key=lambda result: result["score"])
+    return {
+        "objective": objective,
+        "num_threads": best["num_threads"],
+        "use_xnnpack": best["use_xnnpack"],
+        "pool_size": best["pool_size"],
+        "score": best["score"],
+        "unit": "ms" if objective == "latency" else "windows/s",
+        "cpu_count": cpu_count,
+        "callers": callers if objective == "throughput" else 1,
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tune TFLite interpreter settings for this CPU")
+    parser.add_argument("--objective", choices=("latency", "throughput"), default="latency")
+    parser.add_argument("--model", default=DEFAULT_MODEL_PATH)
+    parser.add_argument("--output", default=DEFAULT_TUNING_PATH)
+    parser.add_argument("--callers", type=int, default=os.cpu_count() or 1,
+                        help="Concurrent predicting threads for the throughput objective")
+    args = parser.parse_args()
+
+    try:
+        tuning = tune(args.model, args.objective, args.callers)
+    except RuntimeError as e:
+        print(f"[Tuner] {e}")
+        sys.exit(1)
+
+    with open(args.output, 'w') as f:
+        json.dump(tuning, f, indent=2)
+    print(f"[Tuner] Best for {args.objective}: num_threads={tuning['num_threads']}, "
+          f"xnnpack={tuning['use_xnnpack']}, pool_size={tuning['pool_size']} "
+          f"({tuning['score']:.3f} {tuning['unit']})")
+    print(f"[Tuner] Saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
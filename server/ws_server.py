@@ -1,28 +1,112 @@
+import argparse
 import asyncio
+import functools
+import os
+import socket
 import websockets
-from shared.schemas import create_command_json, parse_message
+from concurrent.futures import Executor
+from typing import Optional
+from shared import metrics
+from shared.schemas import (
+    create_command_json, create_stats_json, create_reload_result_json, create_resync_json, parse_message,
+    is_batch_frame, unpack_batch, MESSAGE_TYPE_STATS, MESSAGE_TYPE_RELOAD_MODEL
+)
+from shared.delta_codec import DeltaDecoder, is_delta_frame
 from server.modules.gestures import GestureProcessor
+from server.modules.model_loader import warm_up_session_model
+from server.modules.batch_scheduler import BatchScheduler
+from server.modules.executor import LoopLagMonitor, get_executor
+from server.modules.model_reloader import ModelReloader
+from server.modules.shadow import ShadowEvaluator, create_shadow_evaluator
+from shared.config import (
+    BATCH_INFERENCE, EXECUTOR_MAX_WORKERS, MODEL_WARMUP_BACKGROUND, MODEL_WATCH_INTERVAL_S, ADMIN_TOKEN
+)
 
 DEFAULT_HOST = "0.0.0.0"
 DEFAULT_PORT = 8765
+LOOPBACK_ADDRESSES = ("127.0.0.1", "::1")
 
-async def handle_client(websocket):
-    """Handle incoming WebSocket connections and process gesture data."""
+def is_admin(websocket, data: dict) -> bool:
+    """Admin messages need ADMIN_TOKEN when one is configured, else a loopback client."""
+    if ADMIN_TOKEN is not None:
+        return data.get("token") == ADMIN_TOKEN
+    remote = websocket.remote_address
+    return bool(remote) and remote[0] in LOOPBACK_ADDRESSES
+
+async def iter_payloads(websocket):
+    """Messages of a connection, with client batches (protocol v4) expanded in order."""
+    batch_sizes = metrics.histogram("server.client_batch_size", buckets=metrics.SIZE_BUCKETS)
+    async for message in websocket:
+        if not is_batch_frame(message):
+            yield message
+            continue
+        try:
+            payloads = unpack_batch(message)
+        except ValueError as error:
+            print(f"[Server] Dropped batch: {error}")
+            continue
+        batch_sizes.observe(len(payloads))
+        for payload in payloads:
+            yield payload
+
+async def handle_client(websocket, scheduler: Optional[BatchScheduler] = None,
+                        executor: Optional[Executor] = None, reloader: Optional[ModelReloader] = None,
+                        shadow: Optional[ShadowEvaluator] = None):
+    """
+    Handle incoming WebSocket connections and process gesture data.
+    Each frame is awaited before the next one is read, so per-session ordering holds
+    even when the work runs on the executor.
+    """
     print("[Server] Client connected.")
-    
-    # Create a dedicated GestureProcessor for this session
-    processor = GestureProcessor()
-    
+    active_sessions = metrics.gauge("server.active_sessions")
+    active_sessions.set(active_sessions.value + 1)
+
+    # Create a dedicated GestureProcessor for this session (the model itself is shared)
+    processor = GestureProcessor(shadow=shadow)
+    # Rebuilds frames of delta-coded (protocol v3) clients
+    decoder = DeltaDecoder()
+
     try:
-        async for message in websocket:
+        async for message in iter_payloads(websocket):
             try:
-                data = parse_message(message)
+                if is_delta_frame(message):
+                    data = decoder.decode(message)
+                    if data is None:
+                        # Gap in the delta stream: wait for a keyframe
+                        if decoder.take_resync():
+                            await websocket.send(create_resync_json())
+                        continue
+                else:
+                    data = parse_message(message)
             except ValueError as error:
                 print(f"[Server] Dropped payload: {error}")
                 continue
 
+            if data.get("type") == MESSAGE_TYPE_STATS:
+                stats = metrics.snapshot()
+                if shadow is not None:
+                    stats["shadow"] = shadow.stats()
+                await websocket.send(create_stats_json(stats))
+                continue
+
+            if data.get("type") == MESSAGE_TYPE_RELOAD_MODEL:
+                if reloader is None or not is_admin(websocket, data):
+                    result = {"status": "forbidden"}
+                else:
+                    result = await reloader.reload(data.get("model_path"), data.get("label_map_path"))
+                await websocket.send(create_reload_result_json(result))
+                continue
+
             # Process data using the session-specific processor
-            gesture = processor.process_landmarks(data)
+            if scheduler is not None:
+                gesture = await processor.process_landmarks_async(
+                    data, scheduler.predict, executor, inference_ms=lambda: scheduler.window_ms
+                )
+            elif executor is not None:
+                loop = asyncio.get_running_loop()
+                gesture = await loop.run_in_executor(executor, processor.process_landmarks, data)
+            else:
+                gesture = processor.process_landmarks(data)
 
             if gesture:
                 command_json = create_command_json(gesture)
@@ -34,16 +118,71 @@ async def handle_client(websocket):
     except Exception as e:
         print(f"[Server] Error in handler: {e}")
     finally:
+        session_bytes = processor.memory_footprint()
+        metrics.histogram("session.memory_kb", buckets=(16, 32, 64, 128, 256, 512, 1024)).observe(session_bytes / 1024)
+        first_inference = processor.first_inference_ms
+        first_inference_text = f"{first_inference:.1f} ms" if first_inference is not None else "n/a"
+        print(f"[Server] Session stats: memory={session_bytes / 1024:.1f} KB, "
+              f"connect-to-first-inference={first_inference_text}")
+        active_sessions.set(active_sessions.value - 1)
         # Cleanup happens automatically when processor goes out of scope here
         del processor
         print("[Server] Session cleaned up.")
 
-async def start_server(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
-    """Start the WebSocket server for gesture detection."""
-    server = websockets.serve(handle_client, host, port)
-    print(f"[Server] GestureDetection server running on ws://{host}:{port}")
+async def start_server(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, reuse_port: bool = False,
+                       sock: Optional[socket.socket] = None):
+    """
+    Start the WebSocket server for gesture detection.
+    Workers of a multi-process server either bind with reuse_port (SO_REUSEPORT) or
+    accept on a listening socket inherited from the supervisor.
+    """
+    # Load and warm up the shared model so no session pays for it; in background mode
+    # connections are accepted right away and sessions use heuristics until it is ready
+    warmup = warm_up_session_model()
+    if MODEL_WARMUP_BACKGROUND:
+        print("[Server] Loading model in the background")
+    else:
+        warmup.join()
+    executor = get_executor()
+    if executor is not None:
+        print(f"[Server] Frame processing offloaded to a pool of {EXECUTOR_MAX_WORKERS} threads")
+    scheduler = None
+    if BATCH_INFERENCE:
+        scheduler = BatchScheduler(executor=executor)
+        print(f"[Server] Micro-batching enabled (max {scheduler.max_batch_size} windows / {scheduler.max_wait_ms} ms)")
+    reloader = ModelReloader()
+    shadow = create_shadow_evaluator()
+    # Keep references so the background tasks are not garbage collected
+    lag_monitor = asyncio.create_task(LoopLagMonitor().run())
+    model_watcher = None
+    if MODEL_WATCH_INTERVAL_S > 0:
+        model_watcher = asyncio.create_task(reloader.watch())
+        print(f"[Server] Watching model files for changes every {MODEL_WATCH_INTERVAL_S} s")
+    handler = functools.partial(handle_client, scheduler=scheduler, executor=executor, reloader=reloader,
+                                shadow=shadow)
+    if sock is not None:
+        server = websockets.serve(handler, sock=sock)
+    else:
+        server = websockets.serve(handler, host, port, reuse_port=reuse_port or None)
+    metrics.gauge("server.worker_pid").set(os.getpid())
+    print(f"[Server] GestureDetection server running on ws://{host}:{port} (pid {os.getpid()})")
     await server
     await asyncio.Future()
 
+def main():
+    parser = argparse.ArgumentParser(description="GestureDetection WebSocket server")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Number of server processes sharing the port (default: 1)")
+    args = parser.parse_args()
+
+    if args.workers > 1:
+        from server.supervisor import WorkerSupervisor
+        WorkerSupervisor(args.workers, args.host, args.port).run()
+    else:
+        asyncio.run(start_server(args.host, args.port))
+
 if __name__ == "__main__":
-    asyncio.run(start_server())
\ No newline at end of file
+    main()
+
@@ -7,10 +7,94 @@ FIST_DISTANCE_THRESHOLD = 0.1
 COOLDOWN = 0.8
 GESTURE_STABILITY_FRAMES = 5
 BUFFER_SIZE = 20  # Number of frames to keep in history
+NUM_FEATURES = 162  # Model features per frame: 21 hand + 33 pose landmarks (x, y, z)
 SMOOTHING_WINDOW = 3  # Number of frames for moving average smoothing
 MODEL_CONFIDENCE_THRESHOLD = 0.85
 INFERENCE_INTERVAL = 3 # Run inference every N frames
 
+# Model serving
+MODEL_POOL_SIZE = 2  # Pre-allocated interpreters shared by all sessions of a process
+# TFLite interpreter settings; `python -m server.tune_interpreter` writes a tuning file
+# (ml_pipeline/models/interpreter_tuning.json) that overrides these and MODEL_POOL_SIZE
+TFLITE_NUM_THREADS = None  # Threads per interpreter (None = TFLite default)
+TFLITE_USE_XNNPACK = True  # Apply the default XNNPACK CPU delegate
+# Serve the full-integer int8 model (gesture_model_int8.tflite, from ml_pipeline/scripts/quantize.py)
+QUANTIZED_INFERENCE = False
+# "tflite" (gesture_model.tflite) or "numpy" (gesture_model.npz, no TensorFlow needed at serve time)
+INFERENCE_BACKEND = "tflite"
+# Load and warm up the model on a background thread so the server accepts connections
+# immediately; sessions run heuristics only until the model is ready
+MODEL_WARMUP_BACKGROUND = False
+# Hot reload: poll the model and label map files every N seconds and swap in changes
+# (0 disables the watcher; the "reload_model" admin message works either way)
+MODEL_WATCH_INTERVAL_S = 0
+# Shadow evaluation: a candidate model compared with production on a sample of live windows
+SHADOW_MODEL_PATH = None  # Candidate model file (same INFERENCE_BACKEND); None disables it
+SHADOW_SAMPLE_RATE = 0.05  # Fraction of inferred windows copied to the shadow worker
+SHADOW_QUEUE_SIZE = 64  # Pending shadow windows; beyond this they are dropped, never waited for
+# Required in admin messages when set; otherwise they are only accepted from loopback clients
+ADMIN_TOKEN = None
+
+# Streaming inference: one GRU step per frame with a per-session hidden state
+# (uses gesture_model_step.tflite and evaluates every frame instead of every INFERENCE_INTERVAL)
+STREAMING_INFERENCE = False
+# Restart the hidden state after this many steps and whenever the hand is lost, so it never
+# carries more context than the training windows (BUFFER_SIZE frames from a zero state)
+STREAMING_STATE_MAX_FRAMES = BUFFER_SIZE
+
+# Per-session memoization of predictions for near-identical windows (e.g. a hand held still);
+# not used in streaming mode, where every step depends on the hidden state
+PREDICTION_CACHE = False
+PREDICTION_CACHE_SIZE = 8  # Entries per session (LRU)
+PREDICTION_CACHE_PROJECTIONS = 16  # Random projections in the window hash
+PREDICTION_CACHE_QUANTUM = 0.05  # Bucket width of each projection (normalized units)
+
+# Cross-session micro-batching (requires a model exported with a dynamic batch dimension)
+BATCH_INFERENCE = False
+BATCH_MAX_SIZE = 16  # Flush as soon as this many windows are pending
+BATCH_MAX_WAIT_MS = 2.0  # ...or when the oldest pending window has waited this long
+
+# Where CPU-bound frame processing runs: "inline" (on the event loop) or "thread" (bounded pool)
+INFERENCE_EXECUTOR = "inline"
+EXECUTOR_MAX_WORKERS = 4
+LOOP_LAG_INTERVAL_MS = 100  # Sampling period of the event-loop lag monitor
+
+# Client -> server landmark wire format: 1 = JSON text, 2 = packed binary frames,
+# 3 = delta-coded binary frames (the server accepts all of them on the same connection)
+WIRE_PROTOCOL_VERSION = 1
+WIRE_FLOAT16 = False  # Version 2 only: send float16 instead of float32 values
+DELTA_STEP = 0.001  # Version 3: delta quantization step; reconstruction error <= DELTA_STEP / 2
+DELTA_KEYFRAME_INTERVAL = 30  # Version 3: send a full frame at least this often
+# Client send queue: "latest" (only the newest frame waits), "drop_oldest" (bounded window,
+# new frames push out the oldest) or "drop_newest" (FIFO that rejects new frames when full)
+CLIENT_SEND_POLICY = "drop_oldest"
+CLIENT_SEND_QUEUE_SIZE = 5  # Frames (~170 ms at 30 FPS); ignored by "latest"
+# Client-side coalescing: frames waiting in the send queue go out as one batch message
+CLIENT_BATCHING = False
+CLIENT_BATCH_MAX_FRAMES = 8  # Frames per batch message (at most 32)
+CLIENT_BATCH_MAX_DELAY_MS = 0  # How long the sender may hold a frame waiting for more (0 = never)
+
+# Client landmark extraction: False runs both MediaPipe graphs serially on one worker thread;
+# True pipelines prepare -> hands || pose -> join/serialize stages on separate threads
+CLIENT_PIPELINE = False
+PIPELINE_QUEUE_SIZE = 1  # Frames buffered between pipeline stages (bounds added latency)
+# Adaptive pose rate: run the pose graph every POSE_EVERY_N_FRAMES frames, or sooner when the
+# hand moves, and hold the last pose in between (payloads still carry a pose every frame)
+ADAPTIVE_POSE = False
+POSE_EVERY_N_FRAMES = 5
+POSE_MOTION_THRESHOLD = 0.05  # Wrist movement (normalized image units) that forces a pose update
+# Hand ROI: once a hand is found, run the hand graph on a square crop around it and fall
+# back to the whole frame when tracking is lost
+HAND_ROI = False
+HAND_ROI_MARGIN = 1.0  # Added on every side, as a fraction of the hand box (tighter crops defeat palm detection)
+HAND_ROI_MIN_SIZE = 0.25  # Smallest crop side, as a fraction of the frame's shorter side
+HAND_ROI_FULL_FRAME_INTERVAL = 30  # Search the whole frame at least every N frames (new hands)
+PROCESSING_WIDTH = None  # Downscale images wider than this (px) before MediaPipe; None keeps them as is
+# Client frame pacing: take frames on absolute deadlines at VideoStream.TARGET_FPS, skipping missed
+# deadlines (False: as fast as camera and extraction allow). The server runs a model inference
+# every INFERENCE_INTERVAL frames, so TARGET_FPS / INFERENCE_INTERVAL inferences per second
+FRAME_PACING = False
+
 # Dynamic Thresholds (override default if present)
 GESTURE_THRESHOLDS = {
     "next_track": 0.8,
@@ -0,0 +1,210 @@
+"""
+Temporal delta coding of landmark frames (wire protocol version 3).
+
+Consecutive frames from the camera differ only slightly, so after a keyframe the
+client sends each frame as int8 multiples of a fixed step relative to the previous
+*reconstructed* frame. Because the encoder tracks exactly what the decoder rebuilds,
+quantization error never accumulates: every reconstructed value is within step / 2
+of the original. A frame whose delta does not fit in int8, a change in which
+landmarks are present, KEYFRAME_INTERVAL frames without a keyframe, or a resync
+request from the server all produce a keyframe instead.
+
+Frame layout: a fixed little-endian header (version, kind, flags, client_id length,
+sequence number, timestamp), the UTF-8 client_id, then
+- keyframe: the float32 step, then float32 hand (63) / pose (99) values
+- delta: int8 hand / pose deltas
+"""
+import struct
+import threading
+import time
+from typing import Any, Dict, Optional
+import numpy as np
+from shared import metrics
+from shared.config import DELTA_STEP, DELTA_KEYFRAME_INTERVAL
+from shared.schemas import FLAG_HANDS, FLAG_POSE, HANDS_LENGTH, POSE_LENGTH, BINARY_HEADER
+
+DELTA_PROTOCOL_VERSION = 3
+DELTA_HEADER = struct.Struct("<BBBBId")
+STEP = struct.Struct("<f")
+KIND_KEYFRAME = 0
+KIND_DELTA = 1
+INT8_LIMIT = 127
+SEQUENCE_MODULO = 1 << 32
+
+
+def _layout(flags: int):
+    """(key, slice) of each landmark group present in a frame, in wire order."""
+    groups = []
+    offset = 0
+    for flag, key, length in ((FLAG_HANDS, "hands", HANDS_LENGTH), (FLAG_POSE, "pose", POSE_LENGTH)):
+        if flags & flag:
+            groups.append((key, slice(offset, offset + length)))
+            offset += length
+    return groups, offset
+
+
+def is_delta_frame(message) -> bool:
+    """Whether a websocket message is a version 3 (delta-coded) frame."""
+    return isinstance(message, (bytes, bytearray, memoryview)) and len(message) > 0 and \
+        message[0] == DELTA_PROTOCOL_VERSION
+
+
+class DeltaEncoder:
+    """
+    Client side: turns landmark arrays into keyframes and deltas.
+
+    Not thread-safe except for request_keyframe(), which the receive loop may call
+    while frames are being encoded.
+    """
+    def __init__(self, client_id: str = "client", step: float = DELTA_STEP,
+                 keyframe_interval: int = DELTA_KEYFRAME_INTERVAL):
+        self.client_id = client_id.encode("utf-8")[:255]
+        self.step = np.float32(step)
+        self.keyframe_interval = keyframe_interval
+        self._sequence = 0
+        self._flags = 0
+        self._reference: Optional[np.ndarray] = None
+        self._since_keyframe = 0
+        self._force_keyframe = threading.Event()
+
+        # Totals for stats()
+        self.frames = 0
+        self.keyframes = 0
+        self.bytes = 0
+        self.raw_bytes = 0
+        self.max_error = 0.0
+
+    def request_keyframe(self) -> None:
+        """Make the next frame a keyframe (the server reported a gap with a resync message)."""
+        self._force_keyframe.set()
+
+    def encode(self, hands: Optional[np.ndarray], pose: Optional[np.ndarray],
+               timestamp: Optional[float] = None) -> Optional[bytes]:
+        """Encode one frame; None if neither hands nor pose were detected."""
+        flags = (FLAG_HANDS if hands is not None else 0) | (FLAG_POSE if pose is not None else 0)
+        if not flags:
+            return None
+        values = np.concatenate([np.asarray(v, dtype=np.float32).reshape(-1) for v in (hands, pose) if v is not None])
+
+        payload = None
+        if (self._reference is not None and flags == self._flags and not self._force_keyframe.is_set()
+                and self._since_keyframe < self.keyframe_interval):
+            quantized = np.rint((values - self._reference) / self.step)
+            if np.abs(quantized).max() <= INT8_LIMIT:
+                deltas = quantized.astype(np.int8)
+                self._reference += deltas.astype(np.float32) * self.step
+                payload = (KIND_DELTA, deltas.tobytes())
+                self._since_keyframe += 1
+        if payload is None:
+            self._force_keyframe.clear()
+            self._reference = values.copy()
+            payload = (KIND_KEYFRAME, STEP.pack(self.step) + values.tobytes())
+            self._since_keyframe = 0
+            self.keyframes += 1
+
+        self._flags = flags
+        kind, body = payload
+        header = DELTA_HEADER.pack(DELTA_PROTOCOL_VERSION, kind, flags, len(self.client_id), self._sequence,
+                                   time.time() if timestamp is None else timestamp)
+        self._sequence = (self._sequence + 1) % SEQUENCE_MODULO
+        message = b"".join((header, self.client_id, body))
+
+        self.frames += 1
+        self.bytes += len(message)
+        self.raw_bytes += BINARY_HEADER.size + len(self.client_id) + values.nbytes
+        self.max_error = max(self.max_error, float(np.abs(self._reference - values).max()))
+        return message
+
+    def stats(self) -> Dict[str, Any]:
+        """Compression relative to uncompressed float32 frames (protocol v2) and worst reconstruction error."""
+        return {
+            "frames": self.frames,
+            "keyframes": self.keyframes,
+            "bytes_per_frame": self.bytes / self.frames if self.frames else None,
+            "compression_ratio": self.raw_bytes / self.bytes if self.bytes else None,
+            "max_abs_error": self.max_error,
+        }
+
+
+class DeltaDecoder:
+    """
+    Server side, one per connection: rebuilds full frames from keyframes and deltas.
+
+    decode() returns None when a delta cannot be applied (no keyframe yet, a gap in
+    the sequence numbers or changed flags); the server then asks the client for a
+    resync and drops deltas until the next keyframe.
+    """
+    def __init__(self):
+        self._reference: Optional[np.ndarray] = None
+        self._flags = 0
+        self._step = np.float32(0)
+        self._next_sequence: Optional[int] = None
+        self._resync_pending = False
+        self._resync_requested = False  # Since the last keyframe
+
+        self._keyframes = metrics.counter("codec.keyframes")
+        self._deltas = metrics.counter("codec.deltas")
+        self._gaps = metrics.counter("codec.gaps")
+        self._bytes = metrics.counter("codec.bytes")
+        self._raw_bytes = metrics.counter("codec.raw_bytes")
+        self._ratio = metrics.gauge("codec.compression_ratio")
+
+    def take_resync(self) -> bool:
+        """True once per gap: whether to send the client a resync request now."""
+        pending, self._resync_pending = self._resync_pending, False
+        return pending
+
+    def decode(self, message: bytes) -> Optional[Dict[str, Any]]:
+        """Frame dict as parse_message returns it, or None if a resync is needed."""
+        if len(message) < DELTA_HEADER.size:
+            raise ValueError(f"Delta payload too short: {len(message)} bytes")
+        version, kind, flags, client_len, sequence, timestamp = DELTA_HEADER.unpack_from(message)
+        if version != DELTA_PROTOCOL_VERSION:
+            raise ValueError(f"Unsupported protocol version: {version}")
+        groups, count = _layout(flags)
+        offset = DELTA_HEADER.size + client_len
+        if kind == KIND_KEYFRAME:
+            expected = offset + STEP.size + 4 * count
+        elif kind == KIND_DELTA:
+            expected = offset + count
+        else:
+            raise ValueError(f"Unknown delta frame kind: {kind}")
+        if not count or len(message) != expected:
+            raise ValueError(f"Delta payload is {len(message)} bytes, expected {expected}")
+
+        in_sequence = sequence == self._next_sequence
+        self._next_sequence = (sequence + 1) % SEQUENCE_MODULO
+        if kind == KIND_KEYFRAME:
+            step = np.float32(STEP.unpack_from(message, offset)[0])
+            values = np.frombuffer(message, dtype="<f4", count=count, offset=offset + STEP.size)
+            if not (np.isfinite(step) and np.isfinite(values).all()):
+                raise ValueError("Keyframe contains NaN or infinite values")
+            self._step = step
+            self._reference = values.copy()
+            self._flags = flags
+            self._resync_requested = False
+            self._keyframes.inc()
+        elif in_sequence and self._reference is not None and flags == self._flags:
+            deltas = np.frombuffer(message, dtype=np.int8, count=count, offset=offset)
+            self._reference += deltas.astype(np.float32) * self._step
+            self._deltas.inc()
+        else:
+            if not self._resync_requested:
+                # First unusable frame since the last keyframe
+                self._resync_pending = self._resync_requested = True
+                self._gaps.inc()
+            self._reference = None
+            return None
+
+        self._bytes.inc(len(message))
+        self._raw_bytes.inc(BINARY_HEADER.size + client_len + 4 * count)
+        self._ratio.set(self._raw_bytes.value / self._bytes.value)
+        data: Dict[str, Any] = {
+            "version": version,
+            "timestamp": timestamp,
+            "client_id": bytes(message[DELTA_HEADER.size:offset]).decode("utf-8", errors="replace"),
+        }
+        for key, group in groups:
+            # Copies: the reference is updated in place by the next frame
+            data[key] = self._reference[group].copy()
+        return data
@@ -0,0 +1,165 @@
+"""
+Lightweight in-process metrics (counters, gauges and histograms).
+
+Metrics live in a process-wide registry keyed by name, so any module can record
+values and the server can report a snapshot of everything on demand.
+"""
+import bisect
+import threading
+from typing import Dict, Optional, Sequence
+
+DEFAULT_LATENCY_BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128)
+
+
+class Counter:
+    """Monotonically increasing count."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1) -> None:
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def snapshot(self) -> float:
+        return self._value
+
+    def reset(self) -> None:
+        with self._lock:
+            self._value = 0
+
+
+class Gauge:
+    """Last observed value."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._value = 0.0
+
+    def set(self, value: float) -> None:
+        self._value = value
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def snapshot(self) -> float:
+        return self._value
+
+    def reset(self) -> None:
+        self._value = 0.0
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram.
+    Percentiles are estimated as the upper bound of the bucket holding the rank.
+    """
+
+    def __init__(self, name: str, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS_MS):
+        self.name = name
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            # One extra slot for values above the last bucket
+            self._counts = [0] * (len(self.buckets) + 1)
+            self.count = 0
+            self.sum = 0.0
+            self.min: Optional[float] = None
+            self.max: Optional[float] = None
+
+    def observe(self, value: float) -> None:
+        slot = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[slot] += 1
+            self.count += 1
+            self.sum += value
+            if self.min is None or value < self.min:
+                self.min = value
+            if self.max is None or value > self.max:
+                self.max = value
+
+    def percentile(self, q: float) -> float:
+        """Estimate the q-th percentile (0-100)."""
+        if self.count == 0:
+            return 0.0
+        rank = max(1, int(round(q / 100.0 * self.count)))
+        seen = 0
+        for slot, bucket_count in enumerate(self._counts):
+            seen += bucket_count
+            if seen >= rank:
+                if slot < len(self.buckets):
+                    return min(self.buckets[slot], self.max)
+                return self.max
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            buckets = {f"le_{b:g}": n for b, n in zip(self.buckets, self._counts)}
+            buckets["le_inf"] = self._counts[-1]
+            return {
+                "count": self.count,
+                "mean": self.mean,
+                "min": self.min or 0.0,
+                "max": self.max or 0.0,
+                "p50": self.percentile(50),
+                "p95": self.percentile(95),
+                "p99": self.percentile(99),
+                "buckets": buckets,
+            }
+
+
+_registry: Dict[str, object] = {}
+_registry_lock = threading.Lock()
+
+
+def _get_or_create(name: str, factory):
+    metric = _registry.get(name)
+    if metric is None:
+        with _registry_lock:
+            metric = _registry.get(name)
+            if metric is None:
+                metric = factory()
+                _registry[name] = metric
+    return metric
+
+
+def counter(name: str) -> Counter:
+    return _get_or_create(name, lambda: Counter(name))
+
+
+def gauge(name: str) -> Gauge:
+    return _get_or_create(name, lambda: Gauge(name))
+
+
+def histogram(name: str, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS_MS) -> Histogram:
+    return _get_or_create(name, lambda: Histogram(name, buckets))
+
+
+def snapshot() -> Dict[str, object]:
+    """Return the current value of every registered metric."""
+    with _registry_lock:
+        metrics = dict(_registry)
+    return {name: metric.snapshot() for name, metric in sorted(metrics.items())}
+
+
+def reset() -> None:
+    """Reset all registered metrics (mostly useful for benchmarks and tests)."""
+    with _registry_lock:
+        metrics = list(_registry.values())
+    for metric in metrics:
+        metric.reset()
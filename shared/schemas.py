@@ -1,9 +1,42 @@
 #type: ignore
 import json
+import struct
 import time
-from typing import Optional, Dict, Any
+import numpy as np
+from typing import Optional, Dict, Any, List, Tuple, Union
 
 PROTOCOL_VERSION = "1.0"
+# Larger client messages are rejected before any parsing (a JSON landmark frame is ~3.4 KB)
+MAX_MESSAGE_BYTES = 16 * 1024
+
+# Version 2: landmarks as a websocket binary frame. Fixed little-endian header
+# (version, dtype code, flags, client_id length, timestamp), the UTF-8 client_id,
+# then the packed hand (63) and pose (99) arrays that are present.
+BINARY_PROTOCOL_VERSION = 2
+BINARY_HEADER = struct.Struct("<BBBBd")
+BINARY_DTYPES = {0: np.dtype("<f4"), 1: np.dtype("<f2")}
+FLAG_HANDS = 0x01
+FLAG_POSE = 0x02
+HANDS_LENGTH = 21 * 3
+POSE_LENGTH = 33 * 3
+# First bytes of JSON text (an object, possibly after whitespace); binary frames start with their version
+JSON_LEADING_BYTES = frozenset(b"{ \t\r\n")
+# Python types json.loads produces for JSON numbers (bool is a subclass of int, but not a number here)
+JSON_NUMBER_TYPES = frozenset((int, float))
+
+# Version 4: several client messages coalesced into one binary frame. Header
+# (version, frame count), then per frame its kind (text / binary), length and bytes.
+BATCH_PROTOCOL_VERSION = 4
+BATCH_HEADER = struct.Struct("<BB")
+BATCH_ENTRY = struct.Struct("<BH")
+BATCH_KIND_TEXT = 0
+BATCH_KIND_BINARY = 1
+MAX_BATCH_FRAMES = 32
+
+# Control messages share the versioned envelope and are told apart by "type"
+MESSAGE_TYPE_STATS = "stats"
+MESSAGE_TYPE_RELOAD_MODEL = "reload_model"  # Admin: {"model_path"?, "label_map_path"?, "token"?}
+MESSAGE_TYPE_RESYNC = "resync"  # Server -> client: the next delta-coded frame must be a keyframe
 
 
 def serialize_landmarks(
@@ -49,14 +82,238 @@ def serialize_landmarks(
     return json.dumps(data) if has_payload else None
 
 
-def parse_message(message: str) -> Dict[str, Any]:
-    """Parse client payload and enforce protocol version."""
+def pack_landmarks(
+    hands: Optional[np.ndarray],
+    pose: Optional[np.ndarray],
+    client_id: str = "client",
+    timestamp: Optional[float] = None,
+    half: bool = False,
+) -> bytes:
+    """
+    Encode hand (63) and pose (99) landmark arrays as a version 2 binary frame.
+
+    Args:
+        hands: Hand landmarks, or None when no hand was detected
+        pose: Pose landmarks, or None when no pose was detected
+        client_id: Stable identifier for the client instance (at most 255 UTF-8 bytes)
+        timestamp: Capture time (defaults to now)
+        half: Send float16 instead of float32 (half the size, ~1e-3 precision)
+    """
+    dtype_code = 1 if half else 0
+    dtype = BINARY_DTYPES[dtype_code]
+    client_bytes = client_id.encode("utf-8")[:255]
+    flags = 0
+    parts = []
+    if hands is not None:
+        flags |= FLAG_HANDS
+        parts.append(np.asarray(hands, dtype=dtype).tobytes())
+    if pose is not None:
+        flags |= FLAG_POSE
+        parts.append(np.asarray(pose, dtype=dtype).tobytes())
+    header = BINARY_HEADER.pack(
+        BINARY_PROTOCOL_VERSION, dtype_code, flags, len(client_bytes),
+        time.time() if timestamp is None else timestamp,
+    )
+    return b"".join([header, client_bytes] + parts)
+
+
+def landmark_arrays(results) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+    """Flat float32 hand (63) and pose (99) arrays of MediaPipe results; None where not detected."""
+    hands = None
+    pose = None
+    if results.multi_hand_landmarks:
+        hands = np.array([(lm.x, lm.y, lm.z) for lm in results.multi_hand_landmarks[0].landmark],
+                         dtype=np.float32).reshape(-1)
+    if results.pose_landmarks:
+        pose = np.array([(lm.x, lm.y, lm.z) for lm in results.pose_landmarks.landmark],
+                        dtype=np.float32).reshape(-1)
+    return hands, pose
+
+
+def serialize_landmarks_binary(results, client_id: str = "client", half: bool = False) -> Optional[bytes]:
+    """
+    Convert MediaPipe landmark results to a version 2 binary frame (see pack_landmarks).
+
+    Returns:
+        Bytes to send as a websocket binary message, or None if no landmarks detected
+    """
+    hands, pose = landmark_arrays(results)
+    if hands is None and pose is None:
+        return None
+    return pack_landmarks(hands, pose, client_id, half=half)
+
+
+def parse_binary_landmarks(message: bytes) -> Dict[str, Any]:
+    """
+    Decode a version 2 binary frame into the same dict as parse_message.
+
+    "hands" and "pose" are float32 arrays; for float32 frames they are read-only
+    views of the message (numpy.frombuffer, no copy).
+    """
+    if len(message) < BINARY_HEADER.size:
+        raise ValueError(f"Binary payload too short: {len(message)} bytes")
+    version, dtype_code, flags, client_len, timestamp = BINARY_HEADER.unpack_from(message)
+    if version != BINARY_PROTOCOL_VERSION:
+        raise ValueError(f"Unsupported protocol version: {version}")
+    dtype = BINARY_DTYPES.get(dtype_code)
+    if dtype is None:
+        raise ValueError(f"Unsupported binary dtype code: {dtype_code}")
+
+    offset = BINARY_HEADER.size + client_len
+    expected = offset
+    if flags & FLAG_HANDS:
+        expected += HANDS_LENGTH * dtype.itemsize
+    if flags & FLAG_POSE:
+        expected += POSE_LENGTH * dtype.itemsize
+    if len(message) != expected:
+        raise ValueError(f"Binary payload is {len(message)} bytes, expected {expected}")
+
+    data: Dict[str, Any] = {
+        "version": version,
+        "timestamp": timestamp,
+        "client_id": bytes(message[BINARY_HEADER.size:offset]).decode("utf-8", errors="replace"),
+    }
+    for flag, key, length in ((FLAG_HANDS, "hands", HANDS_LENGTH), (FLAG_POSE, "pose", POSE_LENGTH)):
+        if flags & flag:
+            values = np.frombuffer(message, dtype=dtype, count=length, offset=offset)
+            if not np.isfinite(values).all():
+                raise ValueError(f'"{key}" contains NaN or infinite values')
+            data[key] = values if dtype_code == 0 else values.astype(np.float32)
+            offset += length * dtype.itemsize
+    return data
+
+
+def pack_batch(payloads: List[Union[str, bytes]]) -> bytes:
+    """Coalesce serialized messages (JSON text or binary frames) into one version 4 batch frame."""
+    if not 0 < len(payloads) <= MAX_BATCH_FRAMES:
+        raise ValueError(f"A batch holds 1 to {MAX_BATCH_FRAMES} frames, got {len(payloads)}")
+    parts = [BATCH_HEADER.pack(BATCH_PROTOCOL_VERSION, len(payloads))]
+    for payload in payloads:
+        if isinstance(payload, str):
+            kind, payload = BATCH_KIND_TEXT, payload.encode("utf-8")
+        else:
+            kind = BATCH_KIND_BINARY
+        parts.append(BATCH_ENTRY.pack(kind, len(payload)))
+        parts.append(payload)
+    return b"".join(parts)
+
+
+def is_batch_frame(message) -> bool:
+    """Whether a websocket message is a version 4 batch."""
+    return isinstance(message, (bytes, bytearray, memoryview)) and len(message) > 0 and \
+        message[0] == BATCH_PROTOCOL_VERSION
+
+
+def unpack_batch(message: bytes) -> List[Union[str, memoryview]]:
+    """
+    Split a version 4 batch into its messages, in the order they were queued.
+
+    Text entries are returned as str and binary entries as memoryviews of `message`,
+    ready for the same decoding as unbatched messages.
+    """
+    if len(message) > MAX_MESSAGE_BYTES * MAX_BATCH_FRAMES:
+        raise ValueError(f"Batch too large: {len(message)} bytes")
+    if len(message) < BATCH_HEADER.size:
+        raise ValueError(f"Batch payload too short: {len(message)} bytes")
+    version, count = BATCH_HEADER.unpack_from(message)
+    if version != BATCH_PROTOCOL_VERSION:
+        raise ValueError(f"Unsupported protocol version: {version}")
+    if not 0 < count <= MAX_BATCH_FRAMES:
+        raise ValueError(f"Batch of {count} frames (limit {MAX_BATCH_FRAMES})")
+
+    view = memoryview(message)
+    offset = BATCH_HEADER.size
+    payloads: List[Union[str, memoryview]] = []
+    for _ in range(count):
+        if offset + BATCH_ENTRY.size > len(message):
+            raise ValueError("Truncated batch")
+        kind, length = BATCH_ENTRY.unpack_from(message, offset)
+        offset += BATCH_ENTRY.size
+        if offset + length > len(message):
+            raise ValueError("Truncated batch")
+        payload = view[offset:offset + length]
+        offset += length
+        if kind == BATCH_KIND_TEXT:
+            payloads.append(str(payload, "utf-8"))
+        elif kind == BATCH_KIND_BINARY:
+            payloads.append(payload)
+        else:
+            raise ValueError(f"Unknown batch entry kind: {kind}")
+    if offset != len(message):
+        raise ValueError(f"Batch has {len(message) - offset} trailing bytes")
+    return payloads
+
+
+def parse_message(message: Union[str, bytes]) -> Dict[str, Any]:
+    """
+    Parse client payload and enforce protocol version (JSON text v1 or binary v2).
+    JSON text may also arrive in a binary websocket frame, as bytes starting with "{".
+
+    Oversized messages are rejected before decoding, and JSON "hands" / "pose" must
+    hold exactly 63 / 99 finite numbers (no strings or booleans); they are returned as
+    float32 arrays, like binary frames, so the processor never handles Python lists.
+    The validation costs a few microseconds per JSON frame; it is not a speed-up.
+    """
+    if len(message) > MAX_MESSAGE_BYTES:
+        raise ValueError(f"Payload too large: {len(message)} bytes")
+    if isinstance(message, (bytes, bytearray, memoryview)):
+        if len(message) == 0 or message[0] not in JSON_LEADING_BYTES:
+            return parse_binary_landmarks(message)
+        # A version 1 client sending its JSON as a binary frame
+        message = str(message, "utf-8")
+    # len() of text counts characters; a UTF-8 character takes up to 4 bytes on the wire
+    elif len(message) * 4 > MAX_MESSAGE_BYTES:
+        size = len(message.encode("utf-8"))
+        if size > MAX_MESSAGE_BYTES:
+            raise ValueError(f"Payload too large: {size} bytes")
     data = json.loads(message)
+    if not isinstance(data, dict):
+        raise ValueError("Payload is not a JSON object")
     if data.get("version") != PROTOCOL_VERSION:
         raise ValueError(f"Unsupported protocol version: {data.get('version')}")
+    present = []
+    for key, length in (("hands", HANDS_LENGTH), ("pose", POSE_LENGTH)):
+        values = data.get(key)
+        if values is None:
+            continue
+        if not isinstance(values, list) or len(values) != length:
+            raise ValueError(f'"{key}" must be a list of {length} numbers')
+        present.append((key, values))
+    if not present:
+        return data
+
+    # One type scan, conversion and finite check for both lists; the fields become views of the array
+    values = present[0][1] if len(present) == 1 else present[0][1] + present[1][1]
+    # Exact types: float32 conversion alone would accept "0.5" strings and true / false
+    if not JSON_NUMBER_TYPES.issuperset(map(type, values)):
+        raise ValueError('"hands" / "pose" must hold only numbers')
+    # json.loads accepts NaN / Infinity literals, and values beyond float32 range overflow to infinity
+    with np.errstate(over="ignore"):
+        array = np.array(values, dtype=np.float32)
+    if not np.isfinite(array).all():
+        raise ValueError('"hands" / "pose" contain NaN or infinite values')
+    offset = 0
+    for key, values in present:
+        data[key] = array[offset:offset + len(values)]
+        offset += len(values)
     return data
 
 
 def create_command_json(gesture: str) -> str:
     """Create JSON command to send from server to client."""
     return json.dumps({"gesture": gesture})
+
+
+def create_stats_json(stats: Dict[str, Any]) -> str:
+    """Create JSON reply to a stats request."""
+    return json.dumps({"type": MESSAGE_TYPE_STATS, "stats": stats})
+
+
+def create_reload_result_json(result: Dict[str, Any]) -> str:
+    """Create JSON reply to a reload_model request."""
+    return json.dumps({"type": MESSAGE_TYPE_RELOAD_MODEL, "result": result})
+
+
+def create_resync_json() -> str:
+    """Ask the client's delta encoder for a keyframe (sent after a gap in the frame sequence)."""
+    return json.dumps({"type": MESSAGE_TYPE_RESYNC})
@@ -1,8 +1,9 @@
 import unittest
 import numpy as np
 from collections import deque
+from types import SimpleNamespace
 from server.modules.gestures import GestureProcessor
-from shared.config import BUFFER_SIZE, SMOOTHING_WINDOW
+from shared.config import BUFFER_SIZE, SMOOTHING_WINDOW, STREAMING_STATE_MAX_FRAMES
 
 class TestGestureProcessor(unittest.TestCase):
     def setUp(self):
@@ -71,5 +72,28 @@ class TestGestureProcessor(unittest.TestCase):
         # Now buffer is [10, 20, 20] -> avg = 50/3 = 16.66
         self.assertAlmostEqual(smoothed[0], 16.666666, places=4)
 
+    def test_unloaded_model_is_not_ready(self):
+        # A model whose file failed to load must not send sessions down the inference path
+        processor = GestureProcessor(model=SimpleNamespace(is_loaded=False))
+        self.assertFalse(processor._ensure_model())
+        self.assertIsNone(processor.first_inference_ms)
+
+    def test_streaming_state_is_bounded(self):
+        # Stand-in step model whose state counts the frames it has seen
+        model = SimpleNamespace(is_loaded=True, initial_state=lambda: np.zeros((1, 1), dtype=np.float32),
+                                step=lambda frame, state: (None, 0.0, state + 1))
+        processor = GestureProcessor(model=model, streaming=True)
+        hand = {'hands': list(np.random.default_rng(0).uniform(0.2, 0.8, size=63)), 'pose': [0.5] * 99}
+        seen = []
+        for _ in range(3 * STREAMING_STATE_MAX_FRAMES):
+            processor.process_landmarks(hand)
+            seen.append(int(processor.hidden_state[0, 0]))
+        self.assertEqual(max(seen), STREAMING_STATE_MAX_FRAMES)
+        self.assertEqual(seen[STREAMING_STATE_MAX_FRAMES], 1)
+
+        # Losing the hand starts a new context
+        processor.process_landmarks({'hands': None, 'pose': [0.5] * 99})
+        self.assertEqual(int(processor.hidden_state[0, 0]), 1)
+
 if __name__ == '__main__':
     unittest.main()
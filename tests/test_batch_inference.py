@@ -0,0 +1,92 @@
+import os
+import sys
+import json
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+import numpy as np
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from server.modules import model_loader
+from server.modules.model_loader import GestureModel
+from shared.config import BUFFER_SIZE, NUM_FEATURES
+
+CLASSES = 3
+
+class FakeInterpreter:
+    """TFLite interpreter stand-in with a dynamic batch dimension that counts tensor allocations."""
+    allocations = 0
+
+    def __init__(self, model_content=None, num_threads=None, **options):
+        self.shape = [1, BUFFER_SIZE, NUM_FEATURES]
+        self.allocated = None
+        self.input = None
+
+    def get_input_details(self):
+        return [{'index': 0, 'shape': np.array(self.shape), 'shape_signature': np.array([-1, BUFFER_SIZE, NUM_FEATURES]),
+                 'dtype': np.float32, 'quantization': (0.0, 0)}]
+
+    def get_output_details(self):
+        return [{'index': 1, 'shape': np.array([self.shape[0], CLASSES]), 'dtype': np.float32, 'quantization': (0.0, 0)}]
+
+    def resize_tensor_input(self, index, shape):
+        self.shape = list(shape)
+
+    def allocate_tensors(self):
+        FakeInterpreter.allocations += 1
+        self.allocated = tuple(self.shape)
+
+    def set_tensor(self, index, value):
+        if value.shape != self.allocated:
+            raise ValueError(f"Input of shape {value.shape} for tensors allocated as {self.allocated}")
+        self.input = value
+
+    def invoke(self):
+        pass
+
+    def get_tensor(self, index):
+        return np.full((self.allocated[0], CLASSES), 1.0 / CLASSES, dtype=np.float32)
+
+class TestBatchInference(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        model_path = os.path.join(self.tmp.name, 'model.tflite')
+        labels_path = os.path.join(self.tmp.name, 'labels.json')
+        with open(model_path, 'wb') as f:
+            f.write(b'model')
+        with open(labels_path, 'w') as f:
+            json.dump({str(i): f"gesture_{i}" for i in range(CLASSES)}, f)
+        # Pools for new batch sizes are created lazily, so the fake stays in place for the whole test
+        self.patch = mock.patch.object(model_loader, '_import_tflite',
+                                       return_value=SimpleNamespace(Interpreter=FakeInterpreter))
+        self.patch.start()
+        self.model = GestureModel(model_path, labels_path, pool_size=2, backend="tflite",
+                                  interpreter_settings={"num_threads": 1})
+
+    def tearDown(self):
+        self.patch.stop()
+        self.tmp.cleanup()
+
+    def test_alternating_batch_sizes_do_not_reallocate(self):
+        self.assertTrue(self.model.supports_batching)
+        rng = np.random.default_rng(0)
+        sizes = [1, 5, 2, 16, 3, 1, 9, 2, 5, 16]
+
+        def run(sizes):
+            for size in sizes:
+                windows = rng.standard_normal((size, BUFFER_SIZE, NUM_FEATURES)).astype(np.float32)
+                results = self.model.predict_batch(windows)
+                self.assertEqual(len(results), size)
+                self.assertEqual(results[0][0], "gesture_0")
+
+        run(sizes)  # Allocates one pool per padded size (1, 2, 4, 8, 16) on first use
+        allocations = FakeInterpreter.allocations
+        run(sizes * 3)
+        self.assertEqual(FakeInterpreter.allocations, allocations)
+        self.assertEqual(sorted(self.model._batch_pools), [2, 4, 8, 16])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import os
+import sys
+import asyncio
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from server.modules.batch_scheduler import BatchScheduler
+from shared.config import BUFFER_SIZE, NUM_FEATURES
+
+class FailingModel:
+    def predict_batch(self, windows):
+        raise RuntimeError("invoke failed")
+
+class EchoModel:
+    """Labels each window with its first value, so callers can check they got their own result."""
+    def predict_batch(self, windows):
+        return [(str(int(window[0, 0])), 1.0) for window in windows]
+
+def windows(count):
+    return [np.full((BUFFER_SIZE, NUM_FEATURES), i, dtype=np.float32) for i in range(count)]
+
+class TestBatchScheduler(unittest.TestCase):
+    def run_batch(self, model, executor=None, count=3, max_batch_size=16):
+        async def run():
+            scheduler = BatchScheduler(model, max_batch_size=max_batch_size, max_wait_ms=1, executor=executor)
+            calls = [scheduler.predict(window) for window in windows(count)]
+            return await asyncio.wait_for(asyncio.gather(*calls, return_exceptions=True), 1.0)
+        return asyncio.run(run())
+
+    def test_callers_receive_their_own_result(self):
+        self.assertEqual(self.run_batch(EchoModel()), [("0", 1.0), ("1", 1.0), ("2", 1.0)])
+
+    def test_model_error_fails_every_caller_instead_of_hanging(self):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Timer flush on the loop, size flush on the loop, and the executor path
+            for options in (dict(), dict(max_batch_size=3), dict(executor=executor)):
+                with self.subTest(**{key: bool(value) for key, value in options.items()}):
+                    results = self.run_batch(FailingModel(), **options)
+                    self.assertEqual(len(results), 3)
+                    for result in results:
+                        self.assertIsInstance(result, RuntimeError)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import os
+import sys
+import unittest
+import numpy as np
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from shared.delta_codec import DeltaEncoder, DeltaDecoder, is_delta_frame
+
+STEP = 0.001
+
+def trajectory(rng, frames=300):
+    """Jittery hand and pose drifting slowly, with an occasional jump too large for one delta."""
+    hands = rng.uniform(0.2, 0.8, size=63).astype(np.float32)
+    pose = rng.uniform(0.2, 0.8, size=99).astype(np.float32)
+    for i in range(frames):
+        hands = hands + rng.normal(scale=0.004, size=63).astype(np.float32)
+        pose = pose + rng.normal(scale=0.002, size=99).astype(np.float32)
+        if i % 97 == 50:
+            hands = hands + 0.3
+        yield hands, pose
+
+class TestDeltaCodec(unittest.TestCase):
+    def test_reconstruction_error_is_bounded(self):
+        encoder, decoder = DeltaEncoder("c", step=STEP, keyframe_interval=30), DeltaDecoder()
+        for hands, pose in trajectory(np.random.default_rng(0)):
+            message = encoder.encode(hands, pose)
+            self.assertTrue(is_delta_frame(message))
+            data = decoder.decode(message)
+            self.assertLessEqual(np.abs(data["hands"] - hands).max(), STEP / 2 + 1e-6)
+            self.assertLessEqual(np.abs(data["pose"] - pose).max(), STEP / 2 + 1e-6)
+
+        stats = encoder.stats()
+        self.assertLessEqual(stats["max_abs_error"], STEP / 2 + 1e-6)
+        self.assertGreater(stats["compression_ratio"], 3)
+        # Periodic keyframes plus one per jump
+        self.assertLessEqual(stats["keyframes"], 300 // 31 + 1 + 3)
+
+    def test_gap_requests_one_resync(self):
+        encoder, decoder = DeltaEncoder("c", step=STEP), DeltaDecoder()
+        frames = list(trajectory(np.random.default_rng(1), frames=6))
+        self.assertIsNotNone(decoder.decode(encoder.encode(*frames[0])))
+        encoder.encode(*frames[1])  # Lost on the way
+        self.assertIsNone(decoder.decode(encoder.encode(*frames[2])))
+        self.assertIsNone(decoder.decode(encoder.encode(*frames[3])))
+        self.assertTrue(decoder.take_resync())
+        self.assertFalse(decoder.take_resync())
+
+        encoder.request_keyframe()
+        data = decoder.decode(encoder.encode(*frames[4]))
+        np.testing.assert_allclose(data["hands"], frames[4][0], atol=STEP / 2)
+        self.assertIsNotNone(decoder.decode(encoder.encode(*frames[5])))
+
+    def test_first_frame_of_a_connection_must_be_a_keyframe(self):
+        encoder = DeltaEncoder("c", step=STEP)
+        hands, pose = next(trajectory(np.random.default_rng(2)))
+        encoder.encode(hands, pose)
+        decoder = DeltaDecoder()
+        self.assertIsNone(decoder.decode(encoder.encode(hands, pose)))
+        self.assertTrue(decoder.take_resync())
+
+    def test_non_finite_keyframe_is_rejected(self):
+        hands, pose = next(trajectory(np.random.default_rng(3)))
+        hands = np.array(hands, dtype=np.float32)
+        hands[0] = np.nan
+        with self.assertRaises(ValueError):
+            DeltaDecoder().decode(DeltaEncoder("c", step=STEP).encode(hands, pose))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import os
+import sys
+import time
+import threading
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from client.capture.frame_grabber import FrameGrabber
+from shared import metrics
+
+class FakeCapture:
+    """cv2.VideoCapture stand-in: returns frame numbers, each read releasing one frame."""
+    def __init__(self, num_frames):
+        self.num_frames = num_frames
+        self.next_frame = 0
+        self.allowed = threading.Semaphore(0)
+
+    def release_frames(self, count):
+        for _ in range(count):
+            self.allowed.release()
+
+    def read(self):
+        self.allowed.acquire()
+        if self.next_frame >= self.num_frames:
+            return False, None
+        self.next_frame += 1
+        return True, self.next_frame - 1
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        time.sleep(0.005)
+
+class TestFrameGrabber(unittest.TestCase):
+    def setUp(self):
+        metrics.reset()
+
+    def test_keeps_only_the_newest_frame(self):
+        capture = FakeCapture(num_frames=5)
+        grabber = FrameGrabber(capture).start()
+
+        capture.release_frames(1)
+        self.assertEqual(grabber.wait_for_frame(timeout=1.0).frame, 0)
+        # Three frames arrive while the consumer is busy: only the last is handed out
+        capture.release_frames(3)
+        wait_for(lambda: grabber.frames_captured == 4)
+        self.assertEqual(grabber.wait_for_frame(timeout=1.0).frame, 3)
+        self.assertEqual(metrics.counter("client.frames_skipped").value, 2)
+        # The same frame is never returned twice
+        self.assertIsNone(grabber.wait_for_frame(timeout=0.05))
+        capture.release_frames(2)  # Run the source to its end so the thread exits
+        grabber.stop()
+
+    def test_stops_when_the_source_ends(self):
+        capture = FakeCapture(num_frames=1)
+        grabber = FrameGrabber(capture).start()
+        capture.release_frames(2)
+        wait_for(lambda: not grabber.running)
+        # The last frame is still delivered, then the grabber reports the end
+        self.assertEqual(grabber.wait_for_frame(timeout=1.0).frame, 0)
+        self.assertIsNone(grabber.wait_for_frame(timeout=1.0))
+
+if __name__ == '__main__':
+    unittest.main()
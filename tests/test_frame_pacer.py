@@ -0,0 +1,58 @@
+import os
+import sys
+import time
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from client.capture.frame_pacer import FramePacer
+from shared import metrics
+
+PERIOD_S = 0.02
+
+class TestFramePacer(unittest.TestCase):
+    def setUp(self):
+        metrics.reset()
+
+    def test_deadlines_are_absolute(self):
+        pacer = FramePacer(1 / PERIOD_S)
+        start = time.perf_counter()
+        for _ in range(11):
+            pacer.wait()
+            time.sleep(PERIOD_S / 4)  # Work inside the period does not stretch it
+        elapsed = time.perf_counter() - start
+        # 10 periods after the first deadline (plus the last frame's work), not 10 * 1.25 periods
+        self.assertGreater(elapsed, 10 * PERIOD_S)
+        self.assertLess(elapsed, 11.5 * PERIOD_S)
+        self.assertEqual(pacer.missed_deadlines, 0)
+
+    def test_missed_deadlines_are_skipped_not_caught_up(self):
+        pacer = FramePacer(1 / PERIOD_S)
+        pacer.wait()
+        time.sleep(3.5 * PERIOD_S)  # A slow frame overruns into the 4th slot
+        self.assertEqual(pacer.wait(), 2)
+        self.assertEqual(metrics.counter("client.pacer_missed_deadlines").value, 2)
+        # The next frame waits for its slot instead of following immediately
+        start = time.perf_counter()
+        pacer.wait()
+        self.assertGreater(time.perf_counter() - start, PERIOD_S / 4)
+
+    def test_unpaced_mode_only_measures(self):
+        pacer = FramePacer(None, nominal_fps=1 / PERIOD_S)
+        start = time.perf_counter()
+        for _ in range(5):
+            pacer.wait()
+            pacer.tick()
+            time.sleep(PERIOD_S / 2)
+        self.assertLess(time.perf_counter() - start, 5 * PERIOD_S)
+
+        period = metrics.histogram("client.frame_period_ms").snapshot()
+        jitter = metrics.histogram("client.frame_jitter_ms").snapshot()
+        self.assertEqual(period["count"], 4)
+        self.assertGreaterEqual(period["min"], PERIOD_S / 2 * 1000)
+        # Each period is about half the nominal one short
+        self.assertGreater(jitter["min"], PERIOD_S / 4 * 1000)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from client.capture.hand_roi import HandRoiTracker
+from shared import metrics
+
+WIDTH, HEIGHT = 640, 480
+
+def hand(points):
+    """MediaPipe-like hand with landmarks at normalized (x, y) points."""
+    return SimpleNamespace(landmark=[SimpleNamespace(x=x, y=y, z=0.0) for x, y in points])
+
+class TestHandRoiTracker(unittest.TestCase):
+    def setUp(self):
+        metrics.reset()
+        self.tracker = HandRoiTracker(margin=0.5, min_size=0.25, full_frame_interval=30)
+
+    def test_full_frame_until_a_hand_is_found(self):
+        self.assertIsNone(self.tracker.region(WIDTH, HEIGHT))
+        self.tracker.update(None, cropped=False)
+        self.assertIsNone(self.tracker.region(WIDTH, HEIGHT))
+
+    def test_square_crop_around_hand_with_margin(self):
+        # 64 x 48 px box centred at (320, 240)
+        self.tracker.update([hand([(0.45, 0.45), (0.55, 0.55)])], cropped=False)
+        x0, y0, x1, y1 = self.tracker.region(WIDTH, HEIGHT)
+        self.assertEqual(x1 - x0, y1 - y0)
+        self.assertEqual(x1 - x0, 128)  # 64 px * (1 + 2 * 0.5)
+        self.assertEqual(((x0 + x1) / 2, (y0 + y1) / 2), (320, 240))
+
+    def test_small_hand_gets_minimum_crop_and_crop_stays_in_frame(self):
+        self.tracker.update([hand([(0.99, 0.99), (1.0, 1.0)])], cropped=False)
+        x0, y0, x1, y1 = self.tracker.region(WIDTH, HEIGHT)
+        self.assertEqual(x1 - x0, 120)  # 0.25 * 480
+        self.assertEqual((x1, y1), (WIDTH, HEIGHT))
+
+    def test_lost_hand_falls_back_to_full_frame(self):
+        self.tracker.update([hand([(0.4, 0.4), (0.5, 0.5)]), hand([(0.6, 0.6), (0.7, 0.7)])], cropped=False)
+        self.assertEqual(self.tracker.num_hands, 2)
+        self.assertIsNotNone(self.tracker.region(WIDTH, HEIGHT))
+        self.tracker.update(None, cropped=True)
+        self.assertEqual(self.tracker.num_hands, 0)
+        self.assertIsNone(self.tracker.region(WIDTH, HEIGHT))
+        self.assertEqual(metrics.counter("client.hand_roi_lost").value, 1)
+
+    def test_periodic_full_frame_search(self):
+        tracker = HandRoiTracker(full_frame_interval=3)
+        tracker.update([hand([(0.4, 0.4), (0.5, 0.5)])], cropped=False)
+        regions = [tracker.region(WIDTH, HEIGHT) for _ in range(6)]
+        self.assertEqual([region is None for region in regions], [False, False, True, False, False, True])
+
+    def test_crop_landmarks_map_back_to_frame(self):
+        region = (100, 50, 300, 250)  # 200 x 200 px crop
+        hands = [hand([(0.0, 0.0), (0.5, 0.5), (1.0, 1.0)])]
+        hands[0].landmark[1].z = -0.1
+        HandRoiTracker.to_frame(hands, region, WIDTH, HEIGHT)
+        pixels = [(lm.x * WIDTH, lm.y * HEIGHT) for lm in hands[0].landmark]
+        for actual, expected in zip(pixels, [(100, 50), (200, 150), (300, 250)]):
+            self.assertAlmostEqual(actual[0], expected[0])
+            self.assertAlmostEqual(actual[1], expected[1])
+        self.assertAlmostEqual(hands[0].landmark[1].z, -0.1 * 200 / WIDTH)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import os
+import sys
+import json
+import asyncio
+import tempfile
+import unittest
+import numpy as np
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from server.modules.model_loader import ModelRegistry, get_session_model
+from server.modules.model_reloader import ModelReloader
+from shared.config import BUFFER_SIZE, NUM_FEATURES
+
+UNITS, CLASSES = 8, 3
+
+def save_weights(path, time_steps=BUFFER_SIZE):
+    rng = np.random.default_rng(0)
+    np.savez(path,
+             gru_kernel=rng.normal(size=(NUM_FEATURES, 3 * UNITS)),
+             gru_recurrent_kernel=rng.normal(size=(UNITS, 3 * UNITS)),
+             gru_bias=rng.normal(size=(2, 3 * UNITS)),
+             dense_kernel=rng.normal(size=(UNITS, 4)),
+             dense_bias=rng.normal(size=4),
+             output_kernel=rng.normal(size=(4, CLASSES)),
+             output_bias=rng.normal(size=CLASSES),
+             time_steps=np.int32(time_steps))
+
+class TestModelReloader(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.labels = os.path.join(self.tmp.name, 'labels.json')
+        with open(self.labels, 'w') as f:
+            json.dump({str(i): f"gesture_{i}" for i in range(CLASSES)}, f)
+        self.good = os.path.join(self.tmp.name, 'good.npz')
+        self.bad = os.path.join(self.tmp.name, 'bad.npz')
+        save_weights(self.good)
+        save_weights(self.bad, time_steps=BUFFER_SIZE // 2)
+        self.reloader = ModelReloader(streaming=False, backend="numpy")
+
+    def tearDown(self):
+        ModelRegistry.clear()
+        self.tmp.cleanup()
+
+    def test_swap_then_reject(self):
+        result = asyncio.run(self.reloader.reload(self.good, self.labels))
+        self.assertEqual(result["status"], "swapped")
+        swapped = get_session_model(streaming=False, backend="numpy")
+        self.assertEqual(swapped.model_path, self.good)
+
+        # A model that does not match BUFFER_SIZE is rejected and the current one stays
+        result = asyncio.run(self.reloader.reload(self.bad))
+        self.assertEqual(result["status"], "rejected")
+        self.assertIs(get_session_model(streaming=False, backend="numpy"), swapped)
+
+if __name__ == '__main__':
+    unittest.main()
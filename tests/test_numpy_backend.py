@@ -0,0 +1,79 @@
+import os
+import sys
+import tempfile
+import unittest
+import numpy as np
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from server.modules.numpy_backend import NumpyGRUNetwork, _sigmoid
+
+FEATURES, UNITS, DENSE, CLASSES, TIME_STEPS = 6, 4, 5, 3, 7
+
+def random_weights(rng):
+    return {
+        'gru_kernel': rng.normal(size=(FEATURES, 3 * UNITS)),
+        'gru_recurrent_kernel': rng.normal(size=(UNITS, 3 * UNITS)),
+        'gru_bias': rng.normal(size=(2, 3 * UNITS)),
+        'dense_kernel': rng.normal(size=(UNITS, DENSE)),
+        'dense_bias': rng.normal(size=DENSE),
+        'output_kernel': rng.normal(size=(DENSE, CLASSES)),
+        'output_bias': rng.normal(size=CLASSES),
+        'time_steps': np.int32(TIME_STEPS),
+    }
+
+def reference_forward(w, window):
+    """Keras GRU (reset_after=True) -> Dense(relu) -> Dense(softmax), one frame at a time."""
+    sigmoid = lambda x: 1.0 / (1.0 + np.exp(-x))
+    W, U, b = w['gru_kernel'], w['gru_recurrent_kernel'], w['gru_bias']
+    Wz, Wr, Wh = np.split(W, 3, axis=1)
+    Uz, Ur, Uh = np.split(U, 3, axis=1)
+    bz, br, bh = np.split(b[0], 3)
+    rz, rr, rh = np.split(b[1], 3)
+    h = np.zeros(UNITS)
+    for x in window:
+        z = sigmoid(x @ Wz + bz + h @ Uz + rz)
+        r = sigmoid(x @ Wr + br + h @ Ur + rr)
+        hh = np.tanh(x @ Wh + bh + r * (h @ Uh + rh))
+        h = z * h + (1 - z) * hh
+    hidden = np.maximum(h @ w['dense_kernel'] + w['dense_bias'], 0)
+    logits = hidden @ w['output_kernel'] + w['output_bias']
+    exp = np.exp(logits - logits.max())
+    return exp / exp.sum()
+
+class TestNumpyGRUNetwork(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.weights = random_weights(rng)
+        self.network = NumpyGRUNetwork(self.weights)
+        self.windows = rng.normal(size=(5, TIME_STEPS, FEATURES)).astype(np.float32)
+
+    def test_matches_reference(self):
+        probabilities = self.network.forward(self.windows)
+        self.assertEqual(probabilities.shape, (5, CLASSES))
+        for window, row in zip(self.windows, probabilities):
+            np.testing.assert_allclose(row, reference_forward(self.weights, window), atol=1e-5)
+
+    def test_step_matches_forward(self):
+        state = np.zeros((len(self.windows), UNITS), dtype=np.float32)
+        for t in range(TIME_STEPS):
+            probabilities, state = self.network.step(self.windows[:, t], state)
+        np.testing.assert_allclose(probabilities, self.network.forward(self.windows), atol=1e-6)
+
+    def test_load_npz(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'weights.npz')
+            np.savez(path, **self.weights)
+            network = NumpyGRUNetwork.load(path)
+        self.assertEqual((network.units, network.num_classes, network.time_steps), (UNITS, CLASSES, TIME_STEPS))
+        np.testing.assert_allclose(network.forward(self.windows), self.network.forward(self.windows))
+
+    def test_sigmoid_is_stable_for_large_inputs(self):
+        x = np.array([-1000.0, -100.0, 0.0, 100.0, 1000.0], dtype=np.float32)
+        with np.errstate(all='raise'):
+            values = _sigmoid(x)
+        np.testing.assert_allclose(values, [0.0, 0.0, 0.5, 1.0, 1.0], atol=1e-6)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import os
+import sys
+import time
+import unittest
+from types import SimpleNamespace
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from client.capture.frame_grabber import FrameGrabber
+from client.capture.pipeline import LandmarkPipeline
+from shared import metrics
+
+GRAPH_S = 0.02  # Time each fake MediaPipe graph takes per frame
+CAMERA_PERIOD_S = 0.01
+
+class PacedCapture:
+    """Camera stand-in delivering frame numbers every CAMERA_PERIOD_S."""
+    def __init__(self, num_frames):
+        self.num_frames = num_frames
+        self.next_frame = 0
+
+    def read(self):
+        time.sleep(CAMERA_PERIOD_S)
+        if self.next_frame >= self.num_frames:
+            return False, None
+        self.next_frame += 1
+        return True, self.next_frame - 1
+
+class FakeExtractor:
+    """Hand / pose "graphs" that echo the frame they were given."""
+    def to_rgb(self, frame):
+        return frame
+
+    def process_hands(self, rgb):
+        time.sleep(GRAPH_S)
+        return SimpleNamespace(multi_hand_landmarks=[rgb])
+
+    def process_pose(self, rgb):
+        time.sleep(GRAPH_S)
+        return SimpleNamespace(pose_landmarks=rgb)
+
+    @staticmethod
+    def combine(hand_results, pose_results):
+        return SimpleNamespace(multi_hand_landmarks=hand_results.multi_hand_landmarks,
+                               pose_landmarks=pose_results.pose_landmarks)
+
+class TestLandmarkPipeline(unittest.TestCase):
+    def setUp(self):
+        metrics.reset()
+
+    def test_results_are_joined_by_frame_and_stay_in_order(self):
+        pipeline = LandmarkPipeline(FrameGrabber(PacedCapture(40)), FakeExtractor(), flip=lambda frame: frame,
+                                    serialize=lambda results: f"payload-{results.pose_landmarks}").start()
+        start = time.perf_counter()
+        results = []
+        while True:
+            result = pipeline.next_result()
+            if result is None:
+                break
+            results.append(result)
+        elapsed = time.perf_counter() - start
+
+        ids = [result.grabbed.frame_id for result in results]
+        self.assertEqual(ids, sorted(set(ids)))
+        for result in results:
+            self.assertEqual(result.results.multi_hand_landmarks, [result.grabbed.frame])
+            self.assertEqual(result.results.pose_landmarks, result.grabbed.frame)
+            self.assertEqual(result.payload, f"payload-{result.grabbed.frame}")
+        # Hands and pose overlap: well above the 1 / (2 * GRAPH_S) frames/sec of running them serially
+        self.assertGreater(len(results) / elapsed, 1.3 / (2 * GRAPH_S))
+        self.assertGreater(metrics.gauge("pipeline.hands.utilization").value, 0.5)
+        self.assertGreater(metrics.gauge("pipeline.pose.utilization").value, 0.5)
+
+if __name__ == '__main__':
+    unittest.main()
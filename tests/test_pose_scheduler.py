@@ -0,0 +1,45 @@
+import os
+import sys
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from client.capture.pose_scheduler import PoseScheduler
+
+class TestPoseScheduler(unittest.TestCase):
+    def run_frames(self, scheduler, hands, have_pose=True):
+        decisions = []
+        for hand in hands:
+            scheduler.observe_hand(hand)
+            decisions.append(scheduler.should_run(have_pose))
+        return decisions
+
+    def test_still_hand_runs_pose_every_n_frames(self):
+        scheduler = PoseScheduler(every_n=4, motion_threshold=0.05)
+        decisions = self.run_frames(scheduler, [(0.5, 0.5)] * 9)
+        self.assertEqual(decisions, [True, False, False, False, True, False, False, False, True])
+        self.assertAlmostEqual(scheduler.run_fraction, 3 / 9)
+
+    def test_hand_movement_forces_a_pose_update(self):
+        scheduler = PoseScheduler(every_n=100, motion_threshold=0.05)
+        # Small drift stays within the threshold of the position at the last pose run
+        decisions = self.run_frames(scheduler, [(0.5, 0.5), (0.52, 0.5), (0.54, 0.5), (0.56, 0.5), (0.57, 0.5)])
+        self.assertEqual(decisions, [True, False, False, True, False])
+
+    def test_hand_appearing_forces_a_pose_update(self):
+        scheduler = PoseScheduler(every_n=3, motion_threshold=0.05)
+        decisions = self.run_frames(scheduler, [None, None, None, None, (0.5, 0.5), (0.5, 0.5)])
+        # The interval run on frame 2 had no hand, so the hand showing up triggers a run
+        self.assertEqual(decisions, [False, False, True, False, True, False])
+
+    def test_runs_every_frame_until_a_pose_is_held(self):
+        scheduler = PoseScheduler(every_n=5, motion_threshold=0.05)
+        self.assertEqual(self.run_frames(scheduler, [(0.5, 0.5)] * 3, have_pose=False), [True, True, True])
+
+    def test_every_frame_when_n_is_one(self):
+        scheduler = PoseScheduler(every_n=1, motion_threshold=1.0)
+        self.assertTrue(all(self.run_frames(scheduler, [(0.5, 0.5)] * 5)))
+
+if __name__ == '__main__':
+    unittest.main()
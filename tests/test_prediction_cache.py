@@ -0,0 +1,123 @@
+import asyncio
+import os
+import sys
+import unittest
+import numpy as np
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from server.modules.gestures import GestureProcessor
+from server.modules.prediction_cache import PredictionCache
+from shared import metrics
+from shared.config import BUFFER_SIZE, NUM_FEATURES, PINCH_THRESHOLD_3D
+
+# Share of frames whose emitted gesture may differ once the cache is enabled
+REPLAY_TOLERANCE = 0.02
+
+class StubModel:
+    """Deterministic stand-in for GestureModel: softmax of a fixed projection of the window mean."""
+    labels = ["next_track", "play_pause", "NO_ACTION"]
+    is_loaded = True
+
+    def __init__(self):
+        self.weights = np.random.default_rng(1).normal(size=(NUM_FEATURES, len(self.labels))) * 4
+        self.calls = 0
+
+    def predict(self, window):
+        self.calls += 1
+        logits = np.asarray(window).mean(axis=0) @ self.weights
+        probabilities = np.exp(logits - logits.max())
+        probabilities /= probabilities.sum()
+        idx = int(np.argmax(probabilities))
+        return self.labels[idx], float(probabilities[idx])
+
+def random_hand(rng):
+    """A hand pose whose thumb and index tips are far enough apart not to count as a pinch."""
+    while True:
+        hand = rng.uniform(0.2, 0.8, size=63)
+        if np.linalg.norm(hand[4 * 3:4 * 3 + 3] - hand[8 * 3:8 * 3 + 3]) > 3 * PINCH_THRESHOLD_3D:
+            return hand
+
+def replay_frames(rng, segments=12, frames_per_segment=40):
+    """Alternate held-still poses (tiny jitter) with movements to the next pose."""
+    pose = rng.uniform(0.2, 0.8, size=99)
+    hand = random_hand(rng)
+    frames = []
+    for segment in range(segments):
+        if segment % 2 == 0:
+            for _ in range(frames_per_segment):
+                frames.append(hand + rng.normal(scale=0.0005, size=63))
+        else:
+            target = random_hand(rng)
+            for t in np.linspace(0.0, 1.0, frames_per_segment):
+                frames.append((1 - t) * hand + t * target)
+            hand = target
+    return [{'hands': list(frame), 'pose': list(pose)} for frame in frames]
+
+def emitted_gestures(processor, frames):
+    gestures = []
+    for frame in frames:
+        processor.last_action_time = 0  # Compare every decision, not just those outside the cooldown
+        gestures.append(processor.process_landmarks(frame))
+    return gestures
+
+class TestPredictionCache(unittest.TestCase):
+    def test_lru_eviction(self):
+        cache = PredictionCache(max_entries=2, quantum=0.1)
+        windows = [np.full((BUFFER_SIZE, NUM_FEATURES), value, dtype=np.float32) for value in (0.0, 1.0, 2.0)]
+        for i, window in enumerate(windows):
+            self.assertIsNone(cache.lookup(window))
+            cache.store((f"g{i}", 0.9), 1.0)
+        # The oldest entry was evicted; a slightly jittered window (same buckets) hits
+        self.assertIsNone(cache.lookup(windows[0]))
+        jitter = np.random.default_rng(0).normal(scale=0.0005, size=windows[2].shape)
+        self.assertEqual(cache.lookup(windows[2] + jitter), ("g2", 0.9))
+
+    def test_replay_matches_uncached(self):
+        frames = replay_frames(np.random.default_rng(0))
+        uncached_model, cached_model = StubModel(), StubModel()
+        uncached = emitted_gestures(GestureProcessor(model=uncached_model, streaming=False, prediction_cache=False), frames)
+        cached = emitted_gestures(GestureProcessor(model=cached_model, streaming=False, prediction_cache=True), frames)
+
+        mismatches = sum(a != b for a, b in zip(uncached, cached))
+        self.assertLessEqual(mismatches, REPLAY_TOLERANCE * len(frames))
+        # Held-still segments are served from the cache
+        self.assertLess(cached_model.calls, uncached_model.calls)
+
+    def test_async_saved_time_excludes_batching_delay(self):
+        metrics.reset()
+        model = StubModel()
+        processor = GestureProcessor(model=model, streaming=False, prediction_cache=True)
+
+        async def delayed_predict(window):
+            await asyncio.sleep(0.01)  # Stands in for waiting on a micro-batch
+            return model.predict(window)
+
+        async def replay():
+            for frame in replay_frames(np.random.default_rng(0), segments=2):
+                processor.last_action_time = 0
+                await processor.process_landmarks_async(frame, delayed_predict, inference_ms=lambda: 0.5)
+
+        asyncio.run(replay())
+        hits = metrics.counter("cache.hits").value
+        self.assertGreater(hits, 0)
+        # Each hit saves the model's 0.5 ms, not the 10 ms the caller waited
+        self.assertAlmostEqual(metrics.counter("cache.saved_ms").value, 0.5 * hits)
+
+    def test_async_model_error_falls_back_and_is_not_cached(self):
+        metrics.reset()
+        processor = GestureProcessor(model=StubModel(), streaming=False, prediction_cache=True)
+
+        async def failing_predict(window):
+            raise RuntimeError("invoke failed")
+
+        async def replay():
+            for frame in replay_frames(np.random.default_rng(0), segments=1):
+                await processor.process_landmarks_async(frame, failing_predict)
+
+        asyncio.run(replay())
+        self.assertEqual(metrics.counter("cache.hits").value, 0)
+
+if __name__ == '__main__':
+    unittest.main()
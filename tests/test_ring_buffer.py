@@ -0,0 +1,42 @@
+import os
+import sys
+import unittest
+import numpy as np
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from server.modules.ring_buffer import FrameRingBuffer
+
+class TestFrameRingBuffer(unittest.TestCase):
+    def setUp(self):
+        self.buffer = FrameRingBuffer(maxlen=4, width=3)
+
+    def test_partial_window(self):
+        self.buffer.append([1.0, 1.0, 1.0])
+        self.buffer.append([2.0, 2.0, 2.0])
+
+        self.assertEqual(len(self.buffer), 2)
+        self.assertEqual(self.buffer.window().shape, (2, 3))
+        self.assertEqual(self.buffer[0][0], 1.0)
+        self.assertEqual(self.buffer[-1][0], 2.0)
+
+    def test_wraparound_keeps_order(self):
+        for value in range(1, 8):
+            self.buffer.append([float(value)] * 3)
+
+        # Only the last 4 frames remain, oldest first
+        self.assertEqual(len(self.buffer), 4)
+        np.testing.assert_array_equal(self.buffer.window()[:, 0], [4.0, 5.0, 6.0, 7.0])
+
+    def test_window_is_contiguous_view(self):
+        for value in range(6):
+            self.buffer.append(np.full(3, value, dtype=np.float32))
+
+        window = self.buffer.window()
+        self.assertTrue(window.flags['C_CONTIGUOUS'])
+        self.assertEqual(window.dtype, np.float32)
+        self.assertTrue(np.shares_memory(window, self.buffer.window()))
+
+if __name__ == '__main__':
+    unittest.main()
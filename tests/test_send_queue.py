@@ -0,0 +1,113 @@
+import os
+import sys
+import time
+import asyncio
+import unittest
+import numpy as np
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from client.send_queue import RawFrame, SendQueue, SEND_POLICIES
+from shared.delta_codec import DeltaEncoder, DeltaDecoder
+
+FRAME_PERIOD_S = 0.005  # Capture side: 200 frames/sec
+LINK_SEND_S = 0.02  # Throttled link: 50 messages/sec
+DURATION_S = 0.8
+
+async def throttled_link(queue: SendQueue):
+    """Produce faster than a slow sender can drain; returns (frame index, queue age ms) of sent frames."""
+    sent = []
+
+    async def sender():
+        while True:
+            frame, enqueued_at, _ = await queue.get()
+            sent.append((frame, (time.perf_counter() - enqueued_at) * 1000))
+            await asyncio.sleep(LINK_SEND_S)
+            queue.task_done()
+
+    task = asyncio.create_task(sender())
+    for frame in range(int(DURATION_S / FRAME_PERIOD_S)):
+        queue.put_nowait(frame)
+        await asyncio.sleep(FRAME_PERIOD_S)
+    task.cancel()
+    return sent
+
+async def throttled_delta_link(queue: SendQueue, encoder: DeltaEncoder):
+    """Queue raw frames on a throttled link, delta-coding them as they are sent; returns (produced, messages)."""
+    messages = []
+
+    async def sender():
+        while True:
+            frame = (await queue.get()).payload
+            messages.append(encoder.encode(frame.hands, frame.pose, frame.timestamp))
+            await asyncio.sleep(LINK_SEND_S)
+            queue.task_done()
+
+    rng = np.random.default_rng(0)
+    hands = rng.uniform(0.2, 0.8, size=63).astype(np.float32)
+    pose = rng.uniform(0.2, 0.8, size=99).astype(np.float32)
+    task = asyncio.create_task(sender())
+    produced = int(DURATION_S / FRAME_PERIOD_S)
+    for _ in range(produced):
+        hands = hands + rng.normal(scale=0.002, size=63).astype(np.float32)
+        pose = pose + rng.normal(scale=0.001, size=99).astype(np.float32)
+        queue.put_nowait(RawFrame(hands, pose, time.time()))
+        await asyncio.sleep(FRAME_PERIOD_S)
+    task.cancel()
+    return produced, messages
+
+class TestSendQueue(unittest.TestCase):
+    def test_policies_choose_which_frame_to_drop(self):
+        async def fill(policy):
+            queue = SendQueue(maxsize=2, policy=policy)
+            accepted = [queue.put_nowait(frame) for frame in range(4)]
+            return accepted, [queue.get_nowait()[0] for _ in range(queue.qsize())]
+
+        self.assertEqual(asyncio.run(fill("drop_newest")), ([True, True, False, False], [0, 1]))
+        self.assertEqual(asyncio.run(fill("drop_oldest")), ([True, True, False, False], [2, 3]))
+        self.assertEqual(asyncio.run(fill("latest")), ([True, False, False, False], [3]))
+        with self.assertRaises(ValueError):
+            SendQueue(policy="random")
+
+    def test_join_waits_for_sent_or_dropped_frames(self):
+        async def run():
+            queue = SendQueue(maxsize=2, policy="drop_oldest")
+            for frame in range(3):
+                queue.put_nowait(frame)
+            queue.get_nowait()
+            queue.task_done()
+            queue.get_nowait()
+            queue.task_done()
+            await asyncio.wait_for(queue.join(), 1.0)
+
+        asyncio.run(run())
+
+    def test_sent_frames_stay_fresh_on_a_throttled_link(self):
+        fifo = asyncio.run(throttled_link(SendQueue(maxsize=30, policy="drop_newest")))
+        window = asyncio.run(throttled_link(SendQueue(maxsize=3, policy="drop_oldest")))
+        latest = asyncio.run(throttled_link(SendQueue(policy="latest")))
+
+        def late_max_age(sent):
+            return max(age for _, age in sent[len(sent) // 2:])
+
+        # The FIFO backlog fills up with stale frames; the other policies stay within their window
+        self.assertGreater(late_max_age(fifo), 10 * LINK_SEND_S * 1000)
+        self.assertLess(late_max_age(window), (3 + 2) * LINK_SEND_S * 1000)
+        self.assertLess(late_max_age(latest), 2 * LINK_SEND_S * 1000)
+        # ...and keep sending recent frames
+        self.assertGreater(latest[-1][0], fifo[-1][0])
+
+    def test_dropped_raw_frames_do_not_force_keyframes(self):
+        for policy in SEND_POLICIES:
+            with self.subTest(policy=policy):
+                encoder, decoder = DeltaEncoder("c", keyframe_interval=10), DeltaDecoder()
+                queue = SendQueue(maxsize=3, policy=policy)
+                produced, messages = asyncio.run(throttled_delta_link(queue, encoder))
+                self.assertLess(len(messages), produced / 2)  # Most frames were dropped...
+                # ...but the sent ones form an unbroken chain with only the periodic keyframes
+                self.assertTrue(all(decoder.decode(message) is not None for message in messages))
+                self.assertEqual(encoder.keyframes, -(-len(messages) // 11))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import os
+import sys
+import time
+import threading
+import unittest
+import numpy as np
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from server.modules.shadow import ShadowEvaluator
+from shared.config import BUFFER_SIZE, NUM_FEATURES
+
+class StubCandidate:
+    """Predicts "b" for windows whose first value is negative, "a" otherwise."""
+    model_path = "stub"
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.release.set()
+
+    def predict(self, window):
+        self.release.wait()
+        return ("b" if window[0, 0] < 0 else "a"), 0.9
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        time.sleep(0.01)
+
+class TestShadowEvaluator(unittest.TestCase):
+    def setUp(self):
+        self.window = np.zeros((BUFFER_SIZE, NUM_FEATURES), dtype=np.float32)
+
+    def test_agreement_and_per_class_disagreement(self):
+        shadow = ShadowEvaluator(StubCandidate(), sample_rate=1.0, queue_size=8)
+        shadow.offer(self.window, "a", 0.8)
+        shadow.offer(self.window - 1, "a", 0.8)
+        wait_for(lambda: shadow.stats()["compared"] == 2)
+
+        stats = shadow.stats()
+        self.assertEqual(stats["agreement"], 0.5)
+        self.assertAlmostEqual(stats["mean_confidence_delta"], 0.1)
+        self.assertEqual(stats["per_class"]["a"]["disagreements"], 1)
+        self.assertEqual(stats["per_class"]["a"]["candidate"], {"b": 1})
+
+    def test_full_queue_drops_instead_of_blocking(self):
+        candidate = StubCandidate()
+        candidate.release.clear()
+        shadow = ShadowEvaluator(candidate, sample_rate=1.0, queue_size=2)
+
+        start = time.perf_counter()
+        for _ in range(10):
+            shadow.offer(self.window, "a", 0.8)
+        self.assertLess(time.perf_counter() - start, 0.5)
+        # One window is held by the worker, two are queued, the rest were dropped
+        self.assertGreaterEqual(shadow.stats()["dropped"], 7)
+        candidate.release.set()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+import os
+import sys
+import json
+import asyncio
+import unittest
+import numpy as np
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from server.modules.gestures import GestureProcessor
+from server.ws_server import iter_payloads
+from shared.schemas import (
+    PROTOCOL_VERSION, BINARY_PROTOCOL_VERSION, MAX_MESSAGE_BYTES, pack_landmarks, parse_message,
+    pack_batch, unpack_batch
+)
+
+def json_frame(hands, pose):
+    return json.dumps({"version": PROTOCOL_VERSION, "timestamp": 0.0, "client_id": "c",
+                       "hands": [float(v) for v in hands], "pose": [float(v) for v in pose]})
+
+class TestBinaryProtocol(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.hands = rng.uniform(0.2, 0.8, size=63).astype(np.float32)
+        self.pose = rng.uniform(0.2, 0.8, size=99).astype(np.float32)
+
+    def test_round_trip(self):
+        data = parse_message(pack_landmarks(self.hands, self.pose, client_id="cam-1", timestamp=12.5))
+        self.assertEqual(data["version"], BINARY_PROTOCOL_VERSION)
+        self.assertEqual(data["client_id"], "cam-1")
+        self.assertEqual(data["timestamp"], 12.5)
+        np.testing.assert_array_equal(data["hands"], self.hands)
+        np.testing.assert_array_equal(data["pose"], self.pose)
+
+        half = parse_message(pack_landmarks(self.hands, None, half=True))
+        self.assertNotIn("pose", half)
+        self.assertEqual(half["hands"].dtype, np.float32)
+        np.testing.assert_allclose(half["hands"], self.hands, atol=1e-3)
+
+    def test_malformed_frames_are_rejected(self):
+        frame = pack_landmarks(self.hands, self.pose)
+        for bad in (frame[:5], frame[:-1], frame + b"\0", bytes([9]) + frame[1:]):
+            with self.assertRaises(ValueError):
+                parse_message(bad)
+
+    def test_non_finite_values_are_rejected(self):
+        hands = self.hands.copy()
+        for value in (np.nan, np.inf):
+            hands[5] = value
+            for half in (False, True):
+                with self.assertRaises(ValueError):
+                    parse_message(pack_landmarks(hands, self.pose, half=half))
+
+    def test_processor_gives_same_result_for_both_versions(self):
+        v1, v2 = GestureProcessor(), GestureProcessor()
+        for _ in range(5):
+            v1.process_landmarks(parse_message(json_frame(self.hands, self.pose)))
+            v2.process_landmarks(parse_message(pack_landmarks(self.hands, self.pose)))
+        np.testing.assert_allclose(v1.landmark_buffer.window(), v2.landmark_buffer.window(), atol=1e-6)
+
+class TestJsonValidation(unittest.TestCase):
+    def test_landmarks_become_float32_arrays(self):
+        data = parse_message(json_frame(np.linspace(0, 1, 63), np.linspace(0, 1, 99)))
+        self.assertEqual(data["hands"].dtype, np.float32)
+        self.assertEqual(data["pose"].shape, (99,))
+        # Integers are JSON numbers too
+        ints = parse_message(json.dumps({"version": PROTOCOL_VERSION, "hands": [1] * 63}))
+        np.testing.assert_array_equal(ints["hands"], np.ones(63, dtype=np.float32))
+        # Control messages carry no landmarks and pass through unchanged
+        self.assertEqual(parse_message(json.dumps({"version": PROTOCOL_VERSION, "type": "stats"}))["type"], "stats")
+
+    def test_malformed_messages_are_rejected(self):
+        bad = [
+            json.dumps({"version": "0.9", "hands": [0.0] * 63}),
+            json.dumps({"version": PROTOCOL_VERSION, "hands": [0.0] * 62}),
+            json.dumps({"version": PROTOCOL_VERSION, "pose": ["x"] * 99}),
+            json.dumps({"version": PROTOCOL_VERSION, "hands": [[0.0]] * 63}),
+            json.dumps([PROTOCOL_VERSION]),
+            json.dumps({"version": PROTOCOL_VERSION, "hands": [0.0] * 62 + [float("nan")]}),
+            json.dumps({"version": PROTOCOL_VERSION, "pose": [float("inf")] + [0.0] * 98}),
+            json.dumps({"version": PROTOCOL_VERSION, "hands": [0.0] * 62 + [1e39]}),  # Overflows float32
+            # Numbers only: no numeric strings and no booleans
+            json.dumps({"version": PROTOCOL_VERSION, "hands": ["0.5"] + [0.0] * 62}),
+            json.dumps({"version": PROTOCOL_VERSION, "hands": [0.0] * 63, "pose": [True] + [0.0] * 98}),
+            json.dumps({"version": PROTOCOL_VERSION, "hands": [False] * 63}),
+            json.dumps({"version": PROTOCOL_VERSION, "hands": [None] * 63}),
+            "{" + " " * MAX_MESSAGE_BYTES + "}",
+            # Under the limit in characters, over it in UTF-8 bytes
+            json.dumps({"version": PROTOCOL_VERSION, "client_id": "\u00e9" * (MAX_MESSAGE_BYTES // 2)},
+                       ensure_ascii=False),
+        ]
+        for message in bad:
+            with self.assertRaises(ValueError):
+                parse_message(message)
+
+    def test_json_in_binary_frames_is_accepted(self):
+        # Version 1 clients may send their JSON text as a binary websocket frame
+        text = json_frame(np.linspace(0, 1, 63), np.linspace(0, 1, 99))
+        expected = parse_message(text)
+        for message in (text.encode("utf-8"), bytearray(b"\n" + text.encode("utf-8")),
+                        memoryview(text.encode("utf-8"))):
+            data = parse_message(message)
+            self.assertEqual(data["version"], PROTOCOL_VERSION)
+            np.testing.assert_array_equal(data["hands"], expected["hands"])
+            np.testing.assert_array_equal(data["pose"], expected["pose"])
+        with self.assertRaises(ValueError):
+            parse_message(b"{" + b"\xff" * 10)
+
+class FakeConnection:
+    """Async-iterable stand-in for a server-side websocket connection."""
+    def __init__(self, messages):
+        self.messages = messages
+
+    async def __aiter__(self):
+        for message in self.messages:
+            yield message
+
+class TestClientBatches(unittest.TestCase):
+    def test_batches_are_expanded_in_order(self):
+        frames = [pack_landmarks(np.full(63, i), None, timestamp=float(i)) for i in range(5)]
+        text = json_frame(np.zeros(63), np.zeros(99))
+        connection = FakeConnection([frames[0], pack_batch([frames[1], text, frames[2]]), pack_batch(frames[3:])])
+
+        async def collect():
+            return [parse_message(message) async for message in iter_payloads(connection)]
+
+        received = asyncio.run(collect())
+        self.assertEqual([data["version"] for data in received], [2, 2, PROTOCOL_VERSION, 2, 2, 2])
+        self.assertEqual([data["timestamp"] for data in received if data["version"] == 2], [0, 1, 2, 3, 4])
+
+    def test_malformed_batches_are_rejected(self):
+        batch = pack_batch([json_frame(np.zeros(63), np.zeros(99)), pack_landmarks(np.zeros(63), None)])
+        for bad in (batch[:-1], batch + b"\0", batch[:1]):
+            with self.assertRaises(ValueError):
+                unpack_batch(bad)
+        with self.assertRaises(ValueError):
+            pack_batch([])
+
+if __name__ == '__main__':
+    unittest.main()